@@ -103,9 +103,37 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # keep connections between RPCs, checked before reuse
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/ref/settings/#caches
+# shared by every process (nonces, revocations, ...), run `createcachetable`
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+    }
+}
+
+# Password hashers
+# https://docs.djangoproject.com/en/4.2/topics/auth/passwords/
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+    # short-lived otp pins / codes, see `evercore.hashers`
+    "evercore.hashers.EphemeralSecretHasher",
+]
+
+
 # Auth backend
 # https://docs.djangoproject.com/en/4.2/ref/settings/#std-setting-AUTHENTICATION_BACKENDS
 
@@ -288,7 +316,7 @@ CELERY_RESULT_COMPRESSION = 'gzip'
 CELERY_RESULT_ACCEPT_CONTENT = ['application/x-msgpack']
 CELERY_TASK_SERIALIZER = 'msgpack'
 CELERY_TASK_COMPRESSION = 'gzip'
-CELERY_ACCEPT_CONTENT = ['application/x-msgpack']
+CELERY_ACCEPT_CONTENT = ['application/x-msgpack', 'application/x-protobuf']
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
 
@@ -330,7 +358,8 @@ EVERCORE_JWT_AUTH_SETTINGS = {
 
 GRPCSERVER = {
     'servicers': ['config.handlers.grpc_handlers'],
-    'interceptors': ['evercore_grpc.interceptors.UnimplementedInterceptor']
+    'interceptors': ['evercore_grpc.interceptors.UnimplementedInterceptor'],
+    'async_interceptors': ['evercore_grpc.interceptors.AsyncUnimplementedInterceptor'],
 }
 
 IDVALID_INTEGRATION_SETTINGS = {
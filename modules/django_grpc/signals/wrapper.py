@@ -1,4 +1,5 @@
 from functools import wraps
+import inspect
 import grpc
 from grpc._utilities import RpcMethodHandler
 
@@ -8,6 +9,14 @@ from django_grpc.signals import grpc_request_started, grpc_got_request_exception
 class SignalWrapper:
     """
     Wraps all RPC handlers to emit signal before and after each RPC
+
+    This is the only place the request signals are sent, so database
+    connections are checked once per RPC: ``close_old_connections`` keeps
+    connections up to ``CONN_MAX_AGE`` and, with ``CONN_HEALTH_CHECKS``,
+    checks them again before their first use in the next RPC.
+
+    Coroutine and async generator handlers (``grpc.aio`` servers) get async
+    wrappers, the signals are sent from the event loop.
     """
     # Names of properties that can hold RPC callback
     METHOD_PROPERTIES = ('unary_unary', 'unary_stream', 'stream_unary', 'stream_stream')
@@ -36,8 +45,16 @@ class SignalWrapper:
             prop: getattr(method_handler, prop)
             for prop in method_handler._fields
         }
-        kwargs['unary_unary'] = _unary_unary(kwargs['unary_unary'])
-        kwargs['unary_stream'] = _unary_stream(kwargs['unary_stream'])
+        unary_unary = kwargs['unary_unary']
+        unary_stream = kwargs['unary_stream']
+        if inspect.iscoroutinefunction(unary_unary):
+            kwargs['unary_unary'] = _async_unary_unary(unary_unary)
+        else:
+            kwargs['unary_unary'] = _unary_unary(unary_unary)
+        if inspect.isasyncgenfunction(unary_stream):
+            kwargs['unary_stream'] = _async_unary_stream(unary_stream)
+        else:
+            kwargs['unary_stream'] = _unary_stream(unary_stream)
         # @TODO add support for stream-unary and stream-stream methods
         # kwargs['stream_unary'] = _unary_stream(kwargs['stream_unary'])
         # kwargs['stream_stream'] = _unary_stream(kwargs['stream_stream'])
@@ -57,7 +74,7 @@ def _unary_unary(func):
         except Exception as exc:
             grpc_got_request_exception.send(None, request=args[0], context=args[1], exception=exc)
             raise
-        else:
+        finally:
             grpc_request_finished.send(None, request=args[0], context=args[1])
         return response
 
@@ -77,7 +94,41 @@ def _unary_stream(func):
         except Exception as exc:
             grpc_got_request_exception.send(None, request=args[0], context=args[1], exception=exc)
             raise
-        else:
+        finally:
+            # also when the client cancelled the stream
+            grpc_request_finished.send(None, request=args[0], context=args[1])
+
+    return inner
+
+
+def _async_unary_unary(func):
+    @wraps(func)
+    async def inner(*args, **kwargs):
+        grpc_request_started.send(None, request=args[0], context=args[1])
+        try:
+            response = await func(*args, **kwargs)
+        except Exception as exc:
+            grpc_got_request_exception.send(None, request=args[0], context=args[1], exception=exc)
+            raise
+        finally:
+            grpc_request_finished.send(None, request=args[0], context=args[1])
+        return response
+
+    return inner
+
+
+def _async_unary_stream(func):
+    @wraps(func)
+    async def inner(*args, **kwargs):
+        grpc_request_started.send(None, request=args[0], context=args[1])
+        try:
+            async for it in func(*args, **kwargs):
+                yield it
+        except Exception as exc:
+            grpc_got_request_exception.send(None, request=args[0], context=args[1], exception=exc)
+            raise
+        finally:
+            # also when the client cancelled the stream
             grpc_request_finished.send(None, request=args[0], context=args[1])
 
     return inner
@@ -26,8 +26,9 @@ def create_server(max_workers, port, interceptors=None):
 
     # create a gRPC server
     if is_async is True:
+        # grpc.aio only accepts grpc.aio.ServerInterceptor instances
         server = grpc.aio.server(
-            interceptors=interceptors,
+            interceptors=load_interceptors(config.get('async_interceptors', [])),
             maximum_concurrent_rpcs=maximum_concurrent_rpcs,
             options=options
         )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core import checks
+
+if TYPE_CHECKING:
+    pass
+
+
+__all__ = (
+    "LOCAL_CACHE_BACKENDS", "REDIS_CACHE_BACKEND",
+    "is_shared_cache", "is_redis_cache", "check_shared_cache",
+)
+
+
+# backends whose entries are not seen by other processes
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+REDIS_CACHE_BACKEND = "django.core.cache.backends.redis.RedisCache"
+
+
+def is_shared_cache(alias: str) -> bool:
+    """Whether the ``alias`` cache is shared by every process of the deployment."""
+    if (config := settings.CACHES.get(alias)) is None:
+        return False
+    return config.get("BACKEND") not in LOCAL_CACHE_BACKENDS
+
+
+def is_redis_cache(alias: str) -> bool:
+    """Whether the ``alias`` cache is a ``RedisCache``, with pub/sub and scripts."""
+    if (config := settings.CACHES.get(alias)) is None:
+        return False
+    return config.get("BACKEND") == REDIS_CACHE_BACKEND
+
+
+def check_shared_cache(alias: str, *, setting: str, id: str) -> list[checks.CheckMessage]:
+    """System check error when the ``alias`` cache used by ``setting`` is not shared."""
+    if is_shared_cache(alias):
+        return []
+    return [checks.Error(
+        "%s uses the cache %r, which is not shared between processes." % (setting, alias),
+        hint="Point it to a Redis, Memcached or database cache.",
+        id=id,
+    )]
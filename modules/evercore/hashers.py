@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import base64
+import logging
+
+from django.conf import settings
+from django.contrib.auth.hashers import BasePasswordHasher, mask_hash
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.translation import gettext_noop as _
+
+if TYPE_CHECKING:
+    pass
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("EphemeralSecretHasher",)
+
+
+class EphemeralSecretHasher(BasePasswordHasher):
+    """Keyed HMAC-SHA256 hasher for short-lived secrets.
+
+    Meant for OTP pins and codes which expire within minutes and are
+    already throttled, where a slow key derivation function only adds
+    latency. The secret is keyed with a server side pepper
+    (``EPHEMERAL_SECRET_PEPPER``, defaults to ``SECRET_KEY``) and a
+    per row salt, so a leaked table alone can't be brute forced.
+
+    Register it in ``PASSWORD_HASHERS`` (after the default hasher) so
+    ``check_password`` can identify stored values, then select it by
+    its ``algorithm`` name.
+    """
+    algorithm = "ephemeral_hmac_sha256"
+    key_salt = "evercore.hashers.EphemeralSecretHasher"
+
+    @property
+    def pepper(self) -> str | None:
+        return getattr(settings, "EPHEMERAL_SECRET_PEPPER", None)
+
+    def encode(self, password: str, salt: str) -> str:
+        self._check_encode_args(password, salt)
+        digest = salted_hmac(
+            self.key_salt + salt, password,
+            secret=self.pepper, algorithm="sha256"
+        ).digest()
+        hash_ = base64.b64encode(digest).decode("ascii").strip()
+        return "%s$%s$%s" % (self.algorithm, salt, hash_)
+
+    def decode(self, encoded: str) -> dict:
+        algorithm, salt, hash_ = encoded.split("$", 2)
+        assert algorithm == self.algorithm
+        return {
+            "algorithm": algorithm,
+            "hash": hash_,
+            "salt": salt,
+        }
+
+    def verify(self, password: str, encoded: str) -> bool:
+        decoded = self.decode(encoded)
+        encoded_2 = self.encode(password, decoded["salt"])
+        return constant_time_compare(encoded, encoded_2)
+
+    def safe_summary(self, encoded: str) -> dict:
+        decoded = self.decode(encoded)
+        return {
+            _("algorithm"): decoded["algorithm"],
+            _("salt"): mask_hash(decoded["salt"], show=2),
+            _("hash"): mask_hash(decoded["hash"]),
+        }
+
+    def must_update(self, encoded: str) -> bool:
+        return False
+
+    def harden_runtime(self, password: str, encoded: str):
+        pass
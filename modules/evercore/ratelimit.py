@@ -0,0 +1,476 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.utils.module_loading import import_string
+
+from evercore.cache import is_shared_cache
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+    from django.core.cache.backends.base import BaseCache
+
+
+logger = logging.getLogger(__name__)
+__all__ = (
+    "SLIDING_WINDOW", "TOKEN_BUCKET",
+    "RateLimitResult", "parse_rate",
+    "BaseRateLimitBackend", "LocalRateLimitBackend", "RedisRateLimitBackend",
+    "CacheRateLimitBackend", "get_backend", "is_shared_backend", "RateLimiter",
+)
+
+
+SLIDING_WINDOW = "sliding_window"
+TOKEN_BUCKET = "token_bucket"
+
+PERIODS = {
+    "s": 1,
+    "m": 60,
+    "h": 60 * 60,
+    "d": 24 * 60 * 60,
+}
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    remaining: int
+    # seconds until the call would be allowed, 0 when allowed
+    retry_after: float
+
+
+def parse_rate(rate: str | tuple[int, float]) -> tuple[int, float]:
+    """
+    Parse ``"<limit>/<period>"`` into ``(limit, seconds)``.
+
+    The period is a unit (``s``, ``m``, ``h``, ``d``, only the first
+    character counts like DRF rates) optionally prefixed by a multiplier,
+    i.e. ``"5/m"``, ``"100/hour"`` or ``"10/30s"``.
+    """
+    if isinstance(rate, (tuple, list)):
+        limit, period = rate
+        return int(limit), float(period)
+    try:
+        limit, period = rate.split("/")
+        digits = period.rstrip("abcdefghijklmnopqrstuvwxyz")
+        unit = period[len(digits):][:1]
+        return int(limit), float(digits or 1) * PERIODS[unit]
+    except (AttributeError, KeyError, ValueError):
+        raise ImproperlyConfigured("Invalid rate %r" % (rate,))
+
+
+class BaseRateLimitBackend:
+    def hit(
+            self, key: str, limit: int, period: float, *,
+            algorithm: str = SLIDING_WINDOW,
+            cost: int = 1) -> RateLimitResult:
+        raise NotImplementedError
+
+    def reset(self, key: str, *, period: float = None):
+        raise NotImplementedError
+
+
+def sliding_window(
+        state: tuple[int, float, float] | None, now: float,
+        limit: int, period: float, cost: int
+) -> tuple[tuple[int, float, float], RateLimitResult]:
+    """
+    Sliding window counter, ``state`` is ``(window, current, previous)``.
+
+    The previous window count is weighted by its overlap with the
+    sliding window ending now. Mirrors ``SLIDING_WINDOW_SCRIPT``.
+    """
+    window = int(now // period)
+    if state is None:
+        current = previous = 0
+    else:
+        last_window, current, previous = state
+        if last_window == window - 1:
+            previous, current = current, 0
+        elif last_window != window:
+            previous = current = 0
+    elapsed = now - window * period
+    count = previous * (period - elapsed) / period + current
+    if count + cost > limit:
+        if previous > 0 and current + cost <= limit:
+            retry_after = period * (1 - (limit - current - cost) / previous) - elapsed
+        else:
+            # wait for the next window, where the current count
+            # becomes the weighted previous one
+            retry_after = period - elapsed
+            if current > 0:
+                retry_after += period * max(0.0, 1 - (limit - cost) / current)
+        return (window, current, previous), RateLimitResult(
+            False, max(0, math.floor(limit - count)), max(retry_after, 0.0))
+    current += cost
+    return (window, current, previous), RateLimitResult(
+        True, max(0, math.floor(limit - count - cost)), 0.0)
+
+
+def token_bucket(
+        state: tuple[float, float] | None, now: float,
+        limit: int, period: float, cost: int
+) -> tuple[tuple[float, float], RateLimitResult]:
+    """
+    Token bucket of ``limit`` tokens refilled over ``period``, ``state``
+    is ``(tokens, updated)``. Mirrors ``TOKEN_BUCKET_SCRIPT``.
+    """
+    rate = limit / period
+    if state is None:
+        tokens = float(limit)
+    else:
+        tokens, updated = state
+        tokens = min(float(limit), tokens + max(0.0, now - updated) * rate)
+    if tokens < cost:
+        return (tokens, now), RateLimitResult(
+            False, math.floor(tokens), (cost - tokens) / rate)
+    tokens -= cost
+    return (tokens, now), RateLimitResult(True, math.floor(tokens), 0.0)
+
+
+ALGORITHMS = {
+    SLIDING_WINDOW: sliding_window,
+    TOKEN_BUCKET: token_bucket,
+}
+
+
+class LocalRateLimitBackend(BaseRateLimitBackend):
+    """
+    In process backend. Limits are not shared between workers, use it
+    for development or as fallback when the shared backend is down.
+    """
+    # prune expired states once the table grows past this size
+    prune_threshold = 10000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states = {}  # type: dict[str, tuple[float, Any]]
+
+    def _prune(self, now: float):
+        for key in [k for k, (expires, _) in self._states.items() if expires <= now]:
+            del self._states[key]
+
+    def hit(
+            self, key: str, limit: int, period: float, *,
+            algorithm: str = SLIDING_WINDOW,
+            cost: int = 1) -> RateLimitResult:
+        func = ALGORITHMS[algorithm]
+        now = time.time()
+        with self._lock:
+            try:
+                expires, state = self._states[key]
+            except KeyError:
+                state = None
+            else:
+                if expires <= now:
+                    state = None
+            state, result = func(state, now, limit, period, cost)
+            self._states[key] = (now + 2 * period, state)
+            if len(self._states) > self.prune_threshold:
+                self._prune(now)
+        return result
+
+    def reset(self, key: str, *, period: float = None):
+        with self._lock:
+            self._states.pop(key, None)
+
+
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local window = math.floor(now / period)
+local data = redis.call('HMGET', KEYS[1], 'w', 'c', 'p')
+local last = tonumber(data[1])
+local current = tonumber(data[2]) or 0
+local previous = tonumber(data[3]) or 0
+if last == nil then
+  current = 0
+  previous = 0
+elseif last == window - 1 then
+  previous = current
+  current = 0
+elseif last ~= window then
+  current = 0
+  previous = 0
+end
+local elapsed = now - window * period
+local count = previous * (period - elapsed) / period + current
+local allowed = 1
+local retry = 0
+if count + cost > limit then
+  allowed = 0
+  if previous > 0 and current + cost <= limit then
+    retry = period * (1 - (limit - current - cost) / previous) - elapsed
+  else
+    retry = period - elapsed
+    if current > 0 then
+      retry = retry + period * math.max(0, 1 - (limit - cost) / current)
+    end
+  end
+  if retry < 0 then retry = 0 end
+else
+  current = current + cost
+  count = count + cost
+end
+redis.call('HSET', KEYS[1], 'w', window, 'c', current, 'p', previous)
+redis.call('PEXPIRE', KEYS[1], math.ceil(period * 2000))
+local remaining = math.floor(limit - count)
+if remaining < 0 then remaining = 0 end
+return {allowed, remaining, tostring(retry)}
+"""
+
+TOKEN_BUCKET_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rate = limit / period
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1])
+local updated = tonumber(data[2])
+if tokens == nil then
+  tokens = limit
+else
+  tokens = math.min(limit, tokens + math.max(0, now - updated) * rate)
+end
+local allowed = 1
+local retry = 0
+if tokens < cost then
+  allowed = 0
+  retry = (cost - tokens) / rate
+else
+  tokens = tokens - cost
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(period * 2000))
+return {allowed, math.floor(tokens), tostring(retry)}
+"""
+
+
+class RedisRateLimitBackend(BaseRateLimitBackend):
+    """
+    Shared backend for any Redis protocol server.
+
+    Every hit is a single atomic script call (``EVALSHA``, falling back to
+    ``EVAL`` once per server) timed by the server clock, so workers with
+    skewed clocks still agree. When the server can't be reached the call
+    is counted by the ``fallback`` backend instead of failing the request.
+    """
+
+    def __init__(self, client, *, fallback: BaseRateLimitBackend = None):
+        self.client = client
+        self.fallback = fallback
+        self.scripts = {
+            SLIDING_WINDOW: client.register_script(SLIDING_WINDOW_SCRIPT),
+            TOKEN_BUCKET: client.register_script(TOKEN_BUCKET_SCRIPT),
+        }
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> RedisRateLimitBackend:
+        try:
+            import redis
+        except ImportError:
+            raise ImproperlyConfigured(
+                "The redis package is required by RedisRateLimitBackend")
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    @classmethod
+    def from_cache(cls, alias: str, **kwargs) -> RedisRateLimitBackend:
+        """Reuse the connection pool of a ``django.core.cache.backends.redis.RedisCache``."""
+        # noinspection PyProtectedMember
+        return cls(caches[alias]._cache.get_client(write=True), **kwargs)
+
+    def hit(
+            self, key: str, limit: int, period: float, *,
+            algorithm: str = SLIDING_WINDOW,
+            cost: int = 1) -> RateLimitResult:
+        script = self.scripts[algorithm]
+        try:
+            allowed, remaining, retry_after = script(
+                keys=[key], args=[limit, period, cost])
+        except Exception:  # noqa
+            if self.fallback is None:
+                raise
+            logger.warning("rate limit backend unavailable, using fallback", exc_info=True)
+            return self.fallback.hit(
+                key, limit, period, algorithm=algorithm, cost=cost)
+        return RateLimitResult(bool(allowed), int(remaining), float(retry_after))
+
+    def reset(self, key: str, *, period: float = None):
+        try:
+            self.client.delete(key)
+        finally:
+            if self.fallback is not None:
+                self.fallback.reset(key)
+
+
+class CacheRateLimitBackend(BaseRateLimitBackend):
+    """
+    Shared backend on a Django cache, for deployments without Redis.
+
+    Calls are counted in one counter per window with ``add`` and
+    ``incr`` (atomic on Memcached, a read and a write on the database
+    cache) and weighted like ``sliding_window``; denied calls are taken
+    back with ``decr``. Token buckets are counted as a sliding window of
+    the same rate. When the cache fails the call is counted by the
+    ``fallback`` backend instead of failing the request.
+    """
+
+    def __init__(self, alias: str, *, fallback: BaseRateLimitBackend = None):
+        self.alias = alias
+        self.fallback = fallback
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[self.alias]
+
+    def _hit(self, key: str, limit: int, period: float, cost: int) -> RateLimitResult:
+        cache = self.cache
+        now = time.time()
+        window = int(now // period)
+        current_key = "%s:%d" % (key, window)
+        timeout = math.ceil(2 * period)
+        cache.add(current_key, 0, timeout)
+        try:
+            current = cache.incr(current_key, cost)
+        except ValueError:
+            # expired between add and incr
+            cache.set(current_key, cost, timeout)
+            current = cost
+        previous = cache.get("%s:%d" % (key, window - 1), 0)
+        _, result = sliding_window((window, current - cost, previous), now, limit, period, cost)
+        if not result.allowed:
+            try:
+                cache.decr(current_key, cost)
+            except ValueError:
+                pass
+        return result
+
+    def hit(
+            self, key: str, limit: int, period: float, *,
+            algorithm: str = SLIDING_WINDOW,
+            cost: int = 1) -> RateLimitResult:
+        try:
+            return self._hit(key, limit, period, cost)
+        except Exception:  # noqa
+            if self.fallback is None:
+                raise
+            logger.warning("rate limit backend unavailable, using fallback", exc_info=True)
+            return self.fallback.hit(
+                key, limit, period, algorithm=algorithm, cost=cost)
+
+    def reset(self, key: str, *, period: float = None):
+        try:
+            if period is not None:
+                window = int(time.time() // period)
+                self.cache.delete_many(["%s:%d" % (key, window - 1), "%s:%d" % (key, window)])
+        finally:
+            if self.fallback is not None:
+                self.fallback.reset(key)
+
+
+_backend = None  # type: BaseRateLimitBackend | None
+_backend_lock = threading.Lock()
+
+
+def _create_backend() -> BaseRateLimitBackend:
+    """
+    ``RATELIMIT_BACKEND`` (import path of a backend class) wins, then
+    ``RATELIMIT_REDIS_URL``, then the ``RATELIMIT_USE_CACHE`` cache when
+    it is a redis cache or another cache shared between processes.
+    Anything else falls back to in process limits.
+    """
+    if backend_path := getattr(settings, "RATELIMIT_BACKEND", None):
+        return import_string(backend_path)()
+    fallback = LocalRateLimitBackend()
+    if redis_url := getattr(settings, "RATELIMIT_REDIS_URL", None):
+        return RedisRateLimitBackend.from_url(redis_url, fallback=fallback)
+    alias = getattr(settings, "RATELIMIT_USE_CACHE", "default")
+    backend = settings.CACHES.get(alias, {}).get("BACKEND", "")
+    if backend == "django.core.cache.backends.redis.RedisCache":
+        return RedisRateLimitBackend.from_cache(alias, fallback=fallback)
+    if is_shared_cache(alias):
+        return CacheRateLimitBackend(alias, fallback=fallback)
+    logger.warning("no shared rate limit backend configured, limits are per process")
+    return fallback
+
+
+def get_backend() -> BaseRateLimitBackend:
+    global _backend
+    if (backend := _backend) is None:
+        with _backend_lock:
+            if (backend := _backend) is None:
+                backend = _backend = _create_backend()
+    return backend
+
+
+def is_shared_backend() -> bool:
+    """Whether limits are counted across the processes of the deployment."""
+    return not isinstance(get_backend(), LocalRateLimitBackend)
+
+
+def _reset_backend(*, setting: str, **kwargs):
+    global _backend
+    if setting in ("RATELIMIT_BACKEND", "RATELIMIT_REDIS_URL", "RATELIMIT_USE_CACHE", "CACHES"):
+        _backend = None
+
+
+setting_changed.connect(_reset_backend)
+
+
+class RateLimiter:
+    """
+    Rate limit of a group of calls, counted per identity values.
+
+    ::
+
+        limiter = RateLimiter("5/m", group="otp.challenge")
+        result = limiter.hit(user.pk)
+        if not result.allowed:
+            raise Throttled(result.retry_after)
+    """
+
+    def __init__(
+            self, rate: str | tuple[int, float], *,
+            group: str,
+            algorithm: str = SLIDING_WINDOW,
+            backend: BaseRateLimitBackend = None):
+        if algorithm not in ALGORITHMS:
+            raise ImproperlyConfigured("Unknown rate limit algorithm %r" % algorithm)
+        self.limit, self.period = parse_rate(rate)
+        if self.limit <= 0 or self.period <= 0:
+            raise ImproperlyConfigured("Rate limit and period must be greater than 0")
+        self.group = group
+        self.algorithm = algorithm
+        self._backend = backend
+
+    @property
+    def backend(self) -> BaseRateLimitBackend:
+        return self._backend or get_backend()
+
+    def make_key(self, values: Iterable[Any]) -> str:
+        digest = hashlib.sha256(
+            "\x00".join(str(value) for value in values).encode()
+        ).hexdigest()
+        prefix = getattr(settings, "RATELIMIT_KEY_PREFIX", "rl")
+        return "%s:%s:%s:%s" % (prefix, self.algorithm, self.group, digest)
+
+    def hit(self, *values: Any, cost: int = 1) -> RateLimitResult:
+        return self.backend.hit(
+            self.make_key(values), self.limit, self.period,
+            algorithm=self.algorithm, cost=cost)
+
+    def reset(self, *values: Any):
+        self.backend.reset(self.make_key(values), period=self.period)
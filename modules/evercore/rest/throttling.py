@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import logging
+
+from rest_framework.throttling import BaseThrottle
+
+from evercore.ratelimit import SLIDING_WINDOW, RateLimiter
+
+if TYPE_CHECKING:
+    from typing import Any
+    from rest_framework.request import Request
+    from rest_framework.views import APIView
+    from evercore.ratelimit import RateLimitResult
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("RateLimitThrottle",)
+
+
+class RateLimitThrottle(BaseThrottle):
+    """
+    DRF throttle backed by ``evercore.ratelimit``, so limits are shared
+    with gRPC services using the same group.
+
+    Set ``rate`` (or override ``get_rate()``, ``None`` disables the
+    throttle) and ``scope``; calls are counted per ``get_ident_values()``,
+    which defaults to the client ip. Limit only some actions of a viewset
+    with ``actions``.
+    """
+    rate = None  # type: str | None
+    scope = None  # type: str | None
+    algorithm = SLIDING_WINDOW
+    actions = None  # type: tuple[str, ...] | None
+
+    def __init__(self):
+        self.result = None  # type: RateLimitResult | None
+
+    def get_rate(self) -> str | None:
+        return self.rate
+
+    def get_scope(self, view: APIView) -> str:
+        return self.scope or view.__class__.__qualname__
+
+    def get_ident_values(self, request: Request, view: APIView) -> tuple[Any, ...]:
+        return (self.get_ident(request),)
+
+    def get_limiter(self, rate: str, view: APIView) -> RateLimiter:
+        return RateLimiter(
+            rate, group=self.get_scope(view), algorithm=self.algorithm)
+
+    def allow_request(self, request: Request, view: APIView) -> bool:
+        if self.actions is not None and getattr(view, "action", None) not in self.actions:
+            return True
+        if (rate := self.get_rate()) is None:
+            return True
+        values = self.get_ident_values(request, view)
+        if values is None:
+            return True
+        self.result = self.get_limiter(rate, view).hit(*values)
+        return self.result.allowed
+
+    def wait(self) -> float | None:
+        if self.result is None:
+            return None
+        return self.result.retry_after
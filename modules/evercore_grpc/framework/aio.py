@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import asyncio
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, reset_queries
+
+from evercore_grpc.settings import api_settings
+
+if TYPE_CHECKING:
+    from typing import Any, AsyncIterator, Callable, Iterable
+    import grpc.aio
+
+
+__all__ = (
+    "get_executor",
+    "run_in_thread",
+    "iterate_in_thread",
+    "SyncServicerContext",
+)
+
+
+_executor = None  # type: ThreadPoolExecutor | None
+_executor_lock = threading.Lock()
+_done = object()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Thread pool running the sync (ORM) part of async RPCs, bounded by the
+    ``ASYNC_THREAD_POOL_SIZE`` setting so a burst of slow calls can not
+    open more database connections than that.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=api_settings.ASYNC_THREAD_POOL_SIZE,
+                    thread_name_prefix="grpc-aio")
+    return _executor
+
+
+def _in_request(func: Callable) -> Callable:
+    # the request signals are sent from the event loop, the connections
+    # of the pool thread are handled here the same way
+    def inner(*args, **kwargs):
+        reset_queries()
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return inner
+
+
+def run_in_thread(func: Callable) -> Callable:
+    """
+    ``sync_to_async`` of ``func`` on the bounded thread pool, with database
+    connections handled like a request.
+    """
+    return sync_to_async(
+        _in_request(func), thread_sensitive=False, executor=get_executor())
+
+
+async def iterate_in_thread(func: Callable[..., Iterable], *args) -> AsyncIterator:
+    """
+    Iterate the iterable returned by ``func`` in a single pool thread, so
+    querysets and their connection stay on one thread. At most
+    ``ASYNC_STREAM_BUFFER_SIZE`` messages are buffered ahead of the client.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=api_settings.ASYNC_STREAM_BUFFER_SIZE)
+    stop = threading.Event()
+
+    def put(item: Any, error: BaseException | None = None):
+        asyncio.run_coroutine_threadsafe(queue.put((item, error)), loop).result()
+
+    def produce():
+        try:
+            for item in func(*args):
+                if stop.is_set():
+                    break
+                put(item)
+        except BaseException as e:
+            put(_done, e)
+        else:
+            put(_done)
+
+    future = loop.run_in_executor(get_executor(), _in_request(produce))
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _done:
+                if error is not None:
+                    raise error
+                break
+            yield item
+    finally:
+        # unblock a producer waiting on a full queue, then wait for it
+        stop.set()
+        while not future.done():
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.wait((future,), timeout=0.05)
+
+
+class SyncServicerContext:
+    """
+    ``grpc.ServicerContext`` interface over a ``grpc.aio`` context, for sync
+    handlers running in a pool thread. Coroutine methods are run on the
+    event loop and waited for.
+    """
+
+    def __init__(self, context: grpc.aio.ServicerContext, loop: asyncio.AbstractEventLoop):
+        self._context = context
+        self._loop = loop
+
+    def __getattr__(self, item: str):
+        return getattr(self._context, item)
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def is_active(self) -> bool:
+        return not (self._context.done() or self._context.cancelled())
+
+    def abort(self, code, details="", trailing_metadata=()):
+        # raises the AbortError the server expects
+        self._call(self._context.abort(code, details, trailing_metadata))
+
+    def abort_with_status(self, status):
+        self._context.set_trailing_metadata(status.trailing_metadata)
+        self.abort(status.code, status.details)
+
+    def send_initial_metadata(self, initial_metadata):
+        self._call(self._context.send_initial_metadata(initial_metadata))
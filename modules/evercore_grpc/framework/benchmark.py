@@ -0,0 +1,87 @@
+"""
+Per-RPC overhead of the servicer stack on a no-op method::
+
+    python -m evercore_grpc.framework.benchmark --iterations 100000
+
+Runs with the project settings when ``DJANGO_SETTINGS_MODULE`` is set,
+otherwise with an in-memory sqlite database.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import django
+import grpc
+
+from django.conf import settings
+
+
+def setup():
+    if not settings.configured:
+        settings.configure(
+            DATABASES={
+                "default": {
+                    "ENGINE": "django.db.backends.sqlite3",
+                    "NAME": ":memory:",
+                    "CONN_MAX_AGE": None,
+                    "CONN_HEALTH_CHECKS": True,
+                },
+            },
+            INSTALLED_APPS=[],
+        )
+    django.setup()
+
+    from django.db import connection
+
+    # an open connection, as in a serving process
+    connection.ensure_connection()
+
+
+def build_handlers():
+    from django_grpc.signals.wrapper import SignalWrapper
+    from evercore_grpc.framework.services import Service
+
+    class NoopService(Service):
+        def Noop(self, request, context):
+            return request
+
+    class Server:
+        def add_generic_rpc_handlers(self, generic_rpc_handlers):
+            self.handlers = generic_rpc_handlers[0]._method_handlers
+
+    server = Server()
+    servicer = NoopService.as_servicer()
+    SignalWrapper(server).add_generic_rpc_handlers((
+        grpc.method_handlers_generic_handler("benchmark.Noop", {
+            "Noop": grpc.unary_unary_rpc_method_handler(servicer.Noop),
+        }),
+    ))
+    return {
+        "method": NoopService().Noop,
+        "servicer": servicer.Noop,
+        "server stack": server.handlers["/benchmark.Noop/Noop"].unary_unary,
+    }
+
+
+def measure(func, iterations: int) -> float:
+    request = object()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(request, None)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100000)
+    options = parser.parse_args()
+
+    setup()
+    for label, func in build_handlers().items():
+        print("%-13s %6.2f us per call" % (
+            label, measure(func, options.iterations) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
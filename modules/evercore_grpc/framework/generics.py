@@ -8,6 +8,8 @@ from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
 from django.http import Http404
 
+from evercore_grpc.settings import api_settings
+
 from . import mixins, services
 
 if TYPE_CHECKING:
@@ -35,6 +37,13 @@ class GenericService(services.Service):
     # The filter backend classes to use for queryset filtering
     filter_backends = ()
 
+    # The pagination class used by streaming list handlers
+    pagination_class = None
+
+    # Rows fetched per database round trip while streaming,
+    # defaults to the `LIST_CHUNK_SIZE` setting
+    stream_chunk_size = None
+
     # Allow generic typing checking for generic views.
     def __class_getitem__(cls, *args, **kwargs):
         return cls
@@ -145,6 +154,30 @@ class GenericService(services.Service):
             queryset = backend().filter_queryset(self.request, queryset, self)
         return queryset
 
+    @property
+    def paginator(self):
+        """
+        The paginator instance associated with the service, or `None`.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def paginate_queryset(self, queryset):
+        """
+        Return the queryset restricted to a single page, or the queryset
+        itself if pagination is disabled.
+        """
+        if self.paginator is None:
+            return queryset
+        return self.paginator.paginate_queryset(queryset, self)
+
+    def get_stream_chunk_size(self):
+        return self.stream_chunk_size or api_settings.LIST_CHUNK_SIZE
+
 
 class CreateService(mixins.CreateModelMixin,
                     GenericService):
@@ -1,5 +1,7 @@
 from google.protobuf import empty_pb2
 
+from django.db.models.query import QuerySet
+
 
 class CreateModelMixin:
     def Create(self, request, context):
@@ -26,14 +28,31 @@ class ListModelMixin:
         List a queryset.  This sends a sequence of messages of
         ``serializer.Meta.proto_class`` to the client.
 
+        Querysets are fetched in chunks of ``get_stream_chunk_size()`` rows
+        and each object is serialized right before it is sent, so memory
+        stays constant regardless of the size of the listing.  The stream
+        stops early once the client cancels the call.
+
         .. note::
 
             This is a server streaming RPC.
         """
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        for message in serializer.message:
-            yield message
+        queryset = self.paginate_queryset(
+            self.filter_queryset(self.get_queryset()))
+        if isinstance(queryset, QuerySet):
+            objects = queryset.iterator(chunk_size=self.get_stream_chunk_size())
+        else:
+            objects = iter(queryset)
+        if self.paginator is not None:
+            objects = self.paginator.paginate_stream(objects)
+
+        for instance in objects:
+            if not context.is_active():
+                return
+            yield self.get_serializer(instance).message
+
+        if self.paginator is not None:
+            self.paginator.finalize(self)
 
 
 class RetrieveModelMixin:
@@ -0,0 +1,140 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import base64
+import binascii
+import json
+
+import grpc
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.query import QuerySet
+
+from evercore_grpc.settings import api_settings
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+    from .generics import GenericService
+
+
+__all__ = ("BasePagination", "KeysetPagination")
+
+
+def get_metadata_value(context: grpc.ServicerContext, key: str) -> str | None:
+    for metadata in context.invocation_metadata() or ():
+        if metadata.key == key:
+            return metadata.value
+    return None
+
+
+class BasePagination:
+    def paginate_queryset(
+            self, queryset: QuerySet,
+            service: GenericService) -> QuerySet | Iterable:
+        raise NotImplementedError('paginate_queryset() must be implemented.')
+
+    def paginate_stream(self, iterable: Iterable) -> Iterable:
+        """Wrap the streamed iterable, i.e. to track the last object sent."""
+        return iterable
+
+    def finalize(self, service: GenericService):
+        """Called once the stream was fully sent."""
+        pass
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination driven by request metadata.
+
+    The client sends the page size in ``PAGE_SIZE_METADATA_KEY`` and the
+    token from the previous page in ``PAGE_TOKEN_METADATA_KEY``. When the
+    page is full the token for the next page is sent back as trailing
+    metadata ``NEXT_PAGE_TOKEN_METADATA_KEY``.
+
+    ``ordering`` has to be a single unique field, prefix it with ``-``
+    for descending order. Requests without pagination metadata stream
+    the whole queryset in its own ordering.
+    """
+    ordering = 'pk'
+    page_size = None
+    max_page_size = None
+
+    def __init__(self):
+        self.limit = None
+        self.sent = 0
+        self.last = None
+
+    @property
+    def field_name(self) -> str:
+        return self.ordering.lstrip('-')
+
+    @property
+    def descending(self) -> bool:
+        return self.ordering.startswith('-')
+
+    # noinspection PyMethodMayBeStatic
+    def encode_token(self, value: Any) -> str:
+        raw = json.dumps([value], cls=DjangoJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode('ascii').rstrip('=')
+
+    # noinspection PyMethodMayBeStatic
+    def decode_token(self, token: str) -> Any:
+        padded = token + '=' * (-len(token) % 4)
+        value, = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return value
+
+    def get_page_size(self, service: GenericService) -> int | None:
+        raw = get_metadata_value(
+            service.context, api_settings.PAGE_SIZE_METADATA_KEY)
+        if raw is None:
+            page_size = self.page_size or api_settings.PAGE_SIZE
+        else:
+            try:
+                page_size = int(raw)
+            except ValueError:
+                service.context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT, 'Invalid page size.')
+            if page_size <= 0:
+                service.context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT, 'Invalid page size.')
+        max_page_size = self.max_page_size or api_settings.MAX_PAGE_SIZE
+        if max_page_size and (page_size is None or page_size > max_page_size):
+            page_size = max_page_size
+        return page_size
+
+    def paginate_queryset(
+            self, queryset: QuerySet,
+            service: GenericService) -> QuerySet:
+        token = get_metadata_value(
+            service.context, api_settings.PAGE_TOKEN_METADATA_KEY)
+        self.limit = self.get_page_size(service)
+        if token is None and self.limit is None:
+            return queryset
+
+        queryset = queryset.order_by(self.ordering)
+        if token:
+            try:
+                value = self.decode_token(token)
+            except (binascii.Error, TypeError, ValueError):
+                service.context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT, 'Invalid page token.')
+            lookup = '%s__%s' % (self.field_name, 'lt' if self.descending else 'gt')
+            queryset = queryset.filter(**{lookup: value})
+        if self.limit is not None:
+            queryset = queryset[:self.limit]
+        return queryset
+
+    def paginate_stream(self, iterable: Iterable) -> Iterable:
+        for instance in iterable:
+            self.sent += 1
+            self.last = instance
+            yield instance
+
+    def finalize(self, service: GenericService):
+        # a short page means there is nothing left to fetch
+        if self.limit is None or self.last is None or self.sent < self.limit:
+            return
+        value = getattr(self.last, self.field_name)
+        service.context.set_trailing_metadata((
+            (api_settings.NEXT_PAGE_TOKEN_METADATA_KEY, self.encode_token(value)),
+        ))
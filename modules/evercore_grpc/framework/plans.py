@@ -0,0 +1,229 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import datetime
+import threading
+import uuid
+
+from google.protobuf.descriptor import FieldDescriptor
+
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+from evercore_grpc.protobuf.json_format import parse_dict
+
+from . import fields
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+    from google.protobuf.descriptor import Descriptor
+    from google.protobuf.message import Message
+    from .serializers import BaseProtoSerializerMixin
+    Setter = Callable[[Message, str, Any], None]
+
+
+__all__ = ("MessagePlan", "get_message_plan", "clear_message_plans")
+
+
+# Field classes whose representation equals the attribute value, so the
+# value can be copied onto the message without `to_representation()`.
+DIRECT_FIELD_CLASSES = (
+    fields.BooleanField, fields.CharField, fields.EmailField,
+    fields.RegexField, fields.SlugField, fields.URLField,
+    fields.UUIDField, fields.IPAddressField,
+    fields.IntegerField, fields.FloatField,
+    fields.DateTimeField, fields.DurationField,
+    fields.ChoiceField, fields.ReadOnlyField,
+)
+
+STRING_TYPES = (FieldDescriptor.TYPE_STRING,)
+INTEGER_TYPES = (
+    FieldDescriptor.TYPE_INT32, FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_UINT32, FieldDescriptor.TYPE_UINT64,
+    FieldDescriptor.TYPE_SINT32, FieldDescriptor.TYPE_SINT64,
+    FieldDescriptor.TYPE_FIXED32, FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_SFIXED32, FieldDescriptor.TYPE_SFIXED64,
+)
+FLOAT_TYPES = (FieldDescriptor.TYPE_FLOAT, FieldDescriptor.TYPE_DOUBLE)
+WRAPPER_TYPES = frozenset((
+    "google.protobuf.BoolValue", "google.protobuf.StringValue",
+    "google.protobuf.BytesValue", "google.protobuf.Int32Value",
+    "google.protobuf.Int64Value", "google.protobuf.UInt32Value",
+    "google.protobuf.UInt64Value", "google.protobuf.FloatValue",
+    "google.protobuf.DoubleValue",
+))
+
+
+def _set_string(message, name, value):
+    if not isinstance(value, str):
+        value = str(value)
+    setattr(message, name, value)
+
+
+def _set_integer(message, name, value):
+    if isinstance(value, uuid.UUID):
+        value = value.int
+    setattr(message, name, int(value))
+
+
+def _set_float(message, name, value):
+    setattr(message, name, float(value))
+
+
+def _set_bool(message, name, value):
+    setattr(message, name, bool(value))
+
+
+def _set_timestamp(message, name, value):
+    if isinstance(value, datetime.datetime):
+        getattr(message, name).FromDatetime(value)
+    else:
+        getattr(message, name).CopyFrom(value)
+
+
+def _set_duration(message, name, value):
+    if isinstance(value, datetime.timedelta):
+        getattr(message, name).FromTimedelta(value)
+    else:
+        getattr(message, name).CopyFrom(value)
+
+
+def _set_wrapper(message, name, value):
+    getattr(message, name).value = value
+
+
+def _make_enum_setter(field_descriptor: FieldDescriptor) -> Setter:
+    values_by_name = field_descriptor.enum_type.values_by_name
+
+    def _set_enum(message, name, value):
+        if isinstance(value, str):
+            try:
+                value = values_by_name[value].number
+            except KeyError:
+                value = int(value)
+        setattr(message, name, value)
+    return _set_enum
+
+
+def _make_setter(field_descriptor: FieldDescriptor) -> Setter | None:
+    """Converter for a singular message field, ``None`` if not supported."""
+    if field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
+        return None
+    type_ = field_descriptor.type
+    if type_ == FieldDescriptor.TYPE_MESSAGE:
+        full_name = field_descriptor.message_type.full_name
+        if full_name == "google.protobuf.Timestamp":
+            return _set_timestamp
+        if full_name == "google.protobuf.Duration":
+            return _set_duration
+        if full_name in WRAPPER_TYPES:
+            return _set_wrapper
+        return None
+    if type_ == FieldDescriptor.TYPE_ENUM:
+        return _make_enum_setter(field_descriptor)
+    if type_ in STRING_TYPES:
+        return _set_string
+    if type_ in INTEGER_TYPES:
+        return _set_integer
+    if type_ in FLOAT_TYPES:
+        return _set_float
+    if type_ == FieldDescriptor.TYPE_BOOL:
+        return _set_bool
+    return None
+
+
+class MessagePlan:
+    """
+    Precomputed steps to build a message straight from an instance.
+
+    Fields whose DRF representation is the attribute value itself are
+    assigned through a converter picked from the message field descriptor
+    (timestamps, durations, wrappers, enums and scalars). Any other field
+    is represented by DRF and merged with ``parse_dict``. Oneof members
+    are assigned in declaration order, the first non null value wins.
+
+    Plans are cached per serializer class, keep them disabled for
+    serializers whose fields depend on the serializer context.
+    """
+
+    def __init__(self, serializer: BaseProtoSerializerMixin, proto_cls: type[Message]):
+        descriptor = proto_cls.DESCRIPTOR  # type: Descriptor
+        self.proto_cls = proto_cls
+        # list of (field name, setter or None, oneof name or None)
+        self.steps = []  # type: list[tuple[str, Setter | None, str | None]]
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            try:
+                field_descriptor = descriptor.fields_by_name[field.field_name]
+            except KeyError:
+                # parse_dict ignores unknown fields as well
+                continue
+            setter = None
+            if self.is_direct(field):
+                setter = _make_setter(field_descriptor)
+            oneof = field_descriptor.containing_oneof
+            self.steps.append((
+                field.field_name, setter,
+                oneof.name if oneof is not None else None))
+
+    # noinspection PyMethodMayBeStatic
+    def is_direct(self, field) -> bool:
+        if type(field) not in DIRECT_FIELD_CLASSES:
+            return False
+        if isinstance(field, fields.UUIDField):
+            return field.uuid_format in ('hex_verbose', 'int')
+        return True
+
+    def build(self, serializer: BaseProtoSerializerMixin, instance) -> Message:
+        message = self.proto_cls()
+        serializer_fields = serializer.fields
+        remaining = {}
+        oneofs_set = set()
+        for field_name, setter, oneof in self.steps:
+            if oneof is not None and oneof in oneofs_set:
+                continue
+            field = serializer_fields[field_name]
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject)
+                else attribute)
+            if check_for_none is None:
+                continue
+            if setter is None:
+                remaining[field_name] = field.to_representation(attribute)
+            else:
+                setter(message, field_name, attribute)
+            if oneof is not None:
+                oneofs_set.add(oneof)
+        if remaining:
+            parse_dict(remaining, message)
+        return message
+
+
+_plans = {}  # type: dict[tuple[type, type[Message]], MessagePlan]
+_plans_lock = threading.Lock()
+
+
+def get_message_plan(
+        serializer: BaseProtoSerializerMixin,
+        proto_cls: type[Message]) -> MessagePlan:
+    """Return the plan of the serializer class, built on first use."""
+    key = (serializer.__class__, proto_cls)
+    try:
+        return _plans[key]
+    except KeyError:
+        pass
+    with _plans_lock:
+        if (plan := _plans.get(key)) is None:
+            plan = _plans[key] = MessagePlan(serializer, proto_cls)
+    return plan
+
+
+def clear_message_plans():
+    with _plans_lock:
+        _plans.clear()
+
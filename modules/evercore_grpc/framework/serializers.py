@@ -32,6 +32,7 @@ from .fields import (
     SlugField, TimeField, URLField, UUIDField,
     BinaryField, PhoneNumberField, OneOfField,
 )
+from .plans import get_message_plan
 from .relations import (
     HyperlinkedIdentityField, HyperlinkedRelatedField, ManyRelatedField,
     PrimaryKeyRelatedField, RelatedField, SlugRelatedField, StringRelatedField,
@@ -99,6 +100,33 @@ class BaseProtoSerializerMixin(ProtoFieldMixin):
         )
         return parse_dict(data, proto_cls())
 
+    @cached_property
+    def use_message_plan(self) -> bool:
+        """
+        Whether ``message`` is built straight from the instance with a
+        compiled ``MessagePlan`` instead of ``data`` + ``parse_dict``.
+        Enabled by ``Meta.message_plan`` (defaults to the
+        ``DEFAULT_MESSAGE_PLAN`` setting) unless ``to_representation``
+        is overridden.
+        """
+        meta = getattr(self, 'Meta', None)
+        if not getattr(meta, 'message_plan', api_settings.DEFAULT_MESSAGE_PLAN):
+            return False
+        return (
+            isinstance(self, serializers.Serializer) and
+            type(self).to_representation is serializers.Serializer.to_representation
+        )
+
+    def instance_to_message(self, instance) -> Message:
+        proto_cls = self.read_proto_cls
+        # noinspection Assert
+        assert proto_cls is not None, (
+            f'Class {self.__class__.__name__} must provide '
+            f'"Meta.read_proto_class" or "Meta.proto_class" attribute '
+            f'to generate message object'
+        )
+        return get_message_plan(self, proto_cls).build(self, instance)
+
     def convert_initial_data(self):
         data = self.initial_data
         if isinstance(data, bytes):
@@ -131,7 +159,12 @@ class BaseProtoSerializerMixin(ProtoFieldMixin):
     @property
     def message(self) -> Message:
         if not hasattr(self, "_message"):
-            self._message = self.data_to_message(self.data)
+            if (self.use_message_plan and
+                    self.instance is not None and
+                    not getattr(self, '_errors', None)):
+                self._message = self.instance_to_message(self.instance)
+            else:
+                self._message = self.data_to_message(self.data)
         return self._message
 
 
@@ -1,18 +1,23 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import asyncio
 import grpc
+import inspect
+import logging
 
 from functools import update_wrapper, wraps
 
+from django.conf import settings
 from django.db.models.query import QuerySet
 
-from .signals import grpc_request_started, grpc_request_finished
+from .aio import SyncServicerContext, iterate_in_thread, run_in_thread
 
 if TYPE_CHECKING:
     pass
 
 
+logger = logging.getLogger(__name__)
 __all__ = ("Service",)
 
 
@@ -22,13 +27,7 @@ class Service:
             setattr(self, key, value)
 
     @classmethod
-    def as_servicer(cls, actions: "dict[str, str]" = None, **initkwargs):
-        """
-        Returns a gRPC servicer instance::
-
-            servicer = PostService.as_servicer()
-            add_PostControllerServicer_to_server(servicer, server)
-        """
+    def _check_initkwargs(cls, initkwargs: dict):
         for key in initkwargs:
             if not hasattr(cls, key):
                 raise TypeError(
@@ -45,34 +44,109 @@ class Service:
                 )
             cls.queryset._fetch_all = force_evaluation
 
+    @classmethod
+    def as_servicer(cls, actions: "dict[str, str]" = None, **initkwargs):
+        """
+        Returns a gRPC servicer instance::
+
+            servicer = PostService.as_servicer()
+            add_PostControllerServicer_to_server(servicer, server)
+
+        Returns ``as_async_servicer()`` when ``GRPCSERVER['async']`` is set.
+
+        Request signals and database connections are handled once per RPC
+        by ``django_grpc.signals.wrapper.SignalWrapper``, which wraps every
+        handler added to the server.
+        """
+        if getattr(settings, 'GRPCSERVER', {}).get('async', False) is True:
+            return cls.as_async_servicer(actions, **initkwargs)
+        cls._check_initkwargs(initkwargs)
+
+        def build_handler(action):
+            method = getattr(cls, action)
+
+            def handler(request, context):
+                instance = cls(**initkwargs)
+                instance.request = request
+                instance.context = context
+                instance.action = action
+                try:
+                    return method(instance, request, context)
+                except Exception:
+                    logger.exception("%s.%s failed", cls.__name__, action)
+                    raise
+
+            update_wrapper(handler, method)
+            return handler
+
+        return cls._build_servicer(actions, build_handler, not_implemented)
+
+    @classmethod
+    def as_async_servicer(cls, actions: "dict[str, str]" = None, **initkwargs):
+        """
+        Returns a ``grpc.aio`` servicer instance.
+
+        ``async def`` actions run on the event loop. Sync actions, the
+        generic mixins included, run in the bounded thread pool of
+        ``evercore_grpc.framework.aio``; sync streaming actions are iterated
+        in a single pool thread.
+        """
+        cls._check_initkwargs(initkwargs)
+
+        def build_handler(action):
+            method = getattr(cls, action)
+
+            def setup(request, context):
+                instance = cls(**initkwargs)
+                instance.request = request
+                instance.context = context
+                instance.action = action
+                return instance
+
+            if inspect.isasyncgenfunction(method):
+                async def handler(request, context):
+                    async for response in method(setup(request, context), request, context):
+                        yield response
+
+            elif inspect.iscoroutinefunction(method):
+                async def handler(request, context):
+                    return await method(setup(request, context), request, context)
+
+            elif inspect.isgeneratorfunction(method):
+                def stream(request, context):
+                    return method(setup(request, context), request, context)
+
+                async def handler(request, context):
+                    context = SyncServicerContext(context, asyncio.get_running_loop())
+                    async for response in iterate_in_thread(stream, request, context):
+                        yield response
+
+            else:
+                def call(request, context):
+                    return method(setup(request, context), request, context)
+                call = run_in_thread(call)
+
+                async def handler(request, context):
+                    context = SyncServicerContext(context, asyncio.get_running_loop())
+                    return await call(request, context)
+
+            update_wrapper(handler, method)
+            return handler
+
+        return cls._build_servicer(actions, build_handler, async_not_implemented)
+
+    @classmethod
+    def _build_servicer(cls, actions, build_handler, default):
         class Servicer:
-            def __getattr__(self, action):
+            def __getattr__(self, name):
+                action = name
                 if actions is not None:
                     action = actions.get(action, action)
 
-                if not hasattr(cls, action):
-                    return not_implemented
-
-                def handler(request, context):
-                    grpc_request_started.send(sender=handler, request=request, context=context)
-                    try:
-                        instance = cls(**initkwargs)
-                        instance.request = request
-                        instance.context = context
-                        instance.action = action
-                        try:
-                            return getattr(instance, action)(request, context)
-                        except Exception as e:
-                            import traceback
-                            import sys
-                            print("An error occurred:", file=sys.stderr)
-                            traceback.print_tb(e.__traceback__)
-                            print(f"{e.__class__.__name__}: {e}", file=sys.stderr)
-                            raise
-                    finally:
-                        grpc_request_finished.send(sender=handler)
-
-                update_wrapper(handler, getattr(cls, action))
+                handler = build_handler(action) if hasattr(cls, action) else default
+                # the handler table is filled once, while adding the
+                # servicer to the server
+                setattr(self, name, handler)
                 return handler
 
         update_wrapper(Servicer, cls, updated=())
@@ -84,3 +158,10 @@ def not_implemented(request, context):
     context.set_code(grpc.StatusCode.UNIMPLEMENTED)
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
+
+
+async def async_not_implemented(request, context):
+    """Method not implemented"""
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
@@ -1,12 +1,8 @@
-from django.dispatch import Signal
-from django.db import reset_queries, close_old_connections
+# Every RPC added to the server is wrapped by
+# django_grpc.signals.wrapper.SignalWrapper, which sends these signals and
+# manages the db connection state like the wsgi handler. Services share
+# them rather than sending a second pair per RPC.
+from django_grpc.signals import grpc_request_started, grpc_request_finished
 
 
-grpc_request_started = Signal()
-grpc_request_finished = Signal()
-
-
-# db connection state managed similarly to the wsgi handler
-grpc_request_started.connect(reset_queries)
-grpc_request_started.connect(close_old_connections)
-grpc_request_finished.connect(close_old_connections)
+__all__ = ("grpc_request_started", "grpc_request_finished")
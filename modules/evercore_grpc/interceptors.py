@@ -1,7 +1,12 @@
+import logging
+
 import grpc
 from grpc import StatusCode
 
 
+logger = logging.getLogger(__name__)
+
+
 # Interceptor to catch unimplemented methods
 class UnimplementedInterceptor(grpc.ServerInterceptor):
     def intercept_service(self, continuation, handler_call_details):
@@ -12,7 +17,22 @@ class UnimplementedInterceptor(grpc.ServerInterceptor):
                 method_name = handler_call_details.method
                 context.set_code(StatusCode.UNIMPLEMENTED)
                 context.set_details(f'Method {method_name} is not implemented.')
-                print(f"Unimplemented method called: {method_name}")
+                logger.warning("Unimplemented method called: %s", method_name)
+                return None
+            return grpc.unary_unary_rpc_method_handler(unimplemented_handler)
+        return handler
+
+
+# grpc.aio counterpart of UnimplementedInterceptor
+class AsyncUnimplementedInterceptor(grpc.aio.ServerInterceptor):
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            async def unimplemented_handler(request, context):
+                method_name = handler_call_details.method
+                context.set_code(StatusCode.UNIMPLEMENTED)
+                context.set_details(f'Method {method_name} is not implemented.')
+                logger.warning("Unimplemented method called: %s", method_name)
                 return None
             return grpc.unary_unary_rpc_method_handler(unimplemented_handler)
         return handler
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = ('Benchmark model -> message conversion of a serializer, '
+            'dict + parse_dict path against the compiled message plan')
+
+    def add_arguments(self, parser):
+        parser.add_argument('serializer', help="Dotted path of a ModelSerializer class")
+        parser.add_argument('--count', type=int, default=100, help="Number of instances to load")
+        parser.add_argument('--iterations', type=int, default=10, help="Rounds over the loaded instances")
+
+    def handle(self, *args, serializer, count, iterations, **options):
+        serializer_class = import_string(serializer)
+        try:
+            model = serializer_class.Meta.model
+        except AttributeError:
+            raise CommandError("%s has no Meta.model" % serializer)
+        instances = list(model._default_manager.all()[:count])
+        if not instances:
+            raise CommandError("no %s instances to serialize" % model.__name__)
+
+        def message_with_plan(instance, enabled):
+            obj = serializer_class(instance)
+            obj.use_message_plan = enabled
+            return obj.message
+
+        results = {}
+        for label, enabled in (('dict', False), ('plan', True)):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                for instance in instances:
+                    message_with_plan(instance, enabled)
+            elapsed = time.perf_counter() - start
+            total = iterations * len(instances)
+            results[label] = total / elapsed
+            self.stdout.write("%-6s %10.1f msg/s  (%d messages in %.3fs)" % (
+                label, results[label], total, elapsed))
+
+        for instance in instances:
+            if message_with_plan(instance, False) != message_with_plan(instance, True):
+                self.stderr.write("message mismatch for %s pk=%s" % (model.__name__, instance.pk))
+        self.stdout.write("plan vs dict: %.1fx" % (results['plan'] / results['dict']))
@@ -44,6 +44,20 @@ DEFAULTS = {
 
     # Pagination
     'PAGE_SIZE': None,
+    'MAX_PAGE_SIZE': None,
+    'PAGE_SIZE_METADATA_KEY': 'x-page-size',
+    'PAGE_TOKEN_METADATA_KEY': 'x-page-token',
+    'NEXT_PAGE_TOKEN_METADATA_KEY': 'x-next-page-token',
+
+    # Serialization
+    'DEFAULT_MESSAGE_PLAN': False,
+
+    # Streaming
+    'LIST_CHUNK_SIZE': 100,
+
+    # Async servicers
+    'ASYNC_THREAD_POOL_SIZE': 32,
+    'ASYNC_STREAM_BUFFER_SIZE': 16,
 
     # Filtering
     'SEARCH_PARAM': 'search',
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import hashlib
+import threading
+import time
+
+from collections import OrderedDict
+
+from evercore_jwt.settings import jwt_settings
+
+from .settings import jwt_auth_settings
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+    from .tokens import Token
+
+
+__all__ = ("VerifiedTokenCache", "verified_token_cache")
+
+
+class VerifiedTokenCache:
+    """
+    Size bounded, in-process cache of tokens whose signature and claims
+    were already verified.
+
+    Entries are keyed by token class and a digest of the raw token and
+    hold the decoded payload until the token's expiration time. A cache
+    hit only re-checks time based claims. Disabled while
+    ``VERIFIED_TOKEN_CACHE_SIZE`` is falsy.
+    """
+
+    def __init__(self, maxsize: int = None):
+        self._maxsize = maxsize
+        self._entries = OrderedDict()  # type: OrderedDict[tuple, tuple[float, dict[str, Any]]]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            return jwt_auth_settings.VERIFIED_TOKEN_CACHE_SIZE or 0
+        return self._maxsize
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    # noinspection PyMethodMayBeStatic
+    def make_key(self, token_class: type[Token], raw_token: str | bytes) -> tuple:
+        if isinstance(raw_token, str):
+            raw_token = raw_token.encode()
+        return token_class, hashlib.sha256(raw_token).digest()
+
+    def _get(self, key: tuple) -> dict[str, Any] | None:
+        with self._lock:
+            try:
+                expires, payload = self._entries[key]
+            except KeyError:
+                return None
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _set(self, key: tuple, expires: float, payload: dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (expires, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_token(
+            self, token_class: type[Token], raw_token: str | bytes, *,
+            verify: Callable[[], Token] = None) -> Token:
+        """
+        Return a validated token, verifying it with ``verify``
+        (defaults to ``token_class(raw_token)``) on cache miss.
+        """
+        if verify is None:
+            def verify():
+                return token_class(raw_token)
+
+        if not self.enabled:
+            return verify()
+
+        start = time.perf_counter()
+        key = self.make_key(token_class, raw_token)
+        if (payload := self._get(key)) is not None:
+            try:
+                return token_class.from_verified_payload(raw_token, payload)
+            finally:
+                self.hits += 1
+                self.hit_seconds += time.perf_counter() - start
+
+        try:
+            token = verify()
+        finally:
+            self.misses += 1
+            self.miss_seconds += time.perf_counter() - start
+        try:
+            expires = float(token.payload[jwt_settings.EXPIRATION_CLAIM])
+        except (KeyError, TypeError, ValueError):
+            # never cache tokens without a usable expiration
+            return token
+        self._set(key, expires, token.payload.copy())
+        return token
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.hit_seconds = 0.0
+            self.miss_seconds = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters and mean verify-path latency (seconds) per outcome."""
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": size,
+            "maxsize": self.maxsize,
+            "hit_latency": self.hit_seconds / self.hits if self.hits else None,
+            "miss_latency": self.miss_seconds / self.misses if self.misses else None,
+        }
+
+
+verified_token_cache = VerifiedTokenCache()
@@ -10,6 +10,7 @@ from rest_framework.request import Request
 from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
 from rest_framework_simplejwt.models import TokenUser
 
+from ..cache import verified_token_cache
 from ..settings import jwt_auth_settings
 # from ..utils import get_md5_hash_password
 
@@ -116,7 +117,7 @@ class JWTAuthentication(authentication.BaseAuthentication):
         messages = []
         for AuthToken in self.get_auth_token_classes():
             try:
-                return AuthToken(raw_token)
+                return verified_token_cache.get_token(AuthToken, raw_token)
             except TokenError as e:
                 messages.append(
                     {
@@ -65,6 +65,8 @@ DEFAULTS = {
     "USER_ID_CLAIM": "sub",
     "USER_ID_FIELD": "id",
     "TOKEN_USER_CLASS": "evercore_jwt_auth.models.TokenUser",
+    # opt-in in-process cache of verified tokens, 0 to disable
+    "VERIFIED_TOKEN_CACHE_SIZE": 0,
 }
 
 MANDATORY = (
@@ -97,6 +97,29 @@ class Token:
             # Set "jti" claim
             self.set_jti()
 
+    @classmethod
+    def from_verified_payload(
+            cls, token: "Optional[str, bytes]", payload: "Payload", *,
+            current_time: datetime = None) -> "Token":
+        """
+        Build a token from a payload which signature and claims were
+        already verified. Only time based claims are checked again.
+        """
+        self = cls.__new__(cls)
+        self.token = token
+        self.current_time = (
+            make_utc(current_time)
+            if current_time is not None else
+            aware_utcnow()
+        )
+        self.payload = payload.copy()
+        self._check_expiration(jwt_settings.EXPIRATION_CLAIM)
+        self._check_maturity(
+            jwt_settings.NOT_BEFORE_CLAIM, skip_key_error=True)
+        self._check_maturity(
+            jwt_settings.ISSUED_AT_CLAIM, skip_key_error=True)
+        return self
+
     def __repr__(self) -> str:
         return repr(self.payload)
 
@@ -12,7 +12,22 @@ if TYPE_CHECKING:
 __all__ = ("integration_settings",)
 
 
-DEFAULTS = {}
+DEFAULTS = {
+    "CHANNEL_OPTIONS": (
+        ("grpc.keepalive_time_ms", 60 * 1000),  # 60 seconds
+        ("grpc.keepalive_timeout_ms", 20 * 1000),  # 20 seconds
+        ("grpc.keepalive_permit_without_calls", 0),
+    ),
+    # grpc `retryPolicy` service config, e.g.
+    # {"maxAttempts": 3, "initialBackoff": "0.1s", "maxBackoff": "1s",
+    #  "backoffMultiplier": 2, "retryableStatusCodes": ["UNAVAILABLE"]}
+    "CHANNEL_RETRY_POLICY": None,
+    # channels kept per process, least recently used ones are dropped
+    "CHANNEL_REGISTRY_SIZE": 64,
+    # protobuf task bodies below this size (bytes) are sent uncompressed
+    "TASK_COMPRESSION_THRESHOLD": 1024,
+    "TASK_COMPRESSION": "gzip",
+}
 
 
 REQUIRED = (
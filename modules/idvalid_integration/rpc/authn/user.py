@@ -16,6 +16,7 @@ from idvalid_integration.protos.models.authn_pb2 import (
 from idvalid_integration.protos.authn.user_pb2_grpc import (
     UserStub
 )
+from idvalid_integration.rpc.channels import get_stub
 from idvalid_integration.rpc.decorators import auto_channel
 
 if TYPE_CHECKING:
@@ -42,7 +43,7 @@ def create(
         channel: grpc.Channel, *,
         message: CreateRequest
 ) -> CreateResponse:
-    stub = UserStub(channel)
+    stub = get_stub(channel, UserStub)
     try:
         return stub.Create(message)
     except grpc.RpcError:
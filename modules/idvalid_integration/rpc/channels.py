@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import atexit
+import json
+import logging
+import os
+import threading
+
+from collections import OrderedDict
+from functools import lru_cache
+
+import grpc
+
+from idvalid_integration._settings import integration_settings
+
+if TYPE_CHECKING:
+    from typing import Any, Hashable, TypeVar
+    StubT = TypeVar("StubT")
+
+
+logger = logging.getLogger(__name__)
+__all__ = (
+    "ssl_channel_credentials",
+    "ChannelRegistry", "channel_registry", "get_stub", "close_all",
+)
+
+
+def build_channel_options(options: tuple = None) -> tuple:
+    """Merge default channel options, retry policy and caller options.
+
+    Caller options take precedence over the configured defaults.
+    """
+    merged = dict(integration_settings.CHANNEL_OPTIONS or ())
+    if (retry_policy := integration_settings.CHANNEL_RETRY_POLICY) is not None:
+        merged["grpc.enable_retries"] = 1
+        merged["grpc.service_config"] = json.dumps({
+            "methodConfig": [{
+                "name": [{}],
+                "retryPolicy": retry_policy,
+            }]
+        })
+    if options:
+        merged.update(options)
+    return tuple(merged.items())
+
+
+@lru_cache(maxsize=16)
+def ssl_channel_credentials(
+        root_certificates: bytes = None,
+        private_key: bytes = None,
+        certificate_chain: bytes = None) -> grpc.ChannelCredentials:
+    """``grpc.ssl_channel_credentials`` returning one object per certificates.
+
+    Credentials objects have no value equality, the registry only reuses a
+    channel for the very same object.
+    """
+    return grpc.ssl_channel_credentials(
+        root_certificates, private_key, certificate_chain)
+
+
+class ChannelRegistry:
+    """Per process registry of long-lived gRPC channels and their stubs.
+
+    Channels are keyed by ``(setting name, credentials, options,
+    compression)`` and reused by every call in the process, credentials
+    match by identity (see ``ssl_channel_credentials``). At most
+    ``CHANNEL_REGISTRY_SIZE`` channels are kept, the least recently used
+    one is dropped and closed by gRPC once its last call released it.
+    gRPC channels can't be used across ``fork()``, so a child process
+    (celery prefork, gunicorn workers) starts with an empty registry.
+    """
+
+    def __init__(self):
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        # channels inherited from the parent are unusable,
+        # drop them without closing
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._channels = OrderedDict()  # type: OrderedDict[Hashable, grpc.Channel]
+        self._stubs = {}  # type: dict[grpc.Channel, dict[type, Any]]
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            self._reset()
+
+    def get_channel(
+            self, setting_name: str, *,
+            credentials: grpc.ChannelCredentials = None,
+            options: tuple = None,
+            compression: grpc.Compression = None) -> grpc.Channel:
+        self._check_pid()
+        if options is not None:
+            options = tuple(options)
+        key = (setting_name, credentials, options, compression)
+        with self._lock:
+            if (channel := self._channels.get(key)) is not None:
+                self._channels.move_to_end(key)
+                return channel
+            target = getattr(integration_settings, setting_name)
+            channel_options = build_channel_options(options)
+            if credentials:
+                channel = grpc.secure_channel(
+                    target, credentials,
+                    options=channel_options, compression=compression)
+            else:
+                channel = grpc.insecure_channel(
+                    target,
+                    options=channel_options, compression=compression)
+            logger.debug("open grpc channel to %s (%s)", target, setting_name)
+            self._stubs[channel] = {}
+            self._channels[key] = channel
+            while len(self._channels) > integration_settings.CHANNEL_REGISTRY_SIZE:
+                # not closed, calls in flight keep using it
+                _, dropped = self._channels.popitem(last=False)
+                self._stubs.pop(dropped, None)
+                logger.warning(
+                    "grpc channel registry is full, dropped a channel; "
+                    "reuse credentials objects across calls")
+        return channel
+
+    def get_stub(self, channel: grpc.Channel, stub_class: type[StubT]) -> StubT:
+        try:
+            stubs = self._stubs[channel]
+        except KeyError:
+            # channel not owned by the registry
+            return stub_class(channel)
+        try:
+            return stubs[stub_class]
+        except KeyError:
+            stub = stubs[stub_class] = stub_class(channel)
+            return stub
+
+    def close_all(self):
+        with self._lock:
+            channels = list(self._channels.values())
+            self._channels.clear()
+            self._stubs.clear()
+        for channel in channels:
+            try:
+                channel.close()
+            except Exception:  # noqa
+                logger.exception("failed to close grpc channel")
+
+
+channel_registry = ChannelRegistry()
+
+
+def get_stub(channel: grpc.Channel, stub_class: type[StubT]) -> StubT:
+    return channel_registry.get_stub(channel, stub_class)
+
+
+def close_all():
+    channel_registry.close_all()
+
+
+atexit.register(close_all)
@@ -20,6 +20,7 @@ from idvalid_integration.protos.cryptography.asymmetric.key_pb2 import (
 from idvalid_integration.protos.cryptography.asymmetric.key_pb2_grpc import (
     KeyStub
 )
+from idvalid_integration.rpc.channels import get_stub
 from idvalid_integration.rpc.decorators import auto_channel
 
 if TYPE_CHECKING:
@@ -53,7 +54,7 @@ def generate(
         channel: grpc.Channel,
         message: GenerateRequest,
 ) -> GenerateResponse:
-    stub = KeyStub(channel)
+    stub = get_stub(channel, KeyStub)
     try:
         logger.debug("send grpc request")
         return stub.Generate(message)
@@ -66,7 +67,7 @@ def sign(
         channel: grpc.Channel,
         message: SignRequest
 ) -> SignResponse:
-    stub = KeyStub(channel)
+    stub = get_stub(channel, KeyStub)
     try:
         return stub.Sign(message)
     except grpc.RpcError:
@@ -78,7 +79,7 @@ def verify(
         channel: grpc.Channel,
         message: VerifyRequest
 ) -> VerifyResponse:
-    stub = KeyStub(channel)
+    stub = get_stub(channel, KeyStub)
     try:
         return stub.Verify(message)
     except grpc.RpcError:
@@ -7,7 +7,7 @@ import grpc
 
 from functools import wraps
 
-from idvalid_integration._settings import integration_settings
+from idvalid_integration.rpc.channels import channel_registry
 
 if TYPE_CHECKING:
     pass
@@ -29,15 +29,11 @@ def auto_channel(*, setting_name):
                 **kwargs):
             if channel:
                 return func(channel, *args, **kwargs)
-            if credentials:
-                channel = grpc.secure_channel(
-                    getattr(integration_settings, setting_name), credentials,
-                    options=options, compression=compression)
-            else:
-                channel = grpc.insecure_channel(
-                    getattr(integration_settings, setting_name),
-                    options=options, compression=compression)
-            with channel:
-                return func(channel, *args, **kwargs)
+            channel = channel_registry.get_channel(
+                setting_name,
+                credentials=credentials,
+                options=options,
+                compression=compression)
+            return func(channel, *args, **kwargs)
         return wrapper
     return handle
@@ -15,6 +15,7 @@ from idvalid_integration.protos.enrollment.enrollment_pb2 import (
 from idvalid_integration.protos.enrollment.enrollment_pb2_grpc import (
     EnrollmentStub
 )
+from idvalid_integration.rpc.channels import get_stub
 from idvalid_integration.rpc.decorators import auto_channel
 
 if TYPE_CHECKING:
@@ -43,7 +44,7 @@ def get_email(
         channel: grpc.Channel, *,
         message: GetEmailRequest
 ) -> GetEmailResponse:
-    stub = EnrollmentStub(channel)
+    stub = get_stub(channel, EnrollmentStub)
     try:
         return stub.GetEmail(message)
     except grpc.RpcError:
@@ -55,7 +56,7 @@ def confirm(
         channel: grpc.Channel, *,
         message: ConfirmRequest,
 ) -> ConfirmResponse:
-    stub = EnrollmentStub(channel)
+    stub = get_stub(channel, EnrollmentStub)
     try:
         return stub.Confirm(message)
     except grpc.RpcError:
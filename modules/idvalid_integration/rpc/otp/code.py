@@ -15,6 +15,7 @@ from idvalid_integration.protos.otp.code_pb2 import (
 from idvalid_integration.protos.otp.code_pb2_grpc import (
     CodeStub
 )
+from idvalid_integration.rpc.channels import get_stub
 from idvalid_integration.rpc.decorators import auto_channel
 
 if TYPE_CHECKING:
@@ -43,7 +44,7 @@ def create(
         channel: grpc.Channel, *,
         message: CreateRequest,
 ) -> CreateResponse:
-    stub = CodeStub(channel)
+    stub = get_stub(channel, CodeStub)
     try:
         return stub.Create(message)
     except grpc.RpcError:
@@ -55,7 +56,7 @@ def confirm(
         channel: grpc.Channel, *,
         message: ConfirmRequest
 ) -> ConfirmResponse:
-    stub = CodeStub(channel)
+    stub = get_stub(channel, CodeStub)
     try:
         return stub.Confirm(message)
     except grpc.RpcError:
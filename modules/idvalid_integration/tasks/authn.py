@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import logging
 
 from idvalid_integration.tasks import constants, call_task
+from idvalid_integration.tasks.serialization import protobuf_task_options
 
 if TYPE_CHECKING:
     from celery import Celery
@@ -36,11 +37,10 @@ def session_revoke(
     return call_task(
         constants.TASK_EXTERNAL_AUTH_SESSION_REVOKE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.Session message",
         exchange=constants.EXCHANGE_AUTH,
         routing_key=constants.ROUTING_AUTH_EXTERNAL,
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_user_logged_in(
@@ -50,11 +50,10 @@ def publish_user_logged_in(
     return call_task(
         constants.TASK_CONSUME_AUTH_USER_LOGGED_IN,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.UserLoggedIn message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=f"{constants.ROUTING_AUTH_PUBLISH_PREFIX}.logged-in",
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_platform_create(
@@ -64,12 +63,11 @@ def publish_platform_create(
     return call_task(
         constants.TASK_CONSUME_AUTH_PLATFORM_CREATE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.Platform message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=(
             f"{constants.ROUTING_AUTH_PLATFORM_PUBLISH_PREFIX}.create"),
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_platform_update(
@@ -79,12 +77,11 @@ def publish_platform_update(
     return call_task(
         constants.TASK_CONSUME_AUTH_PLATFORM_UPDATE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.Platform message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=(
             f"{constants.ROUTING_AUTH_PLATFORM_PUBLISH_PREFIX}.update"),
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_platform_delete(
@@ -94,12 +91,11 @@ def publish_platform_delete(
     return call_task(
         constants.TASK_CONSUME_AUTH_PLATFORM_DELETE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.Platform message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=(
             f"{constants.ROUTING_AUTH_PLATFORM_PUBLISH_PREFIX}.delete"),
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_session_create(
@@ -109,12 +105,11 @@ def publish_session_create(
     return call_task(
         constants.TASK_CONSUME_AUTH_SESSION_CREATE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.Session message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=(
             f"{constants.ROUTING_AUTH_SESSION_PUBLISH_PREFIX}.create"),
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_session_delete(
@@ -124,12 +119,11 @@ def publish_session_delete(
     return call_task(
         constants.TASK_CONSUME_AUTH_SESSION_DELETE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.Session message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=(
             f"{constants.ROUTING_AUTH_SESSION_PUBLISH_PREFIX}.delete"),
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_account_create(
@@ -139,12 +133,11 @@ def publish_account_create(
     return call_task(
         constants.TASK_CONSUME_AUTH_ACCOUNT_CREATE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.Account message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=(
             f"{constants.ROUTING_AUTH_ACCOUNT_PUBLISH_PREFIX}.create"),
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_user_active_flag(
@@ -154,12 +147,11 @@ def publish_user_active_flag(
     return call_task(
         constants.TASK_CONSUME_AUTH_USER_ACTIVE_FLAG,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.UserActiveFlag message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=(
             f"{constants.ROUTING_AUTH_USER_PUBLISH_PREFIX}.active-flag"),
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_profile_update(
@@ -169,9 +161,8 @@ def publish_profile_update(
     return call_task(
         constants.TASK_CONSUME_AUTH_PROFILE_UPDATE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="authn_pb2.UserProfile message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=(
             f"{constants.ROUTING_AUTH_PROFILE_PUBLISH_PREFIX}.update"),
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
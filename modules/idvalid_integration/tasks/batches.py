@@ -0,0 +1,313 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+
+import logging
+import threading
+
+from django.db import InterfaceError, OperationalError, close_old_connections, transaction
+
+from celery import Task
+from celery.utils.time import timezone
+from celery.worker.request import create_request_cls
+from celery.worker.strategy import hybrid_to_proto2, proto1_to_proto2
+from kombu.asynchronous.timer import to_timestamp
+from kombu.utils.imports import symbol_by_name
+
+from .utils import collapse
+
+if TYPE_CHECKING:
+    from typing import Any, TypeVar
+    from google.protobuf.message import Message
+    from celery import Celery
+    from celery.worker.consumer import Consumer
+    from celery.worker.request import Request
+    M = TypeVar("M", bound=Message)
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("BatchRequest", "BatchTask", "collapse", "decode_messages")
+
+
+# the database or broker is unavailable, not the message: run it again
+INFRASTRUCTURE_ERRORS = (OperationalError, InterfaceError, ConnectionError)
+
+
+class BatchRequest(NamedTuple):
+    id: str
+    args: tuple
+    kwargs: dict
+
+
+def decode_messages(
+        requests: list[BatchRequest], message_class: type[M]) -> list[M]:
+    """Protobuf messages of consumer requests, sent as their only argument."""
+    return [message_class.FromString(request.args[0]) for request in requests]
+
+
+def _run_segments(segments: list[tuple[BatchTask, list[BatchRequest]]]):
+    with transaction.atomic():
+        for task, requests in segments:
+            task.run(requests)
+
+
+def apply_batch(
+        segments: list[tuple[BatchTask, list[BatchRequest]]]
+) -> tuple[list[str], list[str]]:
+    """
+    Run the batch in the worker pool, return the ids of failed requests
+    and of requests to requeue.
+
+    Tasks run outside celery's task tracing, broken or obsolete database
+    connections are closed around the batch as the django fixup does
+    around a task.
+    """
+    close_old_connections()
+    try:
+        return _apply_batch(segments)
+    finally:
+        close_old_connections()
+
+
+def _apply_batch(
+        segments: list[tuple[BatchTask, list[BatchRequest]]]
+) -> tuple[list[str], list[str]]:
+    """
+    The whole batch runs in one transaction. When it fails every request
+    is retried on its own, so a single bad message does not take the rest
+    of the batch down. Requests failing on ``INFRASTRUCTURE_ERRORS`` are
+    requeued, the whole batch when the batch itself hit one.
+
+    Batches of tasks that are not ``atomic`` run once outside a
+    transaction, their requests all fail when it raises.
+    """
+    names = ", ".join(sorted({task.name for task, _ in segments}))
+    if not all(task.atomic for task, _ in segments):
+        try:
+            for task, requests in segments:
+                task.run(requests)
+            return [], []
+        except Exception:
+            logger.exception("batch of %s failed", names)
+            return [request.id for _, requests in segments for request in requests], []
+
+    try:
+        _run_segments(segments)
+        return [], []
+    except INFRASTRUCTURE_ERRORS:
+        logger.warning("batch of %s failed, requeueing", names, exc_info=True)
+        return [], [request.id for _, requests in segments for request in requests]
+    except Exception:
+        logger.warning("batch of %s failed, retrying one by one", names, exc_info=True)
+
+    failed, retry = [], []
+    for task, requests in segments:
+        for request in requests:
+            try:
+                _run_segments([(task, [request])])
+            except INFRASTRUCTURE_ERRORS:
+                logger.warning("batch task %s failed, requeueing", task.name, exc_info=True)
+                retry.append(request.id)
+            except Exception:
+                logger.exception("batch task %s failed", task.name)
+                failed.append(request.id)
+    return failed, retry
+
+
+class _Buffer:
+    def __init__(
+            self, name: str, flush_every: int, flush_interval: float,
+            requeue_delay: float, requeue_max_delay: float):
+        self.name = name
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.requeue_delay = requeue_delay
+        self.requeue_max_delay = requeue_max_delay
+        self.requests = []  # type: list[Request]
+        self.timer = None
+        self.pool = None
+        self.scheduler = None
+        self.running = False
+        # consecutive requeued batches
+        self.failures = 0
+        # pool callbacks may run in pool threads, or inline in the solo pool
+        self._lock = threading.RLock()
+
+    def add(self, request: Request, consumer: Consumer):
+        with self._lock:
+            self.requests.append(request)
+            if self.timer is None:
+                self.timer = consumer.timer.call_repeatedly(
+                    self.flush_interval, self.flush)
+            full = len(self.requests) >= self.flush_every
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self.running:
+                # one batch of the group at a time, messages received
+                # meanwhile are flushed once it returned
+                return
+            requests, self.requests = self.requests, []
+            if not requests:
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+                return
+            self.running = True
+
+        # consecutive requests of a task run together, keeping the order
+        # between tasks sharing the buffer
+        segments = []  # type: list[tuple[BatchTask, list[BatchRequest]]]
+        for request in requests:
+            if not segments or segments[-1][0] is not request.task:
+                segments.append((request.task, []))
+            segments[-1][1].append(
+                BatchRequest(request.id, request.args, request.kwargs))
+
+        def requeue(retry: list[Request]):
+            # kept unacknowledged in the worker and run again ahead of the
+            # messages received meanwhile, the group waits until then
+            with self._lock:
+                self.requests[:0] = retry
+                delay = min(
+                    self.requeue_max_delay,
+                    self.requeue_delay * 2 ** self.failures)
+                self.failures += 1
+            logger.warning(
+                "batch %s requeued, running again in %.1f seconds", self.name, delay)
+            self.scheduler.call_after(delay, done)
+
+        def done():
+            with self._lock:
+                self.running = False
+                pending = bool(self.requests)
+            if pending:
+                self.flush()
+
+        def on_return(result: tuple[list[str], list[str]]):
+            failed, retry = set(result[0]), set(result[1])
+            for request in requests:
+                if request.id in failed:
+                    request.reject(requeue=False)
+                elif request.id not in retry:
+                    request.acknowledge()
+            if retry:
+                requeue([request for request in requests if request.id in retry])
+                return
+            with self._lock:
+                self.failures = 0
+            done()
+
+        def on_error(exc: Any):
+            logger.error("batch %s could not run: %r", self.name, exc)
+            requeue(requests)
+
+        self.pool.apply_async(
+            apply_batch, (segments,),
+            callback=on_return,
+            error_callback=on_error)
+
+
+_buffers = {}  # type: dict[str, _Buffer]
+
+
+class BatchTask(Task):
+    """
+    Task buffering its messages in the worker and running them together.
+
+    The task function receives a list of ``BatchRequest`` once
+    ``flush_every`` messages were received or ``flush_interval`` seconds
+    passed. Tasks with the same ``batch_group`` share one buffer, their
+    batches run one at a time in the order the messages arrived, messages
+    received while a batch runs form the next one. A flush runs in one
+    transaction and its messages are acknowledged after commit. Messages
+    failing on a database or connection error stay in the worker and run
+    again after ``requeue_delay`` seconds, doubled for every consecutive
+    failure up to ``requeue_max_delay``; the group waits meanwhile. Other
+    failed messages are rejected without requeue (dead-lettered when the
+    queue has a dead letter exchange).
+
+    Tasks that are not ``atomic`` run without a transaction and their
+    batch is not retried: when it raises, its messages are rejected.
+
+    Messages with an ETA (``countdown``) join the buffer when they are due.
+
+    Keep the worker prefetch (``worker_prefetch_multiplier`` times the
+    concurrency) at or above ``flush_every``, otherwise batches are only
+    flushed by the interval, and enable ``task_acks_late``: the messages
+    are only acknowledged once their batch returned.
+    """
+    flush_every = 100
+    flush_interval = 1.0  # seconds
+    batch_group = None  # type: str | None
+    requeue_delay = 1.0  # seconds
+    requeue_max_delay = 60.0  # seconds
+    # tasks with side effects outside the database (HTTP calls, ...) set
+    # it to False, their batches are never replayed
+    atomic = True
+
+    def __call__(self, *args, **kwargs):
+        # direct and eager calls run a batch of one
+        if args and isinstance(args[0], list):
+            return super().__call__(*args, **kwargs)
+        return super().__call__([BatchRequest("", args, kwargs)])
+
+    def get_buffer(self) -> _Buffer:
+        name = self.batch_group or self.name
+        if (buffer := _buffers.get(name)) is None:
+            buffer = _buffers[name] = _Buffer(
+                name, self.flush_every, self.flush_interval,
+                self.requeue_delay, self.requeue_max_delay)
+        else:
+            buffer.flush_every = min(buffer.flush_every, self.flush_every)
+            buffer.flush_interval = min(buffer.flush_interval, self.flush_interval)
+            buffer.requeue_delay = min(buffer.requeue_delay, self.requeue_delay)
+            buffer.requeue_max_delay = min(buffer.requeue_max_delay, self.requeue_max_delay)
+        return buffer
+
+    def Strategy(self, task: BatchTask, app: Celery, consumer: Consumer):
+        buffer = self.get_buffer()
+        buffer.pool = consumer.pool
+        buffer.scheduler = consumer.timer
+        hostname = consumer.hostname
+        eventer = consumer.event_dispatcher
+        connection_errors = consumer.connection_errors
+        call_at = consumer.timer.call_at
+        Req = create_request_cls(
+            symbol_by_name(task.Request), task, consumer.pool,
+            hostname, eventer, app=app)
+
+        def task_message_handler(message, body, ack, reject, callbacks, **kwargs):
+            if body is None and "args" not in message.payload:
+                body, headers, decoded, utc = (
+                    message.body, message.headers, False,
+                    app.uses_utc_timezone())
+            elif "args" in message.payload:
+                body, headers, decoded, utc = hybrid_to_proto2(
+                    message, message.payload)
+            else:
+                body, headers, decoded, utc = proto1_to_proto2(message, body)
+
+            req = Req(
+                message,
+                on_ack=ack, on_reject=reject, app=app, hostname=hostname,
+                eventer=eventer, task=task, connection_errors=connection_errors,
+                body=body, headers=headers, decoded=decoded, utc=utc
+            )
+            if req.eta:
+                if req.utc:
+                    eta = to_timestamp(timezone.to_system(req.eta))
+                else:
+                    eta = to_timestamp(req.eta, app.timezone)
+                # held back messages do not count against the prefetch
+                consumer.qos.increment_eventually()
+                call_at(eta, add_due, (req,), priority=6)
+            else:
+                buffer.add(req, consumer)
+
+        def add_due(req: Request):
+            consumer.qos.decrement_eventually()
+            buffer.add(req, consumer)
+
+        return task_message_handler
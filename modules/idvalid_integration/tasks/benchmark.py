@@ -0,0 +1,99 @@
+"""
+Compare protobuf task payloads, msgpack + gzip against the protobuf
+serializer::
+
+    python -m idvalid_integration.tasks.benchmark --iterations 100000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from kombu import compression
+from kombu.serialization import dumps, loads
+
+from idvalid_integration.protos.models import authn_pb2
+from idvalid_integration.tasks import serialization
+
+
+EMBED = {"callbacks": None, "errbacks": None, "chain": None, "chord": None}
+
+
+def sample_messages() -> dict:
+    return {
+        "UserLoggedIn": authn_pb2.UserLoggedIn(
+            user_id=1024,
+            platform_id=3,
+            device_id="4f2b1c0e9a7d4c1b8e6f3a2d5c7b9e01",
+            user_agent=(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/124.0.0.0 Safari/537.36"),
+            session_id=88211,
+            ip_address="203.0.113.7"),
+        "Account": authn_pb2.Account(
+            user=authn_pb2.User(
+                id=1024, subid="usr_01HZX3K8Q2", is_active=True),
+            profile=authn_pb2.UserProfile(user_id=1024, name="Jane Doe")),
+        "UserActiveFlag": authn_pb2.UserActiveFlag(user_id=1024, is_active=False),
+    }
+
+
+def encode(data: bytes, serializer: str, compress: str | None):
+    content_type, content_encoding, body = dumps(((data,), {}, EMBED), serializer)
+    if compress:
+        body, compress_type = compression.compress(body, compress)
+    else:
+        compress_type = None
+    return body, content_type, content_encoding, compress_type
+
+
+def decode(body, content_type, content_encoding, compress_type, message_cls):
+    if compress_type:
+        body = compression.decompress(body, compress_type)
+    (data,), _, _ = loads(
+        body, content_type, content_encoding, accept=[content_type])
+    return message_cls.FromString(data)
+
+
+def run(name: str, message, iterations: int, threshold: int):
+    data = message.SerializeToString(deterministic=True)
+    paths = {
+        "msgpack+gzip": ("msgpack", "gzip"),
+        "protobuf": (
+            serialization.PROTOBUF_SERIALIZER,
+            "gzip" if len(data) >= threshold else None),
+    }
+    print("%s (%d bytes serialized)" % (name, len(data)))
+    for label, (serializer, compress) in paths.items():
+        start = time.perf_counter()
+        for _ in range(iterations):
+            encoded = encode(data, serializer, compress)
+        encode_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            decoded = decode(*encoded, type(message))
+        decode_time = time.perf_counter() - start
+        assert decoded == message
+
+        print("  %-13s encode %6.2f us  decode %6.2f us  body %4d bytes" % (
+            label,
+            encode_time / iterations * 1e6,
+            decode_time / iterations * 1e6,
+            len(encoded[0])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument(
+        "--threshold", type=int, default=1024,
+        help="compression threshold of the protobuf path (bytes)")
+    options = parser.parse_args()
+    for name, message in sample_messages().items():
+        run(name, message, options.iterations, options.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -79,6 +79,9 @@ EXCHANGE_DEVICE = "idvalid.device"
 EXCHANGE_OAUTH = "idvalid.oauth"
 
 
+EXCHANGE_FIREBASE = "idvalid.firebase"
+
+
 EXCHANGE_TENANT = "idvalid.tenant"
 
 
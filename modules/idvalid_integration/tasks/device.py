@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import logging
 
 from idvalid_integration.tasks import constants, call_task
+from idvalid_integration.tasks.serialization import protobuf_task_options
 
 if TYPE_CHECKING:
     from celery import Celery
@@ -21,8 +22,7 @@ def publish_device_delete(
     return call_task(
         constants.TASK_CONSUME_DEVICE_DELETE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="device_pb2.Device message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=f"{constants.ROUTING_DEVICE_PUBLISH_PREFIX}.revoke",
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import logging
 
 from idvalid_integration.tasks import constants, call_task
+from idvalid_integration.tasks.serialization import protobuf_task_options
 
 if TYPE_CHECKING:
     from celery import Celery
@@ -20,8 +21,7 @@ def publish(message: enrollment_pb2.Enrollment, *,
     return call_task(
         constants.TASK_CONSUME_ENROLLMENT_PUBLISH,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="enrollment_pb2.Enrollment message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=constants.ROUTING_ENROLLMENT,
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import logging
 
 from idvalid_integration.tasks import constants, call_task
+from idvalid_integration.tasks.serialization import protobuf_task_options
 
 from .utils import validate_routing_part
 
@@ -26,11 +27,10 @@ def create(message: otp_pb2.CreateOtp, *,
     return call_task(
         constants.TASK_EXTERNAL_OTP_CREATE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="otp.CreateOtp message",
         exchange=constants.EXCHANGE_OTP,
         routing_key=constants.ROUTING_OTP_EXTERNAL,
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish(message: otp_pb2.Otp,
@@ -41,11 +41,10 @@ def publish(message: otp_pb2.Otp,
     return call_task(
         constants.TASK_CONSUME_OTP_PUBLISH,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="otp.Otp message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=f"{constants.ROUTING_OTP_PUBLISH_PREFIX}.{event}",
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 # def apply(message: otp_pb2.Otp,
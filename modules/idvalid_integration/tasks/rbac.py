@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import logging
 
 from idvalid_integration.tasks import constants, call_task
+from idvalid_integration.tasks.serialization import protobuf_task_options
 
 if TYPE_CHECKING:
     from celery import Celery
@@ -24,11 +25,10 @@ def publish_role_user_create(
     return call_task(
         constants.TASK_CONSUME_RBAC_ROLE_USER_CREATE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="rbac_pb2.RoleUser message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=f"{constants.ROUTING_RBAC_ROLE_USER_PUBLISH_PREFIX}.create",
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_role_user_delete(
@@ -38,8 +38,7 @@ def publish_role_user_delete(
     return call_task(
         constants.TASK_CONSUME_RBAC_ROLE_USER_DELETE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="rbac_pb2.RoleUser message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=f"{constants.ROUTING_RBAC_ROLE_USER_PUBLISH_PREFIX}.delete",
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
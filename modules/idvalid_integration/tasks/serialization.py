@@ -1,7 +1,28 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
 from msgpack import packb, unpackb
 
+if TYPE_CHECKING:
+    from google.protobuf.message import Message
+
+
+__all__ = (
+    "pack_data",
+    "unpack_data",
+    "pack_protobuf",
+    "unpack_protobuf",
+    "protobuf_task_options",
+)
 
-__all__ = ("pack_data", "unpack_data")
+
+PROTOBUF_SERIALIZER = "protobuf"
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+PROTOBUF_TYPE_HEADER = "protobuf_type"
+IDENTITY_COMPRESSION = "identity"
+
+# celery protocol 2 embed of a task without callbacks
+_EMBED = {"callbacks": None, "errbacks": None, "chain": None, "chord": None}
 
 
 def pack_data(o, **kwargs):
@@ -16,6 +37,57 @@ def unpack_data(o, **kwargs):
     return unpackb(o, **kwargs)
 
 
+def pack_protobuf(body) -> bytes:
+    """
+    Task body of a single serialized message, sent as is.
+
+    Only bodies built by ``protobuf_task_options()`` (one bytes argument,
+    no kwargs and no callbacks) can be sent with this serializer.
+    """
+    args, kwargs, embed = body
+    if (len(args) != 1 or not isinstance(args[0], bytes) or kwargs
+            or any(embed.values())):
+        raise TypeError(
+            "protobuf serializer only sends a single message argument")
+    return args[0]
+
+
+def unpack_protobuf(data: bytes):
+    return (data,), {}, dict(_EMBED)
+
+
+def protobuf_task_options(message: Message, **task_opts) -> dict:
+    """
+    Options to send ``message`` as the only task argument.
+
+    The serialized message is the message body, its type is sent in the
+    ``protobuf_type`` header. Bodies of at least
+    ``TASK_COMPRESSION_THRESHOLD`` bytes are compressed with
+    ``TASK_COMPRESSION``, smaller ones are sent uncompressed.
+    """
+    # django settings are not configured yet when preconf imports this module
+    from idvalid_integration._settings import integration_settings
+
+    data = message.SerializeToString(deterministic=True)
+    if len(data) >= integration_settings.TASK_COMPRESSION_THRESHOLD:
+        compression = integration_settings.TASK_COMPRESSION
+    else:
+        compression = IDENTITY_COMPRESSION
+    headers = {PROTOBUF_TYPE_HEADER: message.DESCRIPTOR.full_name}
+    headers.update(task_opts.pop("headers", None) or {})
+    return {
+        "args": (data,),
+        "serializer": PROTOBUF_SERIALIZER,
+        "compression": compression,
+        "headers": headers,
+        **task_opts,
+    }
+
+
+def _identity(body: bytes) -> bytes:
+    return body
+
+
 def register_msgpack():
     from kombu.serialization import register
 
@@ -25,4 +97,20 @@ def register_msgpack():
         content_encoding='binary')
 
 
+def register_protobuf():
+    from kombu import compression
+    from kombu.serialization import register
+
+    register(
+        PROTOBUF_SERIALIZER, pack_protobuf, unpack_protobuf,
+        content_type=PROTOBUF_CONTENT_TYPE,
+        content_encoding='binary')
+    # the task compression setting applies to every message without an
+    # explicit compression, this one leaves small bodies as they are
+    compression.register(
+        _identity, _identity,
+        'application/x-identity', aliases=[IDENTITY_COMPRESSION])
+
+
 register_msgpack()
+register_protobuf()
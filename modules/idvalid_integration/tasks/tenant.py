@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import logging
 
 from idvalid_integration.tasks import constants, call_task
+from idvalid_integration.tasks.serialization import protobuf_task_options
 
 if TYPE_CHECKING:
     from celery import Celery
@@ -25,11 +26,10 @@ def publish_tenant(
     return call_task(
         constants.TASK_CONSUME_TENANT_PUBLISH,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="tenant_pb2.Tenant message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=f"{constants.ROUTING_TENANT_PUBLISH_PREFIX}",
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_tenant_user(
@@ -39,11 +39,10 @@ def publish_tenant_user(
     return call_task(
         constants.TASK_CONSUME_TENANT_USER_PUBLISH,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="tenant_pb2.TenantUser message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=f"{constants.ROUTING_TENANT_USER_PUBLISH_PREFIX}",
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
 
 
 def publish_tenant_user_delete(
@@ -53,8 +52,7 @@ def publish_tenant_user_delete(
     return call_task(
         constants.TASK_CONSUME_TENANT_USER_DELETE,
         app=app,
-        args=(message.SerializeToString(deterministic=True),),
         argsrepr="tenant_pb2.TenantUser message",
         exchange=constants.EXCHANGE_PUBLISHER,
         routing_key=f"{constants.ROUTING_TENANT_USER_PUBLISH_PREFIX}.delete",
-        **task_opts)
+        **protobuf_task_options(message, **task_opts))
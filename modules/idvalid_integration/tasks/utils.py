@@ -1,12 +1,18 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 
 import re
 
+if TYPE_CHECKING:
+    from typing import Callable, Hashable, Iterable, TypeVar
+    T = TypeVar("T")
+
 
 __all__ = (
     "routing_part_regex",
     "is_valid_routing_part",
     "validate_routing_part",
+    "collapse",
 )
 
 
@@ -20,3 +26,13 @@ def is_valid_routing_part(value: str) -> bool:
 def validate_routing_part(value: str):
     if not is_valid_routing_part(value):
         raise ValueError("contains invalid character")
+
+
+def collapse(items: Iterable[T], key: Callable[[T], Hashable]) -> list[T]:
+    """Keep the last item of every key (last writer wins), in order."""
+    result = {}
+    for item in items:
+        k = key(item)
+        result.pop(k, None)
+        result[k] = item
+    return list(result.values())
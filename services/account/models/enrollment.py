@@ -20,7 +20,8 @@ from .otp_token import OtpToken
 if TYPE_CHECKING:
     # from idvalid_integration.protos.models.enrollment_pb2 import (
     #     Enrollment as EnrollmentMessage)
-    from typing import Self
+    from typing import Iterable, Self
+    from idvalid_integration.protos.models import otp_pb2
 
 
 logger = logging.getLogger(__name__)
@@ -69,7 +70,33 @@ _EnrollmentManagerBase = models.Manager.from_queryset(
 
 
 class EnrollmentManager(_EnrollmentManagerBase, BaseManager):
-    pass
+    def setup_tokens_from_messages(
+            self, messages: Iterable[otp_pb2.Otp]) -> list[Enrollment]:
+        """
+        Bulk version of ``Enrollment.setup_token()``, keyed by the message
+        ``object_id``. Raise like ``setup_token()`` when an enrollment does
+        not exist or already has a token.
+        """
+        messages = {message.object_id: message for message in messages}
+        if not messages:
+            return []
+
+        instances = list(self.filter(subid__in=messages))
+        if len(instances) != len(messages):
+            raise self.model.DoesNotExist
+        if any(instance.otp_token_id for instance in instances):
+            raise TypeError("Already has token")
+
+        otp_tokens = OtpToken.objects.bulk_create([
+            OtpToken(
+                subid=messages[instance.subid].id,
+                token=messages[instance.subid].token)
+            for instance in instances
+        ])
+        for instance, otp_token in zip(instances, otp_tokens):
+            instance.otp_token = otp_token
+        self.bulk_update(instances, ["otp_token"])
+        return instances
 
 
 class Enrollment(get_subid_model()):
@@ -15,6 +15,10 @@ ROUTING_CONSUME_OTP_PUBLISH = (
     f"{constants.ROUTING_OTP_PUBLISH_PREFIX}.{OTP_USAGE}")
 TASK_CONSUME_OTP_PUBLISH = constants.TASK_CONSUME_OTP_PUBLISH
 
+# micro-batches of the consume queue
+CONSUME_BATCH_SIZE = 100
+CONSUME_BATCH_INTERVAL = 0.5  # seconds
+
 # ROUTING_CONSUME_OTP_APPLY = (
 #     f"{constants.ROUTING_OTP_APPLY_PREFIX}.{OTP_USAGE}")
 # TASK_CONSUME_OTP_APPLY = constants.TASK_CONSUME_OTP_APPLY
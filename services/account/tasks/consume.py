@@ -6,12 +6,13 @@ import logging
 from celery import current_app as celery_app
 
 from idvalid_integration.protos.models import otp_pb2
+from idvalid_integration.tasks.batches import BatchTask, decode_messages
 
 from account.models import Enrollment
 from account.tasks import constants
 
 if TYPE_CHECKING:
-    from celery import Task
+    from idvalid_integration.tasks.batches import BatchRequest
 
 
 logger = logging.getLogger(__name__)
@@ -21,12 +22,13 @@ __all__ = (
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_OTP_PUBLISH,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_otp_publish_task(message: bytes):
-    message = otp_pb2.Otp.FromString(message)
-    instance = Enrollment.objects.get(
-        subid=message.object_id)  # type: Enrollment
-    instance.setup_token(
-        message.id, message.token)
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_otp_publish_task(requests: list[BatchRequest]):
+    Enrollment.objects.setup_tokens_from_messages(
+        decode_messages(requests, otp_pb2.Otp))
@@ -6,4 +6,4 @@ class AuthnConfig(AppConfig):
     name = 'authn'
 
     def ready(self):
-        from . import receivers
+        from . import checks, receivers
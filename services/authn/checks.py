@@ -0,0 +1,48 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from django.core import checks
+
+from evercore.cache import check_shared_cache
+from evercore.ratelimit import is_shared_backend
+
+from authn.settings import authn_settings
+
+if TYPE_CHECKING:
+    pass
+
+
+__all__ = ("check_nonce_cache", "check_claims_cache", "check_ratelimit_backend")
+
+
+@checks.register(checks.Tags.security, checks.Tags.caches)
+def check_nonce_cache(**kwargs) -> list[checks.CheckMessage]:
+    # a replay sent to another process would pass a per process cache
+    return check_shared_cache(
+        authn_settings.SECURITY_NONCE_CACHE,
+        setting="SECURITY_NONCE_CACHE", id="authn.E001")
+
+
+@checks.register(checks.Tags.caches)
+def check_claims_cache(**kwargs) -> list[checks.CheckMessage]:
+    # role and tenant changes are invalidated by the integration consumer,
+    # token minting processes must see it
+    if not authn_settings.REFRESH_TOKEN_CLAIMS_CACHE_TIMEOUT:
+        return []
+    return check_shared_cache(
+        authn_settings.REFRESH_TOKEN_CLAIMS_CACHE,
+        setting="REFRESH_TOKEN_CLAIMS_CACHE", id="authn.E002")
+
+
+@checks.register(checks.Tags.security, checks.Tags.caches)
+def check_ratelimit_backend(**kwargs) -> list[checks.CheckMessage]:
+    # login and challenge throttles would allow their rate per process
+    if is_shared_backend():
+        return []
+    return [checks.Error(
+        "Rate limits are counted per process.",
+        hint=(
+            "Set RATELIMIT_REDIS_URL or point RATELIMIT_USE_CACHE to a cache "
+            "shared between processes."),
+        id="authn.E003",
+    )]
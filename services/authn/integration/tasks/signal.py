@@ -28,6 +28,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 __all__ = (
+    "get_user_logged_in_info",
+
     "call_signal_enrollment_post_create",
     "call_signal_forget_password_post_create",
     "call_signal_change_email_post_create",
@@ -83,6 +85,17 @@ def call_signal_change_email_post_create(
         **task_opts)
 
 
+def get_user_logged_in_info(instance: User, request: Request) -> dict:
+    return {
+        "user_id": instance.pk,
+        "platform_id": request.platform.pk,
+        "device_id": request.COOKIES.get("device_id"),
+        "user_agent": request.headers["user-agent"],
+        "session_id": request.idvalid_session.id,
+        "ip_address": get_client_ip(request),
+    }
+
+
 def call_signal_user_logged_in(
         instance: User, request: Request, *,
         app: Celery = None,
@@ -90,14 +103,7 @@ def call_signal_user_logged_in(
     return call_task(
         constants.TASK_SIGNAL_USER_LOGGED_IN,
         app=app,
-        kwargs={
-            "user_id": instance.pk,
-            "platform_id": request.platform.pk,
-            "device_id": request.COOKIES.get("device_id"),
-            "user_agent": request.headers["user-agent"],
-            "session_id": request.idvalid_session.id,
-            "ip_address": get_client_ip(request),
-        },
+        kwargs=get_user_logged_in_info(instance, request),
         kwargsrepr="login info",
         exchange=constants.EXCHANGE,
         routing_key=constants.ROUTING_SIGNAL,
@@ -4,6 +4,9 @@ from typing import TYPE_CHECKING
 import hashlib
 import hmac
 import logging
+import threading
+
+from collections import OrderedDict
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization, hashes
@@ -28,11 +31,14 @@ from authn.generators import generate_rsa_private_key, generate_bytes
 from authn.settings import authn_settings
 
 if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
     from .totp_device import TOTPDevice
 
 
 logger = logging.getLogger(__name__)
 __all__ = (
+    "PlatformKeyCache",
+    "platform_key_cache",
     "PlatformQuerySet",
     "PlatformManager",
     "Platform",
@@ -66,6 +72,75 @@ def load_private_key_der(data: bytes):
     )
 
 
+class PlatformKeyCache:
+    """Process wide cache of parsed platform private keys.
+
+    Entries are keyed by platform pk and validated against a digest
+    of the stored DER, so a rotated key is never served from cache.
+    """
+
+    def __init__(self, maxsize: int = None):
+        self._maxsize = maxsize
+        self._entries = OrderedDict()  # type: OrderedDict[int, tuple[bytes, RSAPrivateKey]]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            return authn_settings.PLATFORM_PRIVATE_KEY_CACHE_SIZE
+        return self._maxsize
+
+    def get(self, pk: int, der: bytes) -> RSAPrivateKey:
+        digest = hashlib.sha256(der).digest()
+        with self._lock:
+            try:
+                entry_digest, private_key = self._entries[pk]
+            except KeyError:
+                pass
+            else:
+                if hmac.compare_digest(entry_digest, digest):
+                    self._entries.move_to_end(pk)
+                    self.hits += 1
+                    return private_key
+            self.misses += 1
+
+        # parse outside the lock, key derivation may be expensive
+        private_key = load_private_key_der(der)
+        if pk is None or not self.maxsize:
+            return private_key
+
+        with self._lock:
+            self._entries[pk] = (digest, private_key)
+            self._entries.move_to_end(pk)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return private_key
+
+    def invalidate(self, pk: int):
+        with self._lock:
+            self._entries.pop(pk, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+platform_key_cache = PlatformKeyCache()
+
+
 class PlatformQuerySet(models.QuerySet):
     def get_encrypted(self, enc_subid: str, salt: str) -> Platform:
         pass
@@ -132,8 +207,8 @@ class Platform(get_subid_model()):
         return super().delete(*args, **kwargs)
 
     @cached_property
-    def private_key(self):
-        return load_private_key_der(self.private_key_der)
+    def private_key(self) -> RSAPrivateKey:
+        return platform_key_cache.get(self.pk, self.private_key_der)
 
     @cached_property
     def public_key(self):
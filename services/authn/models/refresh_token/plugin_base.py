@@ -7,7 +7,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Sequence
     from authn.models import RefreshToken
 
 
@@ -27,8 +27,25 @@ class RefreshTokenPluginBase(models.Model):
         verbose_name=_("refresh token")
     )  # type: RefreshToken
 
+    #: `select_related` lookups needed by `get_extra_claims`
+    related_lookups: Sequence[str] = ()
+
     class Meta:
         abstract = True
 
     def get_extra_claims(self) -> dict[str, Any]:
         raise NotImplementedError
+
+    @classmethod
+    def bulk_extra_claims(
+            cls, plugins: Sequence[RefreshTokenPluginBase]
+    ) -> dict[int, dict[str, Any]]:
+        """Extra claims for many plugin objects, keyed by refresh token id.
+
+        Override to resolve claims of many refresh tokens with
+        a constant number of queries.
+        """
+        return {
+            plugin.pk: plugin.get_extra_claims()
+            for plugin in plugins
+        }
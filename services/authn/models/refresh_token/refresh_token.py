@@ -3,9 +3,11 @@ from typing import TYPE_CHECKING
 
 import logging
 
+from collections import defaultdict
 from uuid import uuid4
 
 from django.apps import apps
+from django.core.cache import caches
 from django.db import models
 from django.db.models.manager import BaseManager
 
@@ -27,8 +29,9 @@ from authn.models import constants
 from .plugin_base import RefreshTokenPluginBase
 
 if TYPE_CHECKING:
-    from typing import Sequence, Any
+    from typing import Iterable, Sequence, Any
     import datetime
+    from django.core.cache.backends.base import BaseCache
     from django.db.models.fields.reverse_related import (
         ForeignObjectRel,
     )
@@ -79,18 +82,118 @@ class PluginManager:
     def available_plugins(self) -> Sequence[str]:
         return tuple(self.plugin_map.keys())
 
+    @property
+    def cache(self) -> BaseCache | None:
+        if not authn_settings.REFRESH_TOKEN_CLAIMS_CACHE_TIMEOUT:
+            return None
+        return caches[authn_settings.REFRESH_TOKEN_CLAIMS_CACHE]
+
+    # noinspection PyMethodMayBeStatic
+    def get_cache_key(self, refresh_token_id: int) -> str:
+        return f"authn:rt-claims:{refresh_token_id}"
+
+    def get_related_lookups(
+            self, plugin_names: Iterable[str] = None) -> list[str]:
+        """`select_related` lookups to load plugin objects with refresh tokens."""
+        if plugin_names is None:
+            plugin_names = self.available_plugins
+        lookups = []
+        for name in plugin_names:
+            try:
+                model = self.plugin_map[name]
+            except KeyError:
+                continue
+            lookups.append(name)
+            lookups.extend(
+                f"{name}__{lookup}" for lookup in model.related_lookups)
+        return lookups
+
+    def _load_plugin_objects(
+            self, plugin_name: str, instances: Sequence[RefreshToken]
+    ) -> list[RefreshTokenPluginBase]:
+        model = self.plugin_map[plugin_name]
+        descriptor = getattr(RefreshToken, plugin_name)
+        result = []
+        pending = []
+        for instance in instances:
+            if descriptor.is_cached(instance):
+                # already loaded by `select_related`
+                related = descriptor.related.get_cached_value(instance)
+                if related is not None:
+                    result.append(related)
+            else:
+                pending.append(instance.pk)
+        if pending:
+            result.extend(model.objects.select_related(
+                *model.related_lookups
+            ).filter(refresh_token_id__in=pending))
+        return result
+
+    def _resolve_claims(
+            self, instances: Sequence[RefreshToken]
+    ) -> dict[int, dict[str, Any]]:
+        result = {instance.pk: {} for instance in instances}
+        members = defaultdict(list)
+        for instance in instances:
+            for name in instance.plugins or ():
+                if name in self.plugin_map:
+                    members[name].append(instance)
+        for name, plugin_instances in members.items():
+            model = self.plugin_map[name]
+            for pk, claims in model.bulk_extra_claims(
+                self._load_plugin_objects(name, plugin_instances)
+            ).items():
+                result[pk].update(claims)
+        return result
+
+    def resolve_claims(
+            self, instances: Sequence[RefreshToken]
+    ) -> dict[int, dict[str, Any]]:
+        """Plugin claims of many refresh tokens, keyed by refresh token pk."""
+        result = {instance.pk: {} for instance in instances}
+        instances = [instance for instance in instances if instance.plugins]
+        if not instances:
+            return result
+
+        if (cache := self.cache) is None:
+            result.update(self._resolve_claims(instances))
+            return result
+
+        keys = {
+            instance.pk: self.get_cache_key(instance.pk)
+            for instance in instances
+        }
+        cached = cache.get_many(keys.values())
+        missing = []
+        for instance in instances:
+            try:
+                result[instance.pk] = cached[keys[instance.pk]]
+            except KeyError:
+                missing.append(instance)
+        if missing:
+            resolved = self._resolve_claims(missing)
+            cache.set_many(
+                {keys[pk]: claims for pk, claims in resolved.items()},
+                authn_settings.REFRESH_TOKEN_CLAIMS_CACHE_TIMEOUT)
+            result.update(resolved)
+        return result
+
+    def invalidate_claims(self, refresh_token_ids: Iterable[int]):
+        if (cache := self.cache) is None:
+            return
+        if keys := [self.get_cache_key(pk) for pk in refresh_token_ids]:
+            cache.delete_many(keys)
+
     def get_extra_claims(
             self, instance: RefreshToken, plugin_name: str) -> dict[str, Any]:
         try:
             model = self.plugin_map[plugin_name]
         except KeyError:
             return {}
-        try:
-            related = model.objects.get(
-                refresh_token_id=instance.pk)  # type: RefreshTokenPluginBase
-        except model.DoesNotExist:
+        plugins = self._load_plugin_objects(plugin_name, [instance])
+        if not plugins:
             return {}
-        return related.get_extra_claims()
+        return model.bulk_extra_claims(plugins)[instance.pk]
 
     def set_plugin_object(
             self, instance: RefreshToken, plugin_name: str, **kwargs
@@ -104,6 +207,8 @@ class PluginManager:
             for key, val in kwargs.items():
                 setattr(result, key, val)
             result.save(update_fields=tuple(kwargs.keys()))
+        # keep the reverse one-to-one cache in sync
+        setattr(instance, plugin_name, result)
         return result
 
 
@@ -111,7 +216,18 @@ plugin_manager = PluginManager()
 
 
 class RefreshTokenQuerySet(models.QuerySet):
-    pass
+    def with_plugins(self, *plugin_names: str) -> RefreshTokenQuerySet:
+        """Load plugin objects (all plugins by default) in the same query."""
+        return self.select_related(
+            *plugin_manager.get_related_lookups(plugin_names or None))
+
+    def resolve_plugin_claims(self) -> list[RefreshToken]:
+        """Evaluate queryset and resolve plugin claims in bulk."""
+        instances = list(self)
+        claims = plugin_manager.resolve_claims(instances)
+        for instance in instances:
+            instance._plugin_claims = claims[instance.pk]
+        return instances
 
 
 _RefreshTokenManagerBase = models.Manager.from_queryset(
@@ -176,13 +292,20 @@ class RefreshToken(get_subid_model()):
 
     @property
     def plugin_claims(self) -> dict[str, Any]:
-        return {
-            key: val
-            for plugin in (self.plugins or {})
-            for key, val in plugin_manager.get_extra_claims(
-                self, plugin
-            ).items()
-        }
+        try:
+            return self._plugin_claims
+        except AttributeError:
+            pass
+        claims = plugin_manager.resolve_claims([self])[self.pk]
+        self._plugin_claims = claims
+        return claims
+
+    def invalidate_plugin_claims(self):
+        try:
+            del self._plugin_claims
+        except AttributeError:
+            pass
+        plugin_manager.invalidate_claims([self.pk])
 
     @property
     def registered_claims(self) -> dict:
@@ -282,6 +405,7 @@ class RefreshToken(get_subid_model()):
     def set_plugin(self, name: str, **kwargs) -> RefreshTokenPluginBase:
         result = plugin_manager.set_plugin_object(
             self, name, **kwargs)
+        self.invalidate_plugin_claims()
         if not self.plugins:
             self.plugins = [name]
         elif name in self.plugins:
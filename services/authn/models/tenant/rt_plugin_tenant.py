@@ -3,6 +3,10 @@ from typing import TYPE_CHECKING, Any
 
 import logging
 
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+
 from django.db import models
 from django.db.models.manager import BaseManager
 from django.utils.translation import gettext_lazy as _
@@ -13,6 +17,7 @@ from ..rbac import RoleUser
 from ..refresh_token.plugin_base import RefreshTokenPluginBase
 
 if TYPE_CHECKING:
+    from typing import Sequence
     from authn.models import TenantUser
 
 
@@ -46,17 +51,36 @@ class RTPluginTenant(RefreshTokenPluginBase):
 
     objects = RTPluginTenantManager()
 
+    related_lookups = ("tenant_user",)
+
     def get_extra_claims(self) -> dict[str, Any]:
-        tenant_user = self.tenant_user
-        return {
-            jwt_auth_settings.TENANT_ID_CLAIM: tenant_user.tenant_id,
-            jwt_auth_settings.TENANT_OWNER_CLAIM: tenant_user.is_owner,
-            jwt_auth_settings.RBAC_ROLE_IDS_CLAIM: tuple(
-                RoleUser.objects.filter(
-                    tenant_id=tenant_user.tenant_id,
-                    user_id=tenant_user.user_id
-                ).values_list(
-                    "role_id", flat=True
-                )
-            )
+        return self.bulk_extra_claims([self])[self.pk]
+
+    @classmethod
+    def bulk_extra_claims(
+            cls, plugins: Sequence[RTPluginTenant]
+    ) -> dict[int, dict[str, Any]]:
+        members = {
+            (plugin.tenant_user.tenant_id, plugin.tenant_user.user_id)
+            for plugin in plugins
         }
+        role_ids = defaultdict(list)
+        if members:
+            queryset = RoleUser.objects.filter(reduce(or_, (
+                models.Q(tenant_id=tenant_id, user_id=user_id)
+                for tenant_id, user_id in members
+            ))).values_list("tenant_id", "user_id", "role_id")
+            for tenant_id, user_id, role_id in queryset:
+                role_ids[(tenant_id, user_id)].append(role_id)
+
+        result = {}
+        for plugin in plugins:
+            tenant_user = plugin.tenant_user
+            result[plugin.pk] = {
+                jwt_auth_settings.TENANT_ID_CLAIM: tenant_user.tenant_id,
+                jwt_auth_settings.TENANT_OWNER_CLAIM: tenant_user.is_owner,
+                jwt_auth_settings.RBAC_ROLE_IDS_CLAIM: tuple(
+                    role_ids[(tenant_user.tenant_id, tenant_user.user_id)]
+                ),
+            }
+        return result
@@ -181,7 +181,8 @@ class EmailOTP(get_subid_model()):
             self, raw_pin: str, *,
             hold: bool = True,
             save: bool = True):
-        self.pin = make_password(raw_pin)
+        self.pin = make_password(
+            raw_pin, hasher=authn_settings.EMAIL_OTP_PIN_HASHER)
         if hold:
             self._pin = raw_pin
         if save:
@@ -190,7 +191,8 @@ class EmailOTP(get_subid_model()):
     def check_pin(self, raw_pin: str) -> bool:
         return check_password(
             raw_pin, self.pin,
-            partial(self.set_pin, hold=False))
+            partial(self.set_pin, hold=False),
+            preferred=authn_settings.EMAIL_OTP_PIN_HASHER)
 
     def generate_pin(
             self, *,
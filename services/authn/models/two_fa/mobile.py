@@ -153,7 +153,8 @@ class MobileOTP(get_subid_model()):
             self, raw_pin: str, *,
             hold: bool = True,
             save: bool = True):
-        self.pin = make_password(raw_pin)
+        self.pin = make_password(
+            raw_pin, hasher=authn_settings.MOBILE_OTP_PIN_HASHER)
         if hold:
             self._pin = raw_pin
         if save:
@@ -162,7 +163,8 @@ class MobileOTP(get_subid_model()):
     def check_pin(self, raw_pin: str) -> bool:
         return check_password(
             raw_pin, self.pin,
-            partial(self.set_pin, hold=False))
+            partial(self.set_pin, hold=False),
+            preferred=authn_settings.MOBILE_OTP_PIN_HASHER)
 
     def check_state(self, state: str) -> bool:
         print(
@@ -32,7 +32,8 @@ __all__ = (
 
 class SecurityCodeQuerySet(models.QuerySet):
     def create(self, pin: str, **kwargs) -> SecurityCode:
-        pin = make_password(pin)
+        pin = make_password(
+            pin, hasher=authn_settings.SECURITY_CODE_PIN_HASHER)
         return super().create(pin=pin, **kwargs)
 
 
@@ -148,7 +149,8 @@ class SecurityCode(get_subid_model()):
     def update_pin(self, raw_pin: str, *,
                    hold_raw_pin: bool = True,
                    save: bool = True):
-        self.pin = make_password(raw_pin)
+        self.pin = make_password(
+            raw_pin, hasher=authn_settings.SECURITY_CODE_PIN_HASHER)
         self._pin = raw_pin if hold_raw_pin else None
         if save:
             self.save(update_fields=["pin"])
@@ -156,7 +158,8 @@ class SecurityCode(get_subid_model()):
     def check_pin(self, raw_pin: str) -> bool:
         return check_password(
             raw_pin, self.pin,
-            partial(self.update_pin, hold_raw_pin=False))
+            partial(self.update_pin, hold_raw_pin=False),
+            preferred=authn_settings.SECURITY_CODE_PIN_HASHER)
 
     def _verify_success(self):
         self.reset_throttle(save=False)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import hashlib
+import logging
+
+from struct import pack
+
+from django.core.cache import caches
+from django.utils.functional import cached_property
+
+from authn.settings import authn_settings
+
+if TYPE_CHECKING:
+    from django.core.cache.backends.base import BaseCache
+    from authn.models import Platform
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("PlatformNonceVerifier", "platform_nonce_verifier")
+
+
+class PlatformNonceVerifier:
+    """Verify platform security headers without touching the database.
+
+    The nonce is the platform TOTP token for the request timestamp, so it
+    is identical for every request a platform sends within one time step.
+    To tell a replay apart from a parallel request, every accepted
+    ``(platform, counter, nonce, fingerprint)`` tuple is recorded with an
+    atomic ``cache.add``. The fingerprint is the encrypted platform id
+    header; RSA-OAEP is randomized, so a fresh request always carries a
+    fresh fingerprint while a replayed one does not.
+
+    Consumed tuples only need to be remembered while the request
+    timestamp is still accepted by the drift check, which gives the
+    sliding window its length. ``SECURITY_NONCE_CACHE`` must be shared by
+    every process (system check ``authn.E001``), a per process cache only
+    catches replays sent to the same process.
+    """
+
+    def __init__(self, cache_alias: str = None):
+        self._cache_alias = cache_alias
+
+    @cached_property
+    def cache(self) -> BaseCache:
+        return caches[
+            self._cache_alias or authn_settings.SECURITY_NONCE_CACHE]
+
+    @property
+    def window(self) -> int:
+        return 2 * authn_settings.SECURITY_MAX_TIMESTAMP_DRIFT + 1
+
+    # noinspection PyMethodMayBeStatic
+    def make_key(
+            self, platform: Platform, counter: int,
+            nonce: bytes, fingerprint: bytes) -> str:
+        digest = hashlib.sha256()
+        digest.update(pack(b'>QQ', platform.pk, counter))
+        digest.update(nonce)
+        digest.update(fingerprint)
+        return f"{authn_settings.SECURITY_NONCE_KEY_PREFIX}:{digest.hexdigest()}"
+
+    def consume(
+            self, platform: Platform, counter: int,
+            nonce: bytes, fingerprint: bytes) -> bool:
+        """Mark the tuple as used, return `False` if it already was."""
+        return self.cache.add(
+            self.make_key(platform, counter, nonce, fingerprint),
+            True, self.window)
+
+    def verify(
+            self, platform: Platform, nonce: bytes, *,
+            at: int, fingerprint: bytes) -> bool:
+        device = platform.totp_device
+        if not device.verify_bytes(nonce, at=at, tolerance=0):
+            return False
+        # noinspection PyProtectedMember
+        counter = device._get_sequence(at=at)
+        if not self.consume(platform, counter, nonce, fingerprint):
+            logger.warning(
+                "Replayed nonce for platform %s at counter %s",
+                platform.pk, counter)
+            return False
+        return True
+
+
+platform_nonce_verifier = PlatformNonceVerifier()
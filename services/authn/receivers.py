@@ -22,7 +22,12 @@ from authn.models import (
     EmailOTP,
     ChangeEmail,
     Passkey,
+    RoleUser,
+    TenantUser,
+    RTPluginTenant,
+    platform_key_cache,
 )
+from authn.models.refresh_token.refresh_token import plugin_manager
 from authn.signals import (
     user_logged_in,
     # session_revoke,
@@ -47,6 +52,10 @@ __all__ = (
     "on_platform_post_save",
     "on_platform_post_delete",
 
+    "on_role_user_changed",
+    "on_tenant_user_changed",
+    "on_rt_plugin_tenant_post_delete",
+
     "on_session_post_save",
     "on_session_post_delete",
 
@@ -94,12 +103,19 @@ def on_change_email_post_save(instance: ChangeEmail, created: bool, using: str,
 
 @receiver(user_logged_in, sender=User)
 def on_user_logged_in(request: Request, user: User, **kwargs):
-    tasks.call_signal_user_logged_in(user, request)
+    # publish straight from the request once committed, no hop through
+    # the signal queue
+    login_info = tasks.get_user_logged_in_info(user, request)
+
+    def call_task():
+        tasks.call_publish_user_logged_in(**login_info)
+    transaction.on_commit(call_task)
 
 
 @receiver(post_save, sender=Platform)
 def on_platform_post_save(
         instance: Platform, created: bool, using: str, **kwargs):
+    platform_key_cache.invalidate(instance.pk)
     if created:
         def call_task():
             tasks.call_signal_platform_post_create(instance)
@@ -118,11 +134,48 @@ def on_platform_post_save(
 @receiver(post_delete, sender=Platform)
 def on_platform_post_delete(
         instance: Platform, using: str, **kwargs):
+    platform_key_cache.invalidate(instance.pk)
     def call_task():
         tasks.call_signal_platform_post_delete(instance)
     transaction.on_commit(call_task, using=using)
 
 
+def _invalidate_refresh_token_claims(refresh_token_ids: list[int], using: str):
+    if not refresh_token_ids:
+        return
+
+    def invalidate():
+        plugin_manager.invalidate_claims(refresh_token_ids)
+    transaction.on_commit(invalidate, using=using)
+
+
+@receiver(post_save, sender=RoleUser)
+@receiver(post_delete, sender=RoleUser)
+def on_role_user_changed(instance: RoleUser, using: str, **kwargs):
+    _invalidate_refresh_token_claims(
+        list(RTPluginTenant.objects.using(using).filter(
+            tenant_user__tenant_id=instance.tenant_id,
+            tenant_user__user_id=instance.user_id,
+        ).values_list("refresh_token_id", flat=True)),
+        using)
+
+
+@receiver(post_save, sender=TenantUser)
+@receiver(post_delete, sender=TenantUser)
+def on_tenant_user_changed(instance: TenantUser, using: str, **kwargs):
+    _invalidate_refresh_token_claims(
+        list(RTPluginTenant.objects.using(using).filter(
+            tenant_user_id=instance.pk,
+        ).values_list("refresh_token_id", flat=True)),
+        using)
+
+
+@receiver(post_delete, sender=RTPluginTenant)
+def on_rt_plugin_tenant_post_delete(
+        instance: RTPluginTenant, using: str, **kwargs):
+    _invalidate_refresh_token_claims([instance.refresh_token_id], using)
+
+
 @receiver(post_save, sender=Session)
 def on_session_post_save(
         instance: Session, created: bool, using: str, **kwargs):
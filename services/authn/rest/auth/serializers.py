@@ -187,7 +187,7 @@ class TokenRefreshSerializer(serializers.Serializer):
             self.fail("refresh_invalid")
 
         try:
-            refresh = RefreshTokenModel.objects.get(
+            refresh = RefreshTokenModel.objects.with_plugins().get(
                 subid=value.decode())  # type: RefreshTokenModel
         except ObjectDoesNotExist:
             self.fail("refresh_invalid")
@@ -25,6 +25,7 @@ from idvalid_core.rest.permissions import DeviceCookieRequired
 from authn.models import PasskeyChallenge
 
 from ..permissions import PlatformPermission
+from ..throttling import LoginThrottle
 
 from .serializers import (
     PasskeyLoginSerializer,
@@ -57,6 +58,7 @@ class BaseLoginView(CreateAPIView):
         DeviceCookieRequired,
         PlatformPermission,
     )
+    throttle_classes = (LoginThrottle,)
     www_authenticate_realm = "api"
 
     def get_authenticate_header(self, request: Request) -> str:
@@ -94,6 +96,7 @@ class PasskeyLoginView(GenericViewSet):
         DeviceCookieRequired,
         PlatformPermission,
     )
+    throttle_classes = (LoginThrottle,)
     serializer_class = PasskeyLoginSerializer
     www_authenticate_realm = "api"
     lookup_field = "subid"
@@ -26,6 +26,7 @@ from authn.rest.permissions import (
     HasPasskey,
     HasMobileLoggedIn,
 )
+from authn.rest.throttling import ChallengeThrottle
 
 from .serializers import (
     AuthenticatorSerializer,
@@ -61,6 +62,7 @@ __all__ = (
 class BaseMultiFactorViewSet(GenericViewSet):
     request: "Request"
     authentication_classes = (JWTAuthentication,)
+    throttle_classes = (ChallengeThrottle,)
 
     def get_instance(self):
         return self.request.user
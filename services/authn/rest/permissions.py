@@ -12,6 +12,7 @@ from rest_framework.permissions import BasePermission
 from rest_framework_simplejwt.exceptions import TokenError
 
 from authn.models import Platform
+from authn.nonce import platform_nonce_verifier
 from authn.settings import authn_settings
 from authn.utils import b64decode, login_key
 
@@ -99,10 +100,11 @@ class PlatformPermission(BasePermission):
     def has_permission(self, request: Request, view) -> bool:
         platform = self.get_platform(request)
         timestamp = self.get_timestamp(request)
-        if not platform.totp_device.verify_bytes(
+        if not platform_nonce_verifier.verify(
+                platform,
                 self.get_nonce(request),
                 at=timestamp,
-                tolerance=0):
+                fingerprint=_get_params(request, self.platform_id_header)):
             self.fail("invalid")
         request.platform = platform
         request.timestamp = timestamp
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from evercore.rest.throttling import RateLimitThrottle
+
+from authn.settings import authn_settings
+
+if TYPE_CHECKING:
+    from typing import Any
+    from rest_framework.request import Request
+    from rest_framework.views import APIView
+
+
+__all__ = (
+    "LoginThrottle",
+    "ChallengeThrottle",
+)
+
+
+class LoginThrottle(RateLimitThrottle):
+    scope = "authn.login"
+
+    def get_rate(self) -> str | None:
+        return authn_settings.LOGIN_THROTTLE_RATE
+
+
+class ChallengeThrottle(RateLimitThrottle):
+    scope = "authn.challenge"
+    actions = ("challenge",)
+
+    def get_rate(self) -> str | None:
+        return authn_settings.CHALLENGE_THROTTLE_RATE
+
+    def get_ident_values(self, request: Request, view: APIView) -> tuple[Any, ...] | None:
+        if not (user := request.user) or not user.is_authenticated:
+            return None
+        return (user.pk,)
@@ -14,6 +14,7 @@ DEFAULTS = {
     "DEFAULT_USER_LOOKUP_FIELD": "username",
 
     "PLATFORM_PRIVATE_KEY_SECRET": None,
+    "PLATFORM_PRIVATE_KEY_CACHE_SIZE": 1024,
     "LOGIN_PRIVATE_KEY_PEM": "test_rsa_private_key.pem",
     "LOGIN_PRIVATE_KEY_PASSPHRASE": None,
     "LOGIN_MAX_TIMESTAMP_DRIFT": 5,  # 5 seconds
@@ -27,12 +28,23 @@ DEFAULTS = {
 
     "CHANGE_EMAIL_OTP_DURATION": 5 * 60,  # 5 minutes
 
+    "REFRESH_TOKEN_CLAIMS_CACHE": "default",
+    # seconds, 0 to disable; invalidated by the integration consumer,
+    # so the cache must be shared
+    "REFRESH_TOKEN_CLAIMS_CACHE_TIMEOUT": 0,
+
     "SECURITY_PLATFORM_LABEL_HEADER": "X-Idv-Slt",
     "SECURITY_PLATFORM_ID_HEADER": "X-Idv-Pf",
     "SECURITY_TIMESTAMP_HEADER": "X-Idv-Ts",
     "SECURITY_NONCE_HEADER": "X-Idv-Nc",
     "SECURITY_2FA_HEADER": "X-Idv-Tfa",
     "SECURITY_MAX_TIMESTAMP_DRIFT": 10,  # 10 seconds
+    "SECURITY_NONCE_CACHE": "default",
+    "SECURITY_NONCE_KEY_PREFIX": "authn:nonce",
+
+    # `evercore.ratelimit` rates, None to disable
+    "LOGIN_THROTTLE_RATE": "10/m",  # per client ip
+    "CHALLENGE_THROTTLE_RATE": "5/m",  # per user, across factors
 
     "TOTP_DEFAULT_ISSUER": "IDValid",
     "TOTP_THROTTLE_FACTOR": 1,
@@ -41,14 +53,18 @@ DEFAULTS = {
 
     "SECURITY_CODE_THROTTLE_FACTOR": 1,
     "SECURITY_CODE_PIN_LENGTH": 6,
+    # security code is a long-lived user secret, keep the slow default hasher
+    "SECURITY_CODE_PIN_HASHER": "default",
 
     "EMAIL_OTP_PIN_LENGTH": 6,
     "EMAIL_OTP_PIN_DURATION": 5 * 60,  # 5 minutes
     "EMAIL_OTP_COOLDOWN_DURATION": 60,  # 60 seconds
     "EMAIL_OTP_THROTTLE_FACTOR": 1,
+    "EMAIL_OTP_PIN_HASHER": "ephemeral_hmac_sha256",
 
     "MOBILE_OTP_PIN_LENGTH": 2,
     "MOBILE_OTP_PIN_DURATION": 2 * 60,  # 1 minute
+    "MOBILE_OTP_PIN_HASHER": "ephemeral_hmac_sha256",
 
     "BACKUP_CODES_LENGTH": 10,
     "BACKUP_CODES_ITEM_BYTES_LENGTH": 5,  # 5 bytes length per item (10 hex chars)
@@ -88,9 +104,15 @@ MANDATORY = (
     "SECURITY_TIMESTAMP_HEADER",
     "SECURITY_NONCE_HEADER",
     "SECURITY_2FA_HEADER",
+    "SECURITY_NONCE_CACHE",
+    "SECURITY_NONCE_KEY_PREFIX",
 
     "TOTP_THROTTLE_FACTOR",
     "PIN_THROTTLE_FACTOR",
+
+    "SECURITY_CODE_PIN_HASHER",
+    "EMAIL_OTP_PIN_HASHER",
+    "MOBILE_OTP_PIN_HASHER",
 )
 
 
@@ -97,6 +97,7 @@ def signal_change_email_post_create_task(self: Task, pk: int):
         instance, app=self._app)
 
 
+# logins are published from `on_user_logged_in`, kept to drain queued messages
 @celery_app.task(
     name=constants.TASK_SIGNAL_USER_LOGGED_IN,
     queue=constants.QUEUE_SIGNAL,
@@ -1,3 +1,39 @@
-from django.test import TestCase
+import time
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from evercore.ratelimit import (
+    CacheRateLimitBackend,
+    LocalRateLimitBackend,
+    RateLimiter,
+    get_backend,
+)
+
+from authn.checks import check_ratelimit_backend
+
+
+class CacheRateLimitTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.limiter = RateLimiter("3/m", group="test", backend=CacheRateLimitBackend("default"))
+
+    def test_limit_is_counted_in_cache(self):
+        results = [self.limiter.hit("ident") for _ in range(4)]
+        self.assertEqual([r.allowed for r in results], [True, True, True, False])
+        self.assertGreater(results[-1].retry_after, 0)
+        # denied calls are not counted
+        window = int(time.time() // 60)
+        self.assertEqual(cache.get("%s:%d" % (self.limiter.make_key(("ident",)), window)), 3)
+
+        self.limiter.reset("ident")
+        self.assertTrue(self.limiter.hit("ident").allowed)
+
+    def test_default_cache_is_shared_backend(self):
+        self.assertIsInstance(get_backend(), CacheRateLimitBackend)
+        self.assertEqual(check_ratelimit_backend(), [])
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_local_cache_fails_check(self):
+        self.assertIsInstance(get_backend(), LocalRateLimitBackend)
+        self.assertEqual([e.id for e in check_ratelimit_backend()], ["authn.E003"])
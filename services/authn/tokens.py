@@ -34,7 +34,7 @@ class Token(tokens.Token):
 
     def get_refresh_token_instance(self) -> RefreshTokenModel | None:
         try:
-            return RefreshTokenModel.objects.get(
+            return RefreshTokenModel.objects.with_plugins().get(
                 pk=self.refresh_token_id)
         except RefreshTokenModel.DoesNotExist:
             return None
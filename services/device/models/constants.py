@@ -1,3 +1,6 @@
 from evercore.constants import GLOBAL_ID_LENGTH
 
 DEVICE_ID_LENGTH = GLOBAL_ID_LENGTH
+
+# distinct user agent strings kept parsed in process
+USER_AGENT_CACHE_SIZE = 2048
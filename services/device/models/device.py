@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import functools
 import re
 
 import logging
@@ -15,9 +16,11 @@ from django.utils.translation import gettext_lazy as _
 from idvalid_core.models import get_subid_model
 
 from device.signals import device_create_history, device_post_revoke
-from .constants import DEVICE_ID_LENGTH
+from .constants import DEVICE_ID_LENGTH, USER_AGENT_CACHE_SIZE
 
 if TYPE_CHECKING:
+    from typing import Iterable
+
     from user_agents.parsers import UserAgent
 
     from django.db.models.base import ModelState
@@ -29,13 +32,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 __all__ = (
+    "build_name_from_user_agent",
+    "build_names_from_user_agents",
+    "user_agent_cache_info",
     "DeviceQuerySet",
     "DeviceManager",
     "Device",
 )
 
 
+@functools.lru_cache(maxsize=USER_AGENT_CACHE_SIZE)
 def build_name_from_user_agent(value: str) -> str:
+    """
+    Device name of a user agent string.
+
+    Results are kept in a bounded LRU, traffic only has a small set of
+    distinct user agents. See ``user_agent_cache_info()``.
+    """
     agent = user_agent_parse(value)  # type: UserAgent
     if agent.is_pc:
         return "{device} - {browser} on {os}".format(
@@ -58,10 +71,52 @@ def build_name_from_user_agent(value: str) -> str:
         )
 
 
+def build_names_from_user_agents(values: Iterable[str]) -> dict[str, str]:
+    """Device names of many user agent strings, parsing each distinct value once."""
+    return {
+        value: build_name_from_user_agent(value)
+        for value in set(map(str, values))
+    }
+
+
+def user_agent_cache_info() -> dict[str, int | float]:
+    info = build_name_from_user_agent.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
 class DeviceQuerySet(models.QuerySet):
     def owned(self, user: TokenUser) -> DeviceQuerySet:
         return self.filter(user_id=user.id)
 
+    def rebuild_names(self, *, batch_size: int = 500) -> int:
+        """
+        Recompute ``name`` from the stored user agent of every device,
+        in batches. Returns the number of renamed devices.
+        """
+        renamed = 0
+        batch = []
+        for instance in self.only("pk", "name", "device_property").iterator(
+                chunk_size=batch_size):  # type: Device
+            if not (user_agent := (instance.device_property or {}).get("user_agent")):
+                continue
+            if (name := build_name_from_user_agent(str(user_agent))) == instance.name:
+                continue
+            instance.name = name
+            batch.append(instance)
+            if len(batch) >= batch_size:
+                renamed += self.model.objects.bulk_update(batch, ["name"])
+                batch = []
+        if batch:
+            renamed += self.model.objects.bulk_update(batch, ["name"])
+        return renamed
+
     def annotate_current_session(
             self, session_id: int) -> DeviceQuerySet:
         return self.annotate(
@@ -117,6 +172,63 @@ class DeviceManager(_DeviceManagerBase, BaseManager):
             ])
         return instance
 
+    def upsert_from_messages(
+            self, messages: Iterable[authn_pb2.UserLoggedIn]) -> list[Device]:
+        """
+        Bulk version of ``create_from_message()``, one upsert for the
+        whole batch. Repeated logins of a device keep the last message.
+        """
+        current_time = timezone.now()
+
+        latest = {}  # type: dict[tuple[int, int, str], authn_pb2.UserLoggedIn]
+        for message in messages:
+            latest[(message.user_id, message.platform_id, message.device_id)] = message
+        if not latest:
+            return []
+
+        names = build_names_from_user_agents(
+            message.user_agent for message in latest.values())
+        existing_properties = {
+            (user_id, platform_id, device_id): device_property
+            for user_id, platform_id, device_id, device_property in self.filter(
+                user_id__in={key[0] for key in latest},
+                device_id__in={key[2] for key in latest},
+            ).values_list("user_id", "platform_id", "device_id", "device_property")
+        }
+
+        instances = []
+        for key, message in latest.items():
+            device_property = existing_properties.get(key) or {}
+            device_property["user_agent"] = message.user_agent
+            instances.append(self.model(
+                user_id=message.user_id,
+                platform_id=message.platform_id,
+                device_id=message.device_id,
+                name=names[message.user_agent],
+                device_property=device_property,
+                last_login=current_time,
+                last_login_ip=message.ip_address,
+                session_id=message.session_id))
+
+        self.bulk_create(
+            instances,
+            update_conflicts=True,
+            unique_fields=["user_id", "platform", "device_id"],
+            update_fields=[
+                "name",
+                "device_property",
+                "last_login",
+                "last_login_ip",
+                "session_id",
+            ])
+        # upserted rows do not get their pk back
+        return [
+            instance
+            for instance in self.filter(
+                session_id__in=[message.session_id for message in latest.values()])
+            if (instance.user_id, instance.platform_id, instance.device_id) in latest
+        ]
+
 
 class Device(get_subid_model()):
     _state: ModelState
@@ -181,26 +293,7 @@ class Device(get_subid_model()):
             save: bool = False) -> str:
         if not value:
             value = (self.device_property or {}).get("user_agent", None)
-        agent = user_agent_parse(str(value))  # type: UserAgent
-        if agent.is_pc:
-            result = "{device} - {browser} on {os}".format(
-                device=agent.get_device(),
-                browser=agent.browser.family,
-                os=agent.get_os(),
-            )
-        else:
-            device_name = None
-            if match := re.search(r"DeviceName=([^;]+)", value, re.IGNORECASE):
-                device_name = match.group(1)
-
-            agent_device = agent.get_device()
-            if device_name and device_name in agent_device:
-                device_name = agent.get_os()
-
-            result = "{device} - {name}".format(
-                device=agent_device,
-                name=(device_name or agent.browser.family),
-            )
+        result = build_name_from_user_agent(str(value))
         self.name = result
         if save:
             self.save(update_fields=["name"])
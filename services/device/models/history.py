@@ -11,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 from .constants import DEVICE_ID_LENGTH
 
 if TYPE_CHECKING:
+    from typing import Iterable
     from device.models import Device
 
 
@@ -50,6 +51,43 @@ class DeviceHistoryManager(_DeviceHistoryManagerBase, BaseManager):
         instance.save()
         return instance
 
+    def upsert_from_devices(self, devices: Iterable[Device]) -> None:
+        """Bulk version of ``create_from_device()``."""
+        devices = {
+            (device.user_id, device.device_id): device
+            for device in devices
+        }
+        if not devices:
+            return
+
+        instances = []
+        for instance in self.model.objects.filter(
+                is_revoked=False,
+                user_id__in={key[0] for key in devices},
+                device_id__in={key[1] for key in devices}):  # type: DeviceHistory
+            if (device := devices.pop(
+                    (instance.user_id, instance.device_id), None)) is None:
+                continue
+            instance.name = device.name
+            instance.device_property = device.device_property
+            instance.last_login = device.last_login
+            instances.append(instance)
+        if instances:
+            self.bulk_update(
+                instances, ["name", "device_property", "last_login"])
+
+        self.bulk_create([
+            self.model(
+                user_id=device.user_id,
+                device_id=device.device_id,
+                platform_id=device.platform_id,
+                registered_at=device.registered_at,
+                name=device.name,
+                device_property=device.device_property,
+                last_login=device.last_login)
+            for device in devices.values()
+        ])
+
 
 class DeviceHistory(models.Model):
     user_id = models.PositiveIntegerField(
@@ -10,8 +10,10 @@ from django.utils.translation import gettext_lazy as _
 
 from idvalid_core.models import get_subid_model
 
+from idvalid_integration.tasks.utils import collapse
 
 if TYPE_CHECKING:
+    from typing import Iterable
     from idvalid_integration.protos.models import authn_pb2
 
 
@@ -49,6 +51,26 @@ class PlatformManager(_PlatformManagerBase, BaseManager):
         instance.save()
         return instance
 
+    def upsert_from_messages(
+            self, messages: Iterable[authn_pb2.Platform]) -> None:
+        """Bulk version of ``create_or_update_from_message()``."""
+        messages = collapse(messages, key=lambda message: message.id)
+        self.bulk_create(
+            [
+                self.model(
+                    pk=message.id,
+                    subid=message.subid,
+                    name=message.name,
+                    platform_type=message.type,
+                    is_deleted=False,
+                    deleted_time=None)
+                for message in messages
+            ],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=[
+                "subid", "name", "platform_type", "is_deleted", "deleted_time"])
+
 
 class Platform(get_subid_model()):
     # platform_id = models.PositiveIntegerField(
@@ -1,4 +1,6 @@
 from django.dispatch import Signal
 
+# sent by `Device.create_history()`, the batched login consumer writes
+# the history itself and does not send it
 device_create_history = Signal()
 device_post_revoke = Signal()
@@ -21,6 +21,10 @@ ROUTING_CONSUME_AUTH_SESSION_DELETE = (
     f"{constants.ROUTING_AUTH_SESSION_PUBLISH_PREFIX}.delete")
 TASK_CONSUME_AUTH_SESSION_DELETE = constants.TASK_CONSUME_AUTH_SESSION_DELETE
 
+# micro-batches of the consume queue
+CONSUME_BATCH_SIZE = 100
+CONSUME_BATCH_INTERVAL = 0.5  # seconds
+
 
 EXCHANGE = constants.EXCHANGE_DEVICE
 
@@ -6,12 +6,13 @@ import logging
 from celery import current_app as celery_app
 
 from idvalid_integration.protos.models import authn_pb2
+from idvalid_integration.tasks.batches import BatchTask, decode_messages
 
-from device.models import Platform, Device
+from device.models import Platform, Device, DeviceHistory
 from device.tasks import constants
 
 if TYPE_CHECKING:
-    pass
+    from idvalid_integration.tasks.batches import BatchRequest
 
 
 logger = logging.getLogger(__name__)
@@ -27,46 +28,73 @@ __all__ = (
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_AUTH_PLATFORM_CREATE,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_auth_platform_create_task(message: bytes):
-    message = authn_pb2.Platform.FromString(message)
-    Platform.objects.create_or_update_from_message(message)
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_auth_platform_create_task(requests: list[BatchRequest]):
+    Platform.objects.upsert_from_messages(
+        decode_messages(requests, authn_pb2.Platform))
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_AUTH_PLATFORM_UPDATE,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_auth_platform_update_task(message: bytes):
-    message = authn_pb2.Platform.FromString(message)
-    Platform.objects.create_or_update_from_message(message)
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_auth_platform_update_task(requests: list[BatchRequest]):
+    Platform.objects.upsert_from_messages(
+        decode_messages(requests, authn_pb2.Platform))
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_AUTH_PLATFORM_DELETE,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_auth_platform_delete_task(message: bytes):
-    message = authn_pb2.Platform.FromString(message)
-    Platform.objects.filter(pk=message.id).delete()
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_auth_platform_delete_task(requests: list[BatchRequest]):
+    Platform.objects.filter(pk__in=[
+        message.id
+        for message in decode_messages(requests, authn_pb2.Platform)
+    ]).delete()
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_AUTH_USER_LOGGED_IN,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_auth_user_logged_in_task(message: bytes):
-    message = authn_pb2.UserLoggedIn.FromString(message)
-    device = Device.objects.create_from_message(message)
-    device.create_history()
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_auth_user_logged_in_task(requests: list[BatchRequest]):
+    # history is written here in the batch transaction, not through
+    # `Device.create_history()`: `device_create_history` is not sent and
+    # no per device internal task is queued
+    devices = Device.objects.upsert_from_messages(
+        decode_messages(requests, authn_pb2.UserLoggedIn))
+    DeviceHistory.objects.upsert_from_devices(devices)
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_AUTH_SESSION_DELETE,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_auth_session_delete_task(message: bytes):
-    message = authn_pb2.Session.FromString(message)
-    Device.objects.filter(session_id=message.id).delete()
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_auth_session_delete_task(requests: list[BatchRequest]):
+    Device.objects.filter(session_id__in=[
+        message.id
+        for message in decode_messages(requests, authn_pb2.Session)
+    ]).delete()
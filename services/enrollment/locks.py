@@ -1,29 +1,42 @@
 from __future__ import annotations
 
+import base64
 import logging
+import pickle
+import threading
 import time
+import uuid
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timezone as dt_timezone
 from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.core.cache import caches, DEFAULT_CACHE_ALIAS
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import connections, router
+from django.utils import timezone
 from django.utils.functional import cached_property
 
 if TYPE_CHECKING:
     from typing import Any, Self
     from django.core.cache.backends.base import BaseCache
+    from django.core.cache.backends.db import DatabaseCache
 
 
 logger = logging.getLogger(__name__)
-__all__ = ("CacheLockContext", "Timeout", "CacheLock")
+__all__ = (
+    "CacheLockContext", "Timeout",
+    "BaseLockBackend", "CacheLockBackend", "DatabaseLockBackend", "RedisLockBackend",
+    "CacheLock",
+)
 
 
 @dataclass
 class CacheLockContext:
     """A dataclass which holds the context for a ``CacheLock`` object."""
 
-    #: The path to the lock file.
+    #: The cache key of the lock.
     lock_key: str
 
     #: The default timeout value.
@@ -36,11 +49,23 @@ class CacheLockContext:
 
     cache_timeout: int
 
+    #: Keep extending the lock expiration while it is held.
+    auto_renew: bool = False
+
     #: The lock counter is used for implementing the nested locking mechanism.
     lock_counter: int = 0  # When the lock is acquired is increased and the lock is only released, when this value is 0
 
     success: bool = False
 
+    #: Owner token stored as the lock value, only the owner can release or renew.
+    owner: str | None = None
+
+    #: Monotonic token of the current acquisition, pass it to the protected
+    #: resource so writes of a previous (expired) owner can be rejected.
+    fencing_token: int | None = None
+
+    renew_stop: threading.Event | None = field(default=None, repr=False)
+
 
 class Timeout(TimeoutError):  # noqa: N818
     """Raised when the lock could not be acquired in *timeout* seconds."""
@@ -64,25 +89,264 @@ class Timeout(TimeoutError):  # noqa: N818
         return self._lock_key
 
 
+class BaseLockBackend:
+    #: Whether waiters are woken up on release instead of polling.
+    supports_wakeup = False
+
+    def acquire(self, key: str, owner: str, ttl: float | None) -> int | None:
+        """Take the lock, return the fencing token or ``None`` if held by someone else."""
+        raise NotImplementedError
+
+    def release(self, key: str, owner: str) -> bool:
+        raise NotImplementedError
+
+    def renew(self, key: str, owner: str, ttl: float | None) -> bool:
+        raise NotImplementedError
+
+    def wait(self, key: str, timeout: float | None, poll_interval: float):
+        """Block until the lock may be free, at most ``timeout`` seconds."""
+        if timeout is not None:
+            poll_interval = min(poll_interval, max(timeout, 0))
+        time.sleep(poll_interval)
+
+
+class CacheLockBackend(BaseLockBackend):
+    """
+    Polling lock on any django cache.
+
+    The cache API has no compare-and-delete, owner checked release and
+    renewal are a read followed by a write. Redis and database caches
+    have their own atomic backends.
+    """
+
+    def __init__(self, cache: BaseCache):
+        self.cache = cache
+
+    def acquire(self, key: str, owner: str, ttl: float | None) -> int | None:
+        if not self.cache.add(key, owner, ttl):
+            return None
+        fence_key = "%s:fence" % key
+        self.cache.add(fence_key, 0, None)
+        try:
+            return self.cache.incr(fence_key)
+        except ValueError:
+            # evicted between add and incr
+            self.cache.add(fence_key, 1, None)
+            return 1
+
+    def release(self, key: str, owner: str) -> bool:
+        if self.cache.get(key) != owner:
+            return False
+        self.cache.delete(key)
+        return True
+
+    def renew(self, key: str, owner: str, ttl: float | None) -> bool:
+        if self.cache.get(key) != owner:
+            return False
+        return self.cache.touch(key, ttl)
+
+
+class DatabaseLockBackend(CacheLockBackend):
+    """
+    Polling lock on a ``DatabaseCache``.
+
+    Owner checked release and renewal are a single conditional ``DELETE``
+    or ``UPDATE`` on the cache table, matching the stored owner value.
+    """
+    cache: DatabaseCache
+
+    def _execute(self, sql: str, key: str, owner: str, params: list) -> bool:
+        cache = self.cache
+        db = router.db_for_write(cache.cache_model_class)
+        connection = connections[db]
+        quote_name = connection.ops.quote_name
+        # stored as DatabaseCache.set does
+        value = base64.b64encode(pickle.dumps(owner, cache.pickle_protocol)).decode("latin1")
+        now = connection.ops.adapt_datetimefield_value(
+            timezone.now().replace(microsecond=0))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql % {
+                    "table": quote_name(cache._table),
+                    "key": quote_name("cache_key"),
+                    "value": quote_name("value"),
+                    "expires": quote_name("expires"),
+                },
+                [*params, cache.make_and_validate_key(key), value, now])
+            return cursor.rowcount > 0
+
+    def release(self, key: str, owner: str) -> bool:
+        return self._execute(
+            "DELETE FROM %(table)s "
+            "WHERE %(key)s = %%s AND %(value)s = %%s AND %(expires)s >= %%s",
+            key, owner, [])
+
+    def renew(self, key: str, owner: str, ttl: float | None) -> bool:
+        if (timeout := self.cache.get_backend_timeout(ttl)) is None:
+            expires = datetime.max
+        else:
+            expires = datetime.fromtimestamp(
+                timeout, tz=dt_timezone.utc if settings.USE_TZ else None)
+        db = router.db_for_write(self.cache.cache_model_class)
+        expires = connections[db].ops.adapt_datetimefield_value(
+            expires.replace(microsecond=0))
+        return self._execute(
+            "UPDATE %(table)s SET %(expires)s = %%s "
+            "WHERE %(key)s = %%s AND %(value)s = %%s AND %(expires)s >= %%s",
+            key, owner, [expires])
+
+
+ACQUIRE_SCRIPT = """
+local ok
+if ARGV[2] == '' then
+  ok = redis.call('SET', KEYS[1], ARGV[1], 'NX')
+else
+  ok = redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2])
+end
+if not ok then
+  return 0
+end
+return redis.call('INCR', KEYS[2])
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+  return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('RPUSH', KEYS[2], 1)
+redis.call('PEXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+
+RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+  return 0
+end
+if ARGV[2] == '' then
+  return redis.call('PERSIST', KEYS[1])
+end
+return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+"""
+
+
+class RedisLockBackend(BaseLockBackend):
+    """
+    Lock on a Redis protocol server.
+
+    Acquire (``SET NX`` plus fencing ``INCR``), release and renew are
+    single atomic scripts checking the owner token. Release pushes to a
+    signal list that waiters block on (``BLPOP``), so a waiter wakes up
+    as soon as the lock is freed instead of polling. Waits are bounded
+    by the remaining lock ttl, an expired lock is picked up as well.
+    """
+    supports_wakeup = True
+    #: Upper bound of a single blocking wait when the lock has no ttl.
+    max_wait = 1.0
+    #: How long an unconsumed release signal is kept (milliseconds).
+    signal_ttl = 10000
+
+    def __init__(self, client, *, key_func=None):
+        self.client = client
+        self.key_func = key_func
+        self._acquire = client.register_script(ACQUIRE_SCRIPT)
+        self._release = client.register_script(RELEASE_SCRIPT)
+        self._renew = client.register_script(RENEW_SCRIPT)
+
+    @classmethod
+    def from_cache(cls, cache: BaseCache) -> RedisLockBackend:
+        """Use the connection pool and key prefix of a ``RedisCache``."""
+        # noinspection PyProtectedMember
+        return cls(cache._cache.get_client(write=True), key_func=cache.make_key)
+
+    def make_key(self, key: str) -> str:
+        if self.key_func is None:
+            return key
+        return self.key_func(key)
+
+    @staticmethod
+    def _ttl_ms(ttl: float | None) -> str:
+        return "" if ttl is None else str(max(1, int(ttl * 1000)))
+
+    def acquire(self, key: str, owner: str, ttl: float | None) -> int | None:
+        key = self.make_key(key)
+        fencing_token = self._acquire(
+            keys=[key, "%s:fence" % key], args=[owner, self._ttl_ms(ttl)])
+        return int(fencing_token) or None
+
+    def release(self, key: str, owner: str) -> bool:
+        key = self.make_key(key)
+        return bool(self._release(
+            keys=[key, "%s:signal" % key], args=[owner, self.signal_ttl]))
+
+    def renew(self, key: str, owner: str, ttl: float | None) -> bool:
+        key = self.make_key(key)
+        return bool(self._renew(keys=[key], args=[owner, self._ttl_ms(ttl)]))
+
+    def wait(self, key: str, timeout: float | None, poll_interval: float):
+        key = self.make_key(key)
+        wait = self.max_wait if timeout is None else timeout
+        pttl = self.client.pttl(key)
+        if pttl == -2:
+            # released or expired meanwhile
+            return
+        if pttl > 0:
+            wait = min(wait, pttl / 1000)
+        else:
+            wait = min(wait, self.max_wait)
+        if wait <= 0:
+            return
+        try:
+            self.client.blpop(["%s:signal" % key], timeout=wait)
+        except Exception:  # noqa
+            logger.debug("blocking wait on %s failed, fallback to polling", key, exc_info=True)
+            super().wait(key, timeout, poll_interval)
+
+
+def get_lock_backend(client: BaseCache) -> BaseLockBackend:
+    path = f"{client.__class__.__module__}.{client.__class__.__qualname__}"
+    if path == "django.core.cache.backends.redis.RedisCache":
+        return RedisLockBackend.from_cache(client)
+    if path == "django.core.cache.backends.db.DatabaseCache":
+        return DatabaseLockBackend(client)
+    return CacheLockBackend(client)
+
+
 class CacheLock:
+    """
+    Distributed mutex on the cache.
+
+    Redis caches get owner checked atomic operations and release wakeup
+    (``RedisLockBackend``), database caches owner checked statements
+    (``DatabaseLockBackend``), other caches fall back to polling
+    (``CacheLockBackend``). ``fencing_token`` increases with every
+    acquisition of the key. ``auto_renew`` keeps extending the lock by
+    ``cache_timeout`` while it is held.
+    """
+
     def __init__(
             self, lock_key: str, *,
             timeout: int = 10,
             blocking: bool = True,
             client: str | BaseCache = None,
-            cache_timeout: int = DEFAULT_TIMEOUT):
+            cache_timeout: int = DEFAULT_TIMEOUT,
+            auto_renew: bool = False,
+            backend: BaseLockBackend = None):
 
         if client is None:
             client = caches[DEFAULT_CACHE_ALIAS]
 
         kwargs: dict[str, "Any"] = {
-            "lock_file": lock_key,
+            "lock_key": lock_key,
             "timeout": timeout,
             "blocking": blocking,
             "client": client,
             "cache_timeout": cache_timeout,
+            "auto_renew": auto_renew,
         }
         self._context = CacheLockContext(**kwargs)
+        if backend is not None:
+            self.backend = backend
 
     @property
     def lock_key(self) -> str:
@@ -113,6 +377,10 @@ class CacheLock:
             return caches[_client]
         return _client
 
+    @cached_property
+    def backend(self) -> BaseLockBackend:
+        return get_lock_backend(self.client)
+
     @property
     def cache_timeout(self) -> int:
         return self._context.cache_timeout
@@ -121,6 +389,13 @@ class CacheLock:
     def cache_timeout(self, value: int):
         self._context.cache_timeout = value
 
+    @property
+    def ttl(self) -> float | None:
+        """Lock expiration in seconds, ``None`` never expires."""
+        if (cache_timeout := self.cache_timeout) is DEFAULT_TIMEOUT:
+            return self.client.default_timeout
+        return cache_timeout
+
     @property
     def lock_counter(self) -> int:
         return self._context.lock_counter
@@ -129,9 +404,19 @@ class CacheLock:
     def is_locked(self) -> bool:
         return self._context.success
 
+    @property
+    def fencing_token(self) -> int | None:
+        return self._context.fencing_token
+
     def _acquire(self):
-        if self.client.add(self.lock_key, True, self.cache_timeout):
+        owner = uuid.uuid4().hex
+        fencing_token = self.backend.acquire(self.lock_key, owner, self.ttl)
+        if fencing_token is not None:
+            self._context.owner = owner
+            self._context.fencing_token = fencing_token
             self._context.success = True
+            if self._context.auto_renew and self.ttl:
+                self._start_renewal()
 
     def acquire(
         self, *,
@@ -168,21 +453,52 @@ class CacheLock:
                     logger.debug("Failed to immediately acquire lock %s on %s", lock_id, lock_key)
                     raise Timeout(lock_key)  # noqa: TRY301
 
-                if 0 <= timeout < time.perf_counter() - start_time:
+                elapsed = time.perf_counter() - start_time
+                if 0 <= timeout < elapsed:
                     logger.debug("Timeout on acquiring lock %s on %s", lock_id, lock_key)
                     raise Timeout(lock_key)  # noqa: TRY301
 
-                msg = "Lock %s not acquired on %s, waiting %s seconds ..."
-                logger.debug(msg, lock_id, lock_key, poll_interval)
-                time.sleep(poll_interval)
+                logger.debug("Lock %s not acquired on %s, waiting ...", lock_id, lock_key)
+                self.backend.wait(
+                    lock_key,
+                    timeout - elapsed if timeout >= 0 else None,
+                    poll_interval)
 
         except BaseException:  # Something did go wrong, so decrement the counter.
             self._context.lock_counter = max(0, self._context.lock_counter - 1)
             raise
         return self
 
+    def renew(self, ttl: float | None = None) -> bool:
+        """Extend the lock expiration, ``False`` if the lock was lost."""
+        if not self.is_locked:
+            return False
+        if ttl is None:
+            ttl = self.ttl
+        return self.backend.renew(self.lock_key, self._context.owner, ttl)
+
+    def _start_renewal(self):
+        stop = self._context.renew_stop = threading.Event()
+        interval = self.ttl / 3
+
+        def renew_loop():
+            while not stop.wait(interval):
+                if not self.renew():
+                    logger.warning("Lock %s on %s lost before release", id(self), self.lock_key)
+                    return
+
+        thread = threading.Thread(
+            target=renew_loop, name=f"lock-renew:{self.lock_key}", daemon=True)
+        thread.start()
+
     def _release(self) -> None:
-        self.client.delete(self.lock_key)
+        if (stop := self._context.renew_stop) is not None:
+            stop.set()
+            self._context.renew_stop = None
+        if not self.backend.release(self.lock_key, self._context.owner):
+            logger.warning("Lock %s on %s expired before release", id(self), self.lock_key)
+        self._context.owner = None
+        self._context.fencing_token = None
         self._context.success = False
 
     def release(self, force: bool = False):
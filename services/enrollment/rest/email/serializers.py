@@ -8,7 +8,6 @@ from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
-# from enrollment.locks import CacheLock
 from enrollment.models import Enrollment, Otp, constants, Code, Email
 from enrollment.settings import enrollment_settings
 
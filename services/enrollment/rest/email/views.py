@@ -4,9 +4,13 @@ from typing import TYPE_CHECKING
 import logging
 
 from rest_framework import status
+from rest_framework.exceptions import Throttled
 from rest_framework.generics import CreateAPIView
 from rest_framework.response import Response
 
+from enrollment.locks import CacheLock, Timeout
+from enrollment.settings import enrollment_settings
+
 from .serializers import OTPSerializer, CreateSerializer
 
 if TYPE_CHECKING:
@@ -41,3 +45,21 @@ class EnrollmentView(CreateAPIView):
 class CreateView(CreateAPIView):
     serializer_class = CreateSerializer
     authentication_classes = ()
+
+    def create(self, request, *args, **kwargs):
+        # the resend check and the code creation of one email must not
+        # interleave with a concurrent request
+        if not isinstance(email := request.data.get("email"), str) or not email:
+            return super().create(request, *args, **kwargs)
+        lock = CacheLock(
+            f"enrollment:email:{email.strip().lower()}",
+            timeout=enrollment_settings.EMAIL_LOCK_TIMEOUT,
+            cache_timeout=enrollment_settings.EMAIL_LOCK_TTL)
+        try:
+            lock.acquire()
+        except Timeout:
+            raise Throttled()
+        try:
+            return super().create(request, *args, **kwargs)
+        finally:
+            lock.release()
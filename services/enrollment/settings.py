@@ -13,9 +13,14 @@ __all__ = ("enrollment_settings",)
 DEFAULTS = {
     "OTP_DEFAULT_RESEND": 3 * 60,  # 3 minutes
     "OTP_DEFAULT_DURATION": 60 * 10,  # 10 minutes (600 seconds)
+    "EMAIL_LOCK_TIMEOUT": 5,  # seconds waiting for a concurrent request of the same email
+    "EMAIL_LOCK_TTL": 30,  # seconds
 }
 
-MANDATORY = ("OTP_DEFAULT_RESEND", "OTP_DEFAULT_DURATION")
+MANDATORY = (
+    "OTP_DEFAULT_RESEND", "OTP_DEFAULT_DURATION",
+    "EMAIL_LOCK_TIMEOUT", "EMAIL_LOCK_TTL",
+)
 
 
 enrollment_settings = AppSetting(
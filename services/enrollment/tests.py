@@ -1,3 +1,30 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from enrollment.locks import CacheLock, DatabaseLockBackend
+
+
+class DatabaseLockTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_backend(self):
+        self.assertIsInstance(CacheLock("lock").backend, DatabaseLockBackend)
+
+    def test_only_owner_releases(self):
+        backend = DatabaseLockBackend(cache)
+        self.assertEqual(backend.acquire("lock", "a", 60), 1)
+        self.assertIsNone(backend.acquire("lock", "b", 60))
+        self.assertFalse(backend.release("lock", "b"))
+        self.assertFalse(backend.renew("lock", "b", 60))
+        self.assertTrue(backend.renew("lock", "a", 120))
+        self.assertTrue(backend.release("lock", "a"))
+        self.assertFalse(backend.release("lock", "a"))
+        self.assertEqual(backend.acquire("lock", "b", 60), 2)
+
+    def test_stale_owner_keeps_reacquired_lock(self):
+        lock = CacheLock("lock", cache_timeout=60).acquire()
+        # expired and taken by another owner meanwhile
+        cache.set("lock", "other", 60)
+        lock.release()
+        self.assertEqual(cache.get("lock"), "other")
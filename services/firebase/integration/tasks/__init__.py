@@ -0,0 +1 @@
+from .push import *
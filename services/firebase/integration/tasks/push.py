@@ -0,0 +1,33 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import logging
+
+from idvalid_integration.tasks import call_task
+
+from firebase.tasks import constants
+
+if TYPE_CHECKING:
+    from celery import Celery
+    from firebase.push import PushNotification
+
+
+logger = logging.getLogger(__name__)
+__all__ = (
+    "call_push_send",
+)
+
+
+def call_push_send(
+        notification: PushNotification, *,
+        attempt: int = 0,
+        app: Celery = None,
+        **task_opts):
+    return call_task(
+        constants.TASK_PUSH_SEND,
+        app=app,
+        args=tuple(notification),
+        kwargs={"attempt": attempt},
+        exchange=constants.EXCHANGE,
+        routing_key=constants.ROUTING_PUSH,
+        **task_opts)
@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from firebase.models import PushToken
+from firebase.settings import firebase_settings
+
+
+class Command(BaseCommand):
+    help = 'Delete the records of push tokens dead for longer than the retention, run it daily'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int,
+                            help="Days dead tokens are kept. Defaults to PUSH_TOKEN_RETENTION_DAYS")
+
+    def handle(self, *args, days, **options):
+        if days is None:
+            days = firebase_settings.PUSH_TOKEN_RETENTION_DAYS
+        deleted = PushToken.objects.prune(timezone.now() - timedelta(days=days))
+        self.stdout.write("%d dead push tokens deleted" % deleted)
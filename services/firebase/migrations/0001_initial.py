@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PushToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=512, unique=True, verbose_name='token')),
+                ('failure_count', models.PositiveIntegerField(default=0, verbose_name='failure count')),
+                ('last_error', models.CharField(blank=True, max_length=64, verbose_name='last error')),
+                ('last_failure_time', models.DateTimeField(blank=True, null=True, verbose_name='last failure time')),
+                ('dead_time', models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='dead time')),
+            ],
+        ),
+    ]
@@ -0,0 +1 @@
+from .push_token import *
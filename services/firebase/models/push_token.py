@@ -0,0 +1,114 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import logging
+
+from django.db import models, transaction
+from django.db.models.manager import BaseManager
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from firebase.settings import firebase_settings
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Iterable
+
+
+logger = logging.getLogger(__name__)
+__all__ = (
+    "PushTokenQuerySet",
+    "PushTokenManager",
+    "PushToken",
+)
+
+
+class PushTokenQuerySet(models.QuerySet):
+    def dead(self) -> PushTokenQuerySet:
+        return self.filter(dead_time__isnull=False)
+
+    def alive(self) -> PushTokenQuerySet:
+        return self.filter(dead_time__isnull=True)
+
+
+_PushTokenManagerBase = models.Manager.from_queryset(
+    PushTokenQuerySet
+)  # type: type[PushTokenQuerySet]
+
+
+class PushTokenManager(_PushTokenManagerBase, BaseManager):
+    def dead_tokens(self, tokens: Iterable[str]) -> set[str]:
+        return set(self.dead().filter(
+            token__in=set(tokens)).values_list("token", flat=True))
+
+    def record_results(
+            self, *,
+            succeeded: Iterable[str] = (),
+            failed: dict[str, str] = None,
+            dead: dict[str, str] = None):
+        """
+        Update the failure records of a dispatched batch.
+
+        Tokens that ``succeeded`` lose their failure record. ``failed``
+        tokens (token to error code) count a failure and are marked dead
+        after ``PUSH_TOKEN_MAX_FAILURES`` of them, ``dead`` tokens are marked
+        dead right away.
+        """
+        with transaction.atomic(using=self.db):
+            self._record_results(set(succeeded), failed or {}, dead or {})
+
+    def _record_results(
+            self, succeeded: set[str],
+            failed: dict[str, str], dead: dict[str, str]):
+        if succeeded:
+            self.alive().filter(token__in=succeeded).delete()
+        if not failed and not dead:
+            return
+
+        now = timezone.now()
+        max_failures = firebase_settings.PUSH_TOKEN_MAX_FAILURES
+        existing = self.in_bulk(
+            [*failed, *dead], field_name="token")  # type: dict[str, PushToken]
+        for token, error in [*failed.items(), *dead.items()]:
+            if (instance := existing.get(token)) is None:
+                instance = existing[token] = PushToken(token=token)
+            instance.failure_count += 1
+            instance.last_error = error
+            instance.last_failure_time = now
+            if instance.dead_time is None and (
+                    token in dead or instance.failure_count >= max_failures):
+                instance.dead_time = now
+                logger.info("push token %s... is dead: %s", token[:16], error)
+
+        created = [i for i in existing.values() if i.pk is None]
+        updated = [i for i in existing.values() if i.pk is not None]
+        if created:
+            # another worker may record the same token, its row wins
+            self.bulk_create(created, ignore_conflicts=True)
+        if updated:
+            self.bulk_update(updated, [
+                "failure_count", "last_error", "last_failure_time", "dead_time"])
+
+    def prune(self, before: datetime) -> int:
+        """Delete records of tokens dead since before ``before``."""
+        deleted, _ = self.dead().filter(dead_time__lt=before).delete()
+        return deleted
+
+
+class PushToken(models.Model):
+    """Failure record of a push registration token."""
+    token = models.CharField(
+        _("token"), max_length=512, unique=True)
+    failure_count = models.PositiveIntegerField(
+        _("failure count"), default=0)
+    last_error = models.CharField(
+        _("last error"), max_length=64, blank=True)
+    last_failure_time = models.DateTimeField(
+        _("last failure time"), null=True, blank=True)
+    dead_time = models.DateTimeField(
+        _("dead time"), null=True, blank=True, db_index=True)
+
+    objects = PushTokenManager()
+
+    def is_dead(self) -> bool:
+        return self.dead_time is not None
@@ -0,0 +1,128 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+
+import logging
+
+from firebase_admin import exceptions, messaging
+
+from django.db import DatabaseError, transaction
+
+from firebase.integration import tasks
+from firebase.models import PushToken
+from firebase.settings import firebase_settings
+
+if TYPE_CHECKING:
+    pass
+
+
+logger = logging.getLogger(__name__)
+__all__ = (
+    "PushNotification",
+    "send_push",
+    "dispatch",
+)
+
+
+# the token will never receive messages again
+DEAD_TOKEN_ERRORS = (
+    messaging.UnregisteredError,
+    messaging.SenderIdMismatchError,
+)
+# FCM or the connection failed, the message is sent again later
+RETRY_ERRORS = (
+    messaging.QuotaExceededError,
+    exceptions.UnavailableError,
+    exceptions.InternalError,
+    exceptions.DeadlineExceededError,
+    exceptions.UnknownError,
+)
+SEND_EACH_LIMIT = 500
+
+
+class PushNotification(NamedTuple):
+    token: str
+    title: str
+    body: str
+    data: dict[str, str] | None = None
+
+    def build_message(self) -> messaging.Message:
+        return messaging.Message(
+            notification=messaging.Notification(
+                title=self.title, body=self.body),
+            token=self.token,
+            data=self.data)
+
+
+def send_push(notification: PushNotification, *, using: str = None):
+    """
+    Send ``notification`` from the push worker once the current
+    transaction commits, the caller does not wait for FCM.
+    """
+    transaction.on_commit(
+        lambda: tasks.call_push_send(notification), using=using)
+
+
+def retry_countdown(attempt: int) -> float:
+    return min(
+        firebase_settings.PUSH_RETRY_BACKOFF * 2 ** attempt,
+        firebase_settings.PUSH_RETRY_BACKOFF_MAX)
+
+
+def dispatch(items: list[tuple[PushNotification, int]]):
+    """
+    Send notifications with their attempt number through
+    ``messaging.send_each``.
+
+    The worker process keeps the firebase app, and with it the HTTP
+    session to FCM, between batches. Messages to dead tokens are dropped,
+    retriable errors are sent again with an exponential backoff and the
+    token failure records are updated.
+
+    Runs outside a transaction and does not raise on database errors, the
+    failure records are best effort and a batch is never sent twice.
+    """
+    try:
+        dead_tokens = PushToken.objects.dead_tokens(n.token for n, _ in items)
+    except DatabaseError:
+        logger.exception("could not load dead push tokens")
+        dead_tokens = set()
+    if dead_tokens:
+        logger.debug("dropping %d pushes to dead tokens", len(dead_tokens))
+        items = [item for item in items if item[0].token not in dead_tokens]
+
+    succeeded, failed, dead = set(), {}, {}
+    for start in range(0, len(items), SEND_EACH_LIMIT):
+        chunk = items[start:start + SEND_EACH_LIMIT]
+        try:
+            response = messaging.send_each(
+                [notification.build_message() for notification, _ in chunk])
+        except exceptions.FirebaseError as e:
+            logger.warning("push batch of %d failed: %r", len(chunk), e)
+            errors = [e] * len(chunk)
+        else:
+            errors = [r.exception for r in response.responses]
+
+        for (notification, attempt), error in zip(chunk, errors):
+            token = notification.token
+            if error is None:
+                succeeded.add(token)
+            elif isinstance(error, DEAD_TOKEN_ERRORS):
+                dead[token] = type(error).__name__
+            elif (isinstance(error, RETRY_ERRORS)
+                  and attempt < firebase_settings.PUSH_MAX_RETRIES):
+                retry(notification, attempt + 1)
+            else:
+                logger.warning("push to %s... failed: %r", token[:16], error)
+                failed[token] = type(error).__name__
+
+    try:
+        PushToken.objects.record_results(
+            succeeded=succeeded, failed=failed, dead=dead)
+    except DatabaseError:
+        logger.exception("could not record push results")
+
+
+def retry(notification: PushNotification, attempt: int):
+    countdown = retry_countdown(attempt - 1)
+    transaction.on_commit(lambda: tasks.call_push_send(
+        notification, attempt=attempt, countdown=countdown))
@@ -12,6 +12,15 @@ __all__ = ("firebase_settings",)
 
 DEFAULTS = {
     "KEY_JSON_FILE": "",
+
+    # push dispatcher
+    "PUSH_MAX_RETRIES": 5,
+    "PUSH_RETRY_BACKOFF": 2,  # seconds, doubled on each retry
+    "PUSH_RETRY_BACKOFF_MAX": 300,  # seconds
+    # failed sends before a token is considered dead
+    "PUSH_TOKEN_MAX_FAILURES": 3,
+    # days dead tokens are kept, see the prunepushtokens command
+    "PUSH_TOKEN_RETENTION_DAYS": 30,
 }
 
 
@@ -0,0 +1,13 @@
+from idvalid_integration.tasks import constants
+
+
+EXCHANGE = constants.EXCHANGE_FIREBASE
+
+QUEUE_PUSH = "idvalid.firebase.push"
+ROUTING_PUSH = "firebase.push"
+
+TASK_PUSH_SEND = "idvalid.firebase.push.send"
+
+# micro-batches sent with messaging.send_each, at most 500 messages
+PUSH_BATCH_SIZE = 100
+PUSH_BATCH_INTERVAL = 0.2  # seconds
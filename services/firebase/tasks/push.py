@@ -0,0 +1,34 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import logging
+
+from celery import current_app as celery_app
+
+from idvalid_integration.tasks.batches import BatchTask
+
+from firebase.push import PushNotification, dispatch
+from firebase.tasks import constants
+
+if TYPE_CHECKING:
+    from idvalid_integration.tasks.batches import BatchRequest
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("push_send_task",)
+
+
+@celery_app.task(
+    base=BatchTask,
+    name=constants.TASK_PUSH_SEND,
+    queue=constants.QUEUE_PUSH,
+    shared=False,
+    flush_every=constants.PUSH_BATCH_SIZE,
+    flush_interval=constants.PUSH_BATCH_INTERVAL,
+    # FCM sends are not rolled back, a batch is never sent twice
+    atomic=False)
+def push_send_task(requests: list[BatchRequest]):
+    dispatch([
+        (PushNotification(*request.args), request.kwargs.get("attempt", 0))
+        for request in requests
+    ])
@@ -1,3 +1,87 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from firebase_admin import exceptions, messaging
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from firebase.models import PushToken
+from firebase.push import PushNotification, dispatch
+
+
+class _FakeFCM:
+    """Stand-in of ``messaging.send_each``, answers by token."""
+
+    def __init__(self, errors: dict[str, Exception] = None):
+        self.errors = errors or {}
+        self.sent = []  # type: list[str]
+
+    def send_each(self, messages: list[messaging.Message]):
+        self.sent.extend(message.token for message in messages)
+        return SimpleNamespace(responses=[
+            SimpleNamespace(exception=self.errors.get(message.token))
+            for message in messages])
+
+
+def notification(token: str) -> PushNotification:
+    return PushNotification(token=token, title="title", body="body")
+
+
+@override_settings(IDVALID_FIREBASE_SETTINGS={
+    "PUSH_MAX_RETRIES": 2,
+    "PUSH_RETRY_BACKOFF": 2,
+    "PUSH_RETRY_BACKOFF_MAX": 300,
+    "PUSH_TOKEN_MAX_FAILURES": 2,
+})
+class DispatchTests(TestCase):
+    def dispatch(self, fcm: _FakeFCM, items: list[tuple[PushNotification, int]]) -> mock.Mock:
+        with mock.patch("firebase.push.messaging.send_each", fcm.send_each), \
+                mock.patch("firebase.push.tasks.call_push_send") as call_push_send, \
+                self.captureOnCommitCallbacks(execute=True):
+            dispatch(items)
+        return call_push_send
+
+    def test_dead_tokens_are_dropped(self):
+        fcm = _FakeFCM({"gone": messaging.UnregisteredError("unregistered")})
+        self.dispatch(fcm, [(notification("gone"), 0), (notification("ok"), 0)])
+        self.assertTrue(PushToken.objects.get(token="gone").is_dead())
+
+        self.dispatch(fcm, [(notification("gone"), 0), (notification("ok"), 0)])
+        self.assertEqual(fcm.sent, ["gone", "ok", "ok"])
+
+    def test_retriable_errors_are_republished(self):
+        fcm = _FakeFCM({"busy": exceptions.UnavailableError("unavailable")})
+        call_push_send = self.dispatch(fcm, [(notification("busy"), 0), (notification("last"), 1)])
+        self.assertEqual(call_push_send.call_args_list, [
+            mock.call(notification("busy"), attempt=1, countdown=2),
+        ])
+        # out of retries
+        fcm.errors["last"] = exceptions.UnavailableError("unavailable")
+        call_push_send = self.dispatch(fcm, [(notification("last"), 2)])
+        call_push_send.assert_not_called()
+        self.assertEqual(PushToken.objects.get(token="last").failure_count, 1)
+
+    def test_record_results(self):
+        PushToken.objects.record_results(failed={"a": "InvalidArgumentError"})
+        token = PushToken.objects.get(token="a")
+        self.assertEqual((token.failure_count, token.is_dead()), (1, False))
+
+        PushToken.objects.record_results(failed={"a": "InvalidArgumentError"}, dead={"b": "UnregisteredError"})
+        token = PushToken.objects.get(token="a")
+        self.assertEqual((token.failure_count, token.is_dead()), (2, True))
+        self.assertTrue(PushToken.objects.get(token="b").is_dead())
+
+        # a success clears the record of a live token only
+        PushToken.objects.record_results(failed={"c": "InternalError"})
+        PushToken.objects.record_results(succeeded=["a", "c"])
+        self.assertEqual(set(PushToken.objects.values_list("token", flat=True)), {"a", "b"})
+
+    def test_prune(self):
+        PushToken.objects.record_results(dead={"old": "UnregisteredError", "new": "UnregisteredError"})
+        PushToken.objects.filter(token="old").update(dead_time=timezone.now() - timedelta(days=31))
+        call_command("prunepushtokens", stdout=StringIO())
+        self.assertEqual(list(PushToken.objects.values_list("token", flat=True)), ["new"])
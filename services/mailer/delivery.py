@@ -0,0 +1,221 @@
+"""Batched delivery engine for queued messages."""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import logging
+import smtplib
+import threading
+import time
+import traceback
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models.query import Prefetch
+from django.utils import timezone
+
+from mailer.backends import EmailBackend
+from mailer.models import (
+    Sender,
+    MessageQueue,
+    QueueAlternative)
+from mailer.settings import mailer_settings
+
+if TYPE_CHECKING:
+    from typing import Hashable, Sequence
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("SMTPConnectionPool", "connection_pool", "DeliveryEngine")
+
+
+class SMTPConnectionPool:
+    """Keep authenticated SMTP connections per sender open between batches.
+
+    A connection is checked out by one caller at a time: ``get`` takes it
+    out of the pool and ``release`` puts it back, concurrent callers of the
+    same sender open their own. Idle connections unused for longer than
+    ``idle_timeout`` seconds are closed and reopened on next use.
+    """
+
+    def __init__(self, idle_timeout: int = None):
+        self._idle_timeout = idle_timeout
+        self._backends = {}  # type: dict[Hashable, list[tuple[EmailBackend, float]]]
+        self._lock = threading.Lock()
+
+    @property
+    def idle_timeout(self) -> int:
+        if self._idle_timeout is None:
+            return mailer_settings.SMTP_IDLE_TIMEOUT
+        return self._idle_timeout
+
+    @staticmethod
+    def get_key(sender: Sender | None) -> Hashable:
+        if sender is None:
+            return None
+        # reconnect when sender credentials are modified
+        return sender.pk, sender.modified
+
+    def get(self, sender: Sender | None) -> EmailBackend:
+        """Check out an open connection of ``sender``, ``release`` it after use."""
+        key = self.get_key(sender)
+        with self._lock:
+            try:
+                backend, last_used = self._backends[key].pop()
+            except (KeyError, IndexError):
+                backend = last_used = None
+            else:
+                if not self._backends[key]:
+                    del self._backends[key]
+        if backend is None:
+            backend = EmailBackend(sender=sender)
+        elif time.monotonic() - last_used > self.idle_timeout:
+            backend.close()
+        backend.open()
+        return backend
+
+    def release(self, sender: Sender | None, backend: EmailBackend):
+        key = self.get_key(sender)
+        with self._lock:
+            self._backends.setdefault(key, []).append((backend, time.monotonic()))
+
+    def close_idle(self):
+        now = time.monotonic()
+        idle = []
+        with self._lock:
+            for key, entries in list(self._backends.items()):
+                idle.extend(b for b, last_used in entries if now - last_used > self.idle_timeout)
+                if entries := [e for e in entries if now - e[1] <= self.idle_timeout]:
+                    self._backends[key] = entries
+                else:
+                    del self._backends[key]
+        for backend in idle:
+            backend.close()
+
+    def close_all(self):
+        with self._lock:
+            backends = [b for entries in self._backends.values() for b, _ in entries]
+            self._backends.clear()
+        for backend in backends:
+            backend.close()
+
+
+connection_pool = SMTPConnectionPool()
+
+
+class DeliveryEngine:
+    def __init__(
+            self, *,
+            batch_size: int = None,
+            pool: SMTPConnectionPool = None):
+        if batch_size is None:
+            batch_size = mailer_settings.DELIVERY_BATCH_SIZE
+        self.batch_size = batch_size
+        self.pool = pool or connection_pool
+
+    def claim(
+            self, *, sender_id: int = None,
+            ids: Sequence[int] = None) -> list[int]:
+        """Mark a batch of pending rows as executed and return their ids.
+
+        Rows locked by another worker are skipped, so concurrent drains
+        never pick the same message. ``ids`` limits the batch to those rows.
+        """
+        with transaction.atomic():
+            queryset = MessageQueue.objects.select_for_update(
+                skip_locked=True
+            ).filter(executed__isnull=True)
+            if sender_id is not None:
+                queryset = queryset.filter(sender_id=sender_id)
+            if ids is not None:
+                queryset = queryset.filter(pk__in=ids)
+            ids = list(queryset.order_by("pk").values_list(
+                "pk", flat=True)[:self.batch_size])
+            if ids:
+                MessageQueue.objects.filter(pk__in=ids).update(
+                    executed=timezone.now())
+        return ids
+
+    # noinspection PyMethodMayBeStatic
+    def load(self, ids: Sequence[int]) -> list[MessageQueue]:
+        return list(MessageQueue.objects.select_related(
+            "sender", "body_template"
+        ).prefetch_related(
+            Prefetch(
+                "alternatives",
+                queryset=QueueAlternative.objects.select_related(
+                    "template"
+                )
+            ),
+            "attachments"
+        ).filter(pk__in=ids).order_by("pk"))
+
+    # noinspection PyMethodMayBeStatic
+    def _send_one(self, backend: EmailBackend, queue: MessageQueue):
+        message = queue.build_message()
+        try:
+            # noinspection PyProtectedMember
+            sent = backend._send(message)
+        except smtplib.SMTPServerDisconnected:
+            logger.info("smtp connection lost, reconnecting")
+            backend.close()
+            backend.open()
+            # noinspection PyProtectedMember
+            sent = backend._send(message)
+        if not sent:
+            raise ValueError("message has no recipients")
+
+    def send_group(
+            self, sender: Sender | None,
+            queues: Sequence[MessageQueue]):
+        try:
+            if not sender:
+                # same as `MessageQueue.send`
+                raise ValueError("sender is empty")
+            backend = self.pool.get(sender)
+        except Exception:  # noqa
+            exception = traceback.format_exc()
+            for queue in queues:
+                queue.exception = exception
+                queue.finished = timezone.now()
+            return
+
+        try:
+            for queue in queues:
+                try:
+                    self._send_one(backend, queue)
+                except Exception:  # noqa
+                    queue.exception = traceback.format_exc()
+                else:
+                    queue.exception = None
+                queue.finished = timezone.now()
+        finally:
+            self.pool.release(sender, backend)
+
+    def deliver(self, queues: Sequence[MessageQueue]):
+        groups = defaultdict(list)
+        senders = {}
+        for queue in queues:
+            groups[queue.sender_id].append(queue)
+            senders[queue.sender_id] = queue.sender
+        for sender_id, members in groups.items():
+            self.send_group(senders[sender_id], members)
+        MessageQueue.objects.bulk_update(
+            queues, ["finished", "exception"])
+
+    def drain(
+            self, *, sender_id: int = None,
+            ids: Sequence[int] = None,
+            max_batches: int = None) -> int:
+        """Deliver pending messages batch by batch, return the number processed."""
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            if not (claimed := self.claim(sender_id=sender_id, ids=ids)):
+                break
+            queues = self.load(claimed)
+            self.deliver(queues)
+            total += len(queues)
+            batches += 1
+        self.pool.close_idle()
+        return total
@@ -177,6 +177,12 @@ class MessageQueue(models.Model):
 
         exc = None
         self.executed = timezone.now()
+        if save and self.pk is not None:
+            # a drain may have claimed the row since it was loaded
+            if not MessageQueue.objects.filter(
+                    pk=self.pk, executed__isnull=True
+            ).update(executed=self.executed):
+                raise TypeError("already executed")
         try:
             sender.send_messages([self], fail_silently=fail_silently)
         except Exception as e:
@@ -11,10 +11,12 @@ from django.dispatch.dispatcher import receiver
 from django.template.loader import get_template
 from django.utils.translation import gettext_lazy as _
 
+from esl_core.serialization import unpack_data
+
 from .constants import DEFAULT_TEMPLATE_MIME_TYPE
 
 if TYPE_CHECKING:
-    from typing import Tuple
+    from typing import Iterable
     from django.template.backends.django import (
         Template as dj_Template)
 
@@ -37,9 +39,27 @@ class Template(models.Model):
     def __str__(self) -> str:
         return f"{self.code} ({self.pk})"
 
+    def get_compiled(self) -> dj_Template:
+        # compiled once per process by django's cached template loader
+        return get_template(self.template_path)
+
     def render(self, context: dict) -> str:
-        template = get_template(self.template_path)  # type: dj_Template
-        return template.render(context)
+        return self.get_compiled().render(context)
+
+    def render_many(
+            self, contexts: Iterable[dict | bytes | None]) -> list[str]:
+        """Render this template against many contexts.
+
+        Contexts may be given packed (as stored in
+        ``MessageQueue.context``), they are unpacked here.
+        """
+        template = self.get_compiled()
+        result = []
+        for context in contexts:
+            if isinstance(context, (bytes, memoryview)):
+                context = unpack_data(context)
+            result.append(template.render(context or {}))
+        return result
 
 
 @receiver(pre_save, sender=Template)
@@ -5,11 +5,11 @@ import logging
 
 from celery import current_app
 
+from django.db import transaction
 from django.dispatch.dispatcher import receiver
 
 from mailer.models import MessageQueue
 from mailer.signals import send_email
-# from mailer.tasks import send_mail_task
 
 if TYPE_CHECKING:
     from mailer.models import Sender
@@ -23,19 +23,22 @@ __all__ = ("on_send_email", )
 def on_send_email(
         instance: MessageQueue, mail_sender: Sender,
         fail_silently: bool, **kwargs):
-    current_app.send_task(
-        "esl.mailer.message_queue.int.send",
-        args=(instance.pk,),
-        kwargs={
-            "sender_id": mail_sender.pk if mail_sender else None,
-            "fail_silently": fail_silently
-        },
-        exchange="esl",
-        routing_key="mailer.internal",
-        **(kwargs.get("task_kwargs", None) or {})
-    )
-
-    # send_mail_task.delay(
-    #     queue_id=instance.pk,
-    #     sender_id=mail_sender.pk if mail_sender else None,
-    #     fail_silently=fail_silently)
+    """
+    Trigger a drain once the row is committed, the drain claims and sends
+    every pending message in batches. Concurrent drains skip each other's
+    rows, a drain that finds nothing left is one query.
+    """
+    if mail_sender and mail_sender.pk != instance.sender_id:
+        instance.sender = mail_sender
+        instance.save(update_fields=["sender"])
+
+    def call_task():
+        current_app.send_task(
+            "esl.mailer.message_queue.int.drain",
+            exchange="esl",
+            routing_key="mailer.internal",
+            **(kwargs.get("task_kwargs", None) or {})
+        )
+
+    # noinspection PyProtectedMember
+    transaction.on_commit(call_task, using=instance._state.db)
@@ -13,10 +13,16 @@ logger = logging.getLogger(__name__)
 __all__ = ("mailer_settings", )
 
 
-DEFAULTS = {}
+DEFAULTS = {
+    "DELIVERY_BATCH_SIZE": 100,
+    "SMTP_IDLE_TIMEOUT": 60,  # 60 seconds
+}
 
 
-MANDATORY = ()
+MANDATORY = (
+    "DELIVERY_BATCH_SIZE",
+    "SMTP_IDLE_TIMEOUT",
+)
 
 
 REQUIRED = ("CDN_DOMAIN", "FE_SITE")
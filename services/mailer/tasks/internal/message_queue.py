@@ -5,19 +5,18 @@ import logging
 
 from celery import current_app
 
-from django.db.models.query import Prefetch
-
-from mailer.models import (
-    Sender,
-    MessageQueue,
-    QueueAlternative)
+from mailer.delivery import DeliveryEngine
+from mailer.models import MessageQueue
 
 if TYPE_CHECKING:
     pass
 
 
 logger = logging.getLogger(__name__)
-__all__ = ("message_queue_send_mail_task", )
+__all__ = (
+    "message_queue_send_mail_task",
+    "message_queue_drain_task",
+)
 
 
 @current_app.task(
@@ -28,32 +27,31 @@ def message_queue_send_mail_task(
         queue_id: int, *,
         sender_id: int = None,
         fail_silently: bool = False):
+    # tasks sent before `on_send_email` triggered drains, the row is
+    # claimed like a drain does so it is never sent twice
     if sender_id:
-        sender = Sender.objects.get(pk=sender_id)
-    else:
-        sender = None
-
-    queue = MessageQueue.objects.select_related(
-        "sender", "body_template"
-    ).prefetch_related(
-        Prefetch(
-            "alternatives",
-            queryset=QueueAlternative.objects.select_related(
-                "template"
-            )
-        ),
-        "attachments"
-    ).get(pk=queue_id)  # type: MessageQueue
-
-    # try:
-    queue.send(sender=sender, fail_silently=fail_silently)
-    # except Exception as e:
-    #     raise e
-    #     return {"status": "FAILED", "message": str(e)}
-    # else:
-    #     # instance.delete()
-    #     return {"status": "OK"}
+        MessageQueue.objects.filter(
+            pk=queue_id, executed__isnull=True
+        ).update(sender_id=sender_id)
+    processed = DeliveryEngine().drain(ids=[queue_id])
     return {
         "message_queue_id": queue_id,
         "sender_id": sender_id,
+        "processed": processed,
+    }
+
+
+@current_app.task(
+    name="esl.mailer.message_queue.int.drain",
+    queue="mailer",
+    shared=False)
+def message_queue_drain_task(
+        *, sender_id: int = None,
+        batch_size: int = None,
+        max_batches: int = None):
+    processed = DeliveryEngine(batch_size=batch_size).drain(
+        sender_id=sender_id, max_batches=max_batches)
+    return {
+        "sender_id": sender_id,
+        "processed": processed,
     }
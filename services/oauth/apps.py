@@ -6,4 +6,4 @@ class OauthConfig(AppConfig):
     name = 'oauth'
 
     def ready(self):
-        from . import receivers
+        from . import checks, receivers
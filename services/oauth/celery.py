@@ -3,11 +3,15 @@ from django.conf import settings
 from kombu import Queue, Exchange, binding
 from celery import Celery
 
+from firebase.tasks import constants as firebase_constants
+
 from .tasks import constants
 
 
 exchange = Exchange(
     name=constants.EXCHANGE, type="direct")
+firebase_exchange = Exchange(
+    name=firebase_constants.EXCHANGE, type="direct")
 settings.CELERY_TASK_QUEUES = [
     Queue(
         name=constants.QUEUE_SIGNAL,
@@ -16,8 +20,20 @@ settings.CELERY_TASK_QUEUES = [
                 exchange=exchange,
                 routing_key=constants.ROUTING_SIGNAL)
         ]
-    )
+    ),
+    Queue(
+        name=firebase_constants.QUEUE_PUSH,
+        bindings=[
+            binding(
+                exchange=firebase_exchange,
+                routing_key=firebase_constants.ROUTING_PUSH)
+        ]
+    ),
 ]
+# batched push task, see `BatchTask`: a whole batch is prefetched
+# and its messages are acknowledged once it ran
+settings.CELERY_WORKER_PREFETCH_MULTIPLIER = firebase_constants.PUSH_BATCH_SIZE
+settings.CELERY_TASK_ACKS_LATE = True
 settings.CELERY_IMPORTS = []
 
 app = Celery('oauth-service')
@@ -0,0 +1,38 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from django.core import checks
+
+from evercore.cache import check_shared_cache, is_redis_cache
+
+from oauth.settings import oauth_settings
+
+if TYPE_CHECKING:
+    pass
+
+
+__all__ = ("check_id_token_revocation_cache", "check_prompt_answer_cache")
+
+
+@checks.register(checks.Tags.security, checks.Tags.caches)
+def check_id_token_revocation_cache(**kwargs) -> list[checks.CheckMessage]:
+    # a token deleted in one process would stay trusted by the others
+    if not oauth_settings.ID_TOKEN_STATELESS:
+        return []
+    return check_shared_cache(
+        oauth_settings.ID_TOKEN_REVOCATION_CACHE,
+        setting="ID_TOKEN_REVOCATION_CACHE", id="oauth.E001")
+
+
+@checks.register(checks.Tags.caches)
+def check_prompt_answer_cache(**kwargs) -> list[checks.CheckMessage]:
+    # without pub/sub waiters of other processes get the answer late
+    if is_redis_cache(oauth_settings.PROMPT_ANSWER_CACHE):
+        return []
+    return [checks.Warning(
+        "PROMPT_ANSWER_CACHE %r has no pub/sub, answers posted by another "
+        "process reach waiting clients after up to PROMPT_WAIT_POLL_INTERVAL "
+        "seconds." % oauth_settings.PROMPT_ANSWER_CACHE,
+        hint="Point it to a Redis cache.",
+        id="oauth.W001",
+    )]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import copy
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+
+from oauth2_provider.models import get_application_model
+
+from oauth.settings import oauth_settings
+
+if TYPE_CHECKING:
+    from typing import Any
+    from oauth.models import Application
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("ApplicationStore", "application_store")
+
+
+class ApplicationStore:
+    """
+    Per process cache of applications by client id.
+
+    Entries live ``APPLICATION_CACHE_SECONDS`` in a LRU of
+    ``APPLICATION_CACHE_SIZE`` clients and are dropped when the
+    application is saved or deleted in this process, other processes
+    pick up changes once the entry expired. Callers get a copy of the
+    cached instance.
+    """
+
+    def __init__(self, maxsize: int = None, ttl: float = None):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._applications = OrderedDict()  # type: OrderedDict[str, tuple[float, Application]]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            return oauth_settings.APPLICATION_CACHE_SIZE
+        return self._maxsize
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is None:
+            return oauth_settings.APPLICATION_CACHE_SECONDS
+        return self._ttl
+
+    def get(self, client_id: str) -> Application:
+        """
+        Application of ``client_id``.
+
+        :raises: Application.DoesNotExist
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (entry := self._applications.get(client_id)) is not None:
+                if entry[0] > now:
+                    self._applications.move_to_end(client_id)
+                    self.hits += 1
+                    return copy.copy(entry[1])
+                del self._applications[client_id]
+
+        application = get_application_model().objects.get(client_id=client_id)
+        if (ttl := self.ttl) > 0:
+            with self._lock:
+                self._applications[client_id] = (now + ttl, application)
+                self._applications.move_to_end(client_id)
+                while len(self._applications) > self.maxsize:
+                    self._applications.popitem(last=False)
+                self.misses += 1
+        return copy.copy(application)
+
+    def invalidate(self, application: Application):
+        with self._lock:
+            for client_id in [
+                    k for k, (_, v) in self._applications.items()
+                    if k == application.client_id or v.pk == application.pk]:
+                del self._applications[client_id]
+
+    def clear(self):
+        with self._lock:
+            self._applications.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            size = len(self._applications)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": size,
+            "maxsize": self.maxsize,
+        }
+
+
+application_store = ApplicationStore()
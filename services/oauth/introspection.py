@@ -0,0 +1,138 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from django.core.cache import caches
+
+from oauth2_provider.settings import oauth2_settings
+
+from oauth.settings import oauth_settings
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, TypeVar
+    from django.core.cache.backends.base import BaseCache
+    T = TypeVar("T")
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("INACTIVE", "TokenIntrospector", "token_introspector")
+
+
+# cached marker of a token the authentication server reported inactive
+INACTIVE = "inactive"
+
+
+class _Flight:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None  # type: BaseException | None
+
+
+class TokenIntrospector:
+    """
+    Pooled HTTP session, negative cache and per token single-flight for
+    resource server introspection.
+
+    Active tokens are stored as a local ``AccessToken`` until they expire
+    (at most ``RESOURCE_SERVER_TOKEN_CACHING_SECONDS``), inactive ones are
+    cached as ``INACTIVE`` in the shared cache under a digest of the token
+    for ``INTROSPECTION_NEGATIVE_CACHE_SECONDS``. Concurrent misses of one
+    token in a process share a single introspection call, the callers
+    waiting on it get their own copy of the result.
+    """
+
+    def __init__(self):
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        # sockets inherited from the parent must not be shared
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._session = None  # type: requests.Session | None
+        self._flights = {}  # type: dict[str, _Flight]
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[oauth_settings.INTROSPECTION_CACHE]
+
+    @property
+    def session(self) -> requests.Session:
+        if self._pid != os.getpid():
+            self._reset()
+        if (session := self._session) is None:
+            with self._lock:
+                if (session := self._session) is None:
+                    pool_size = oauth_settings.INTROSPECTION_POOL_SIZE
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=pool_size, pool_maxsize=pool_size)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return session
+
+    # noinspection PyMethodMayBeStatic
+    def get_cache_key(self, token: str) -> str:
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        return "%s:%s" % (oauth_settings.INTROSPECTION_CACHE_KEY_PREFIX, digest)
+
+    def post(self, url: str, token: str, headers: dict = None) -> requests.Response:
+        return self.session.post(
+            url, data={"token": token}, headers=headers,
+            timeout=oauth_settings.INTROSPECTION_TIMEOUT)
+
+    def get_cached(self, key: str) -> Any:
+        return self.cache.get(key)
+
+    def set_inactive(self, key: str):
+        timeout = min(
+            oauth_settings.INTROSPECTION_NEGATIVE_CACHE_SECONDS,
+            oauth2_settings.RESOURCE_SERVER_TOKEN_CACHING_SECONDS)
+        if timeout > 0:
+            self.cache.set(key, INACTIVE, timeout)
+
+    def single_flight(self, key: str, func: Callable[[], T]) -> T:
+        """Run ``func`` once for concurrent callers sharing ``key``."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            # the leader is bounded by the request timeout
+            if not flight.event.wait(oauth_settings.INTROSPECTION_TIMEOUT * 2):
+                logger.warning("introspection: timed out waiting for concurrent lookup")
+                return func()
+            if flight.error is not None:
+                raise flight.error
+            # model instances are not shared between requests
+            return copy.copy(flight.result)
+
+        try:
+            flight.result = func()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+        return flight.result
+
+
+token_introspector = TokenIntrospector()
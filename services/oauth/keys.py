@@ -0,0 +1,150 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import hashlib
+import logging
+import os
+import threading
+import time
+
+from collections import OrderedDict
+
+from jwcrypto import jwk
+from jwcrypto.common import base64url_encode
+
+from django.core.exceptions import ImproperlyConfigured
+
+from oauth2_provider.settings import oauth2_settings
+from oauth2_provider.utils import jwk_from_pem
+
+from oauth.settings import oauth_settings
+
+if TYPE_CHECKING:
+    from typing import Any, Hashable
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("SigningKey", "SigningKeyStore", "signing_key_store")
+
+
+class SigningKey:
+    """Parsed JWK with its precomputed thumbprint, used as ``kid``."""
+    __slots__ = ("key", "kid")
+
+    def __init__(self, key: jwk.JWK):
+        self.key = key
+        self.kid = key.thumbprint()
+
+
+class SigningKeyStore:
+    """
+    Per process store of ID token signing keys.
+
+    The ``OIDC_RSA_PRIVATE_KEY`` PEM (a file path or the PEM itself) is
+    parsed once and reloaded when the setting or the file mtime changes,
+    the file is stat'ed at most every ``RSA_KEY_CHECK_INTERVAL`` seconds.
+    HS256 ``oct`` keys are kept in a LRU keyed by client id and a digest
+    of the client secret, so a rotated secret never hits a stale key.
+    """
+
+    def __init__(self, maxsize: int = None):
+        self._maxsize = maxsize
+        self._rsa_source = None  # type: Hashable
+        self._rsa_key = None  # type: SigningKey | None
+        # setting, monotonic time and source of the last file check
+        self._rsa_checked = None  # type: tuple[str, float, Hashable] | None
+        self._oct_keys = OrderedDict()  # type: OrderedDict[tuple[str, bytes], SigningKey]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            return oauth_settings.CLIENT_KEY_CACHE_SIZE
+        return self._maxsize
+
+    def get_rsa_source(self, rsa_private_key: str) -> tuple[str, Any]:
+        now = time.monotonic()
+        if (checked := self._rsa_checked) is not None and checked[0] == rsa_private_key and (
+                now - checked[1] < oauth_settings.RSA_KEY_CHECK_INTERVAL):
+            return checked[2]
+        try:
+            source = rsa_private_key, os.stat(rsa_private_key).st_mtime_ns
+        except (OSError, ValueError):
+            source = rsa_private_key, None
+        self._rsa_checked = (rsa_private_key, now, source)
+        return source
+
+    def get_rsa_key(self) -> SigningKey:
+        if not (rsa_private_key := oauth2_settings.OIDC_RSA_PRIVATE_KEY):
+            raise ImproperlyConfigured("You must set OIDC_RSA_PRIVATE_KEY to use RSA algorithm")
+        source = self.get_rsa_source(rsa_private_key)
+        if (key := self._rsa_key) is not None and self._rsa_source == source:
+            self.hits += 1
+            return key
+
+        with self._lock:
+            if self._rsa_key is not None and self._rsa_source == source:
+                self.hits += 1
+                return self._rsa_key
+            pem = rsa_private_key
+            if source[1] is not None:
+                with open(rsa_private_key, "r") as fp:
+                    pem = fp.read()
+            key = SigningKey(jwk_from_pem(pem))
+            if self._rsa_key is not None:
+                logger.info("OIDC RSA private key reloaded")
+            self._rsa_source = source
+            self._rsa_key = key
+            self.misses += 1
+        return key
+
+    def get_oct_key(self, client_id: str, client_secret: str) -> SigningKey:
+        cache_key = (client_id, hashlib.sha256(client_secret.encode()).digest())
+        with self._lock:
+            try:
+                key = self._oct_keys[cache_key]
+            except KeyError:
+                pass
+            else:
+                self._oct_keys.move_to_end(cache_key)
+                self.hits += 1
+                return key
+
+        key = SigningKey(jwk.JWK(kty="oct", k=base64url_encode(client_secret)))
+        with self._lock:
+            self._oct_keys[cache_key] = key
+            self._oct_keys.move_to_end(cache_key)
+            while len(self._oct_keys) > self.maxsize:
+                self._oct_keys.popitem(last=False)
+            self.misses += 1
+        return key
+
+    def invalidate_client(self, client_id: str):
+        with self._lock:
+            for cache_key in [k for k in self._oct_keys if k[0] == client_id]:
+                del self._oct_keys[cache_key]
+
+    def clear(self):
+        with self._lock:
+            self._rsa_source = None
+            self._rsa_key = None
+            self._rsa_checked = None
+            self._oct_keys.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            size = len(self._oct_keys)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": size,
+            "maxsize": self.maxsize,
+            "rsa_loaded": self._rsa_key is not None,
+        }
+
+
+signing_key_store = SigningKeyStore()
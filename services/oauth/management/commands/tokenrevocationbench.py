@@ -0,0 +1,66 @@
+import time
+import uuid
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from oauth.models import AccessToken, Application, RefreshToken
+
+
+class Command(BaseCommand):
+    help = 'Benchmark refresh token family revocation, row by row against set based (rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, action='append', dest='sizes',
+                            help="Tokens per family, can be repeated. Defaults to 100, 1000 and 5000")
+
+    def handle(self, *args, sizes, **options):
+        with transaction.atomic():
+            application = Application.objects.create(
+                name="token revocation bench",
+                user_id=0,
+                client_type=Application.CLIENT_CONFIDENTIAL,
+                authorization_grant_type=Application.GRANT_AUTHORIZATION_CODE)
+            for size in sizes or [100, 1000, 5000]:
+                results = {}
+                for label, revoke in (
+                        ("row by row", self.revoke_rows),
+                        ("set based", RefreshToken.objects.revoke_family)):
+                    family = self.create_family(application, size)
+                    with CaptureQueriesContext(connection) as queries:
+                        start = time.perf_counter()
+                        revoke(family)
+                        elapsed = time.perf_counter() - start
+                    results[label] = elapsed
+                    self.stdout.write("%6d tokens  %-10s %8.1f ms  %6d queries" % (
+                        size, label, elapsed * 1000, len(queries)))
+                self.stdout.write("%6d tokens  set based %.1fx faster" % (
+                    size, results["row by row"] / results["set based"]))
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def revoke_rows(token_family):
+        for refresh_token in RefreshToken.objects.filter(token_family=token_family):
+            refresh_token.revoke()
+
+    @staticmethod
+    def create_family(application, size):
+        token_family = uuid.uuid4()
+        expires = timezone.now() + timedelta(hours=1)
+        access_tokens = AccessToken.objects.bulk_create([
+            AccessToken(
+                user_id=0, application=application, token=uuid.uuid4().hex,
+                expires=expires, scope="openid")
+            for _ in range(size)
+        ])
+        RefreshToken.objects.bulk_create([
+            RefreshToken(
+                user_id=0, application=application, token=uuid.uuid4().hex,
+                access_token=access_token, token_family=token_family)
+            for access_token in access_tokens
+        ])
+        return token_family
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.21 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oauth', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='refreshtoken',
+            index=models.Index(fields=['token_family'], name='oauth_refreshtoken_family_idx'),
+        ),
+    ]
@@ -26,7 +26,10 @@ __all__ = (
 
 
 class AccessTokenQuerySet(models.QuerySet):
-    pass
+    def revoke(self) -> int:
+        """Set based ``AccessToken.revoke()``, returns the number of revoked tokens."""
+        deleted, counts = self.delete()
+        return counts.get(self.model._meta.label, 0)
 
 
 _AccessTokenManagerBase = models.Manager.from_queryset(
@@ -2,15 +2,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import logging
-import os
 
 import requests
 
 from urllib.parse import urlencode
 
-from jwcrypto import jwk
-from jwcrypto.common import base64url_encode
-
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.db.models.manager import BaseManager
@@ -18,13 +14,15 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from oauth2_provider.models import AbstractApplication, ApplicationManager
-from oauth2_provider.settings import oauth2_settings
-from oauth2_provider.utils import jwk_from_pem
+
+from oauth.keys import signing_key_store
 
 from .base import TemporaryUser
 
 if TYPE_CHECKING:
     from typing import Self
+    from jwcrypto import jwk
+    from oauth.keys import SigningKey
 
 
 logger = logging.getLogger(__name__)
@@ -69,18 +67,17 @@ class Application(TemporaryUser, AbstractApplication):
         return reverse("oauth_management:detail", args=[str(self.pk)])
 
     @property
-    def jwk_key(self):
+    def signing_key(self) -> SigningKey:
         if self.algorithm == AbstractApplication.RS256_ALGORITHM:
-            if not (rsa_private_key := oauth2_settings.OIDC_RSA_PRIVATE_KEY):
-                raise ImproperlyConfigured("You must set OIDC_RSA_PRIVATE_KEY to use RSA algorithm")
-            if os.path.exists(rsa_private_key):
-                with open(rsa_private_key, "r") as fp:
-                    rsa_private_key = fp.read()
-            return jwk_from_pem(rsa_private_key)
+            return signing_key_store.get_rsa_key()
         elif self.algorithm == AbstractApplication.HS256_ALGORITHM:
-            return jwk.JWK(kty="oct", k=base64url_encode(self.client_secret))
+            return signing_key_store.get_oct_key(self.client_id, self.client_secret)
         raise ImproperlyConfigured("This application does not support signed tokens")
 
+    @property
+    def jwk_key(self) -> jwk.JWK:
+        return self.signing_key.key
+
     def call_prompt_callback(self, data: dict, timeout: float = 2):
         if not (url := self.prompt_callback_url):
             raise TypeError("has no callback url")
@@ -47,5 +47,5 @@ class TemporaryUser:
 
     @user.setter
     def user(self, value):
-        self.user_id = value.pk
+        self.user_id = value.pk if value is not None else None
         self._user = value
@@ -3,8 +3,9 @@ from typing import TYPE_CHECKING
 
 import logging
 
-from django.db import models
+from django.db import models, transaction
 from django.db.models.manager import BaseManager
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from oauth2_provider.models import AbstractRefreshToken
@@ -12,6 +13,7 @@ from oauth2_provider.models import AbstractRefreshToken
 from .base import TemporaryUser
 
 if TYPE_CHECKING:
+    from uuid import UUID
     from .application import Application
     from .access_token import AccessToken
 
@@ -25,7 +27,20 @@ __all__ = (
 
 
 class RefreshTokenQuerySet(models.QuerySet):
-    pass
+    def revoke(self) -> int:
+        """
+        Set based ``RefreshToken.revoke()``: delete the access tokens of the
+        active refresh tokens and mark them revoked, in one transaction.
+        Returns the number of revoked refresh tokens.
+        """
+        access_token_model = self.model._meta.get_field("access_token").related_model
+        now = timezone.now()
+        with transaction.atomic(using=self.db):
+            active = self.filter(revoked__isnull=True)
+            access_token_model.objects.filter(
+                pk__in=active.exclude(access_token=None).values("access_token_id")
+            ).revoke()
+            return active.update(access_token=None, revoked=now, updated=now)
 
 
 _RefreshTokenManagerBase = models.Manager.from_queryset(
@@ -34,7 +49,8 @@ _RefreshTokenManagerBase = models.Manager.from_queryset(
 
 
 class RefreshTokenManager(_RefreshTokenManagerBase, BaseManager):
-    pass
+    def revoke_family(self, token_family: UUID) -> int:
+        return self.filter(token_family=token_family).revoke()
 
 
 class RefreshToken(TemporaryUser, AbstractRefreshToken):
@@ -47,3 +63,9 @@ class RefreshToken(TemporaryUser, AbstractRefreshToken):
         _("user id"))
 
     objects = RefreshTokenManager()
+
+    class Meta(AbstractRefreshToken.Meta):
+        indexes = [
+            models.Index(
+                fields=["token_family"], name="oauth_refreshtoken_family_idx"),
+        ]
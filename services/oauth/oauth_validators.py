@@ -44,6 +44,11 @@ from oauth2_provider.scopes import get_scopes_backend
 from oauth2_provider.settings import oauth2_settings
 from oauth2_provider.utils import get_timezone
 
+from oauth.clients import application_store
+from oauth.introspection import INACTIVE, token_introspector
+from oauth.revocations import id_token_revocations
+from oauth.settings import oauth_settings
+
 
 log = logging.getLogger("oauth2_provider")
 
@@ -241,7 +246,7 @@ class OAuth2Validator(RequestValidator):
         assert hasattr(request, "client"), '"request" instance has no "client" attribute'
 
         try:
-            request.client = request.client or Application.objects.get(client_id=client_id)
+            request.client = request.client or application_store.get(client_id)
             # Check that the application can be used (defaults to always True)
             if not request.client.is_usable(request):
                 log.debug("Failed body authentication: Application %r is disabled" % (client_id))
@@ -251,6 +256,33 @@ class OAuth2Validator(RequestValidator):
             log.debug("Failed body authentication: Application %r does not exist" % (client_id))
             return None
 
+    def _request_cache(self, request):
+        """
+        Objects loaded while validating ``request``, shared by the validator
+        methods called for it.
+        """
+        try:
+            return request._validator_cache
+        except AttributeError:
+            request._validator_cache = {}
+            return request._validator_cache
+
+    def _load_grant(self, code, request, application=None):
+        """
+        Grant of ``code``, loaded once per request.
+
+        :raises: Grant.DoesNotExist if there is no grant of ``code`` for
+            ``application`` (any application when not given).
+        """
+        cache = self._request_cache(request)
+        key = ("grant", code)
+        if key not in cache:
+            cache[key] = Grant.objects.filter(code=code).first()
+        grant = cache[key]
+        if grant is None or (application is not None and grant.application_id != application.pk):
+            raise Grant.DoesNotExist()
+        return grant
+
     def _set_oauth2_error_on_request(self, request, access_token, scopes):
         if access_token is None:
             error = OrderedDict(
@@ -343,11 +375,11 @@ class OAuth2Validator(RequestValidator):
             return request.client.client_type != AbstractApplication.CLIENT_CONFIDENTIAL
         return False
 
-    def confirm_redirect_uri(self, client_id, code, redirect_uri, client, *args, **kwargs):
+    def confirm_redirect_uri(self, client_id, code, redirect_uri, client, request, *args, **kwargs):
         """
         Ensure the redirect_uri is listed in the Application instance redirect_uris field
         """
-        grant = Grant.objects.get(code=code, application=client)
+        grant = self._load_grant(code, request, client)
         return grant.redirect_uri_allowed(redirect_uri)
 
     def invalidate_authorization_code(self, client_id, code, request, *args, **kwargs):
@@ -357,10 +389,15 @@ class OAuth2Validator(RequestValidator):
         :raises: InvalidGrantError if the grant does not exist.
         """
         try:
-            grant = Grant.objects.get(code=code, application=request.client)
-            grant.delete()
+            grant = self._load_grant(code, request, request.client)
         except Grant.DoesNotExist:
             raise errors.InvalidGrantError(request=request)
+        self._request_cache(request).pop(("grant", code), None)
+        # the grant may have been loaded earlier in the request, a code
+        # exchanged concurrently is deleted only once
+        deleted, _ = Grant.objects.filter(pk=grant.pk).delete()
+        if not deleted:
+            raise errors.InvalidGrantError(request=request)
 
     def validate_client_id(self, client_id, request, *args, **kwargs):
         """
@@ -401,7 +438,24 @@ class OAuth2Validator(RequestValidator):
         that user to the UserModel. Also cache the access_token up until its expiry time or a
         configured maximum time.
 
+        Inactive results are cached in the shared cache, active ones live in the local
+        AccessToken, and concurrent lookups of the same token share a single
+        introspection call.
         """
+        key = token_introspector.get_cache_key(token)
+        if token_introspector.get_cached(key) == INACTIVE:
+            return None
+
+        return token_introspector.single_flight(
+            key,
+            lambda: self._introspect_token(
+                token, key, introspection_url, introspection_token, introspection_credentials
+            ),
+        )
+
+    def _introspect_token(
+        self, token, key, introspection_url, introspection_token, introspection_credentials
+    ):
         headers = None
         if introspection_token:
             headers = {"Authorization": "Bearer {}".format(introspection_token)}
@@ -412,7 +466,7 @@ class OAuth2Validator(RequestValidator):
             headers = {"Authorization": "Basic {}".format(basic_auth.decode("utf-8"))}
 
         try:
-            response = requests.post(introspection_url, data={"token": token}, headers=headers)
+            response = token_introspector.post(introspection_url, token, headers=headers)
         except requests.exceptions.RequestException:
             log.exception("Introspection: Failed POST to %r in token lookup", introspection_url)
             return None
@@ -432,41 +486,43 @@ class OAuth2Validator(RequestValidator):
             log.exception("Introspection: Failed to parse response as json")
             return None
 
-        if "active" in content and content["active"] is True:
-            if "username" in content:
-                user = self.get_or_create_user_from_content(content)
-            else:
-                user = None
+        if "active" not in content or content["active"] is not True:
+            token_introspector.set_inactive(key)
+            return None
 
-            max_caching_time = datetime.now() + timedelta(
-                seconds=oauth2_settings.RESOURCE_SERVER_TOKEN_CACHING_SECONDS
-            )
+        if "username" in content:
+            user = self.get_or_create_user_from_content(content)
+        else:
+            user = None
 
-            if "exp" in content:
-                expires = datetime.utcfromtimestamp(content["exp"])
-                if expires > max_caching_time:
-                    expires = max_caching_time
-            else:
-                expires = max_caching_time
+        max_caching_time = datetime.now() + timedelta(
+            seconds=oauth2_settings.RESOURCE_SERVER_TOKEN_CACHING_SECONDS
+        )
 
-            scope = content.get("scope", "")
+        if "exp" in content:
+            expires = datetime.utcfromtimestamp(content["exp"])
+            if expires > max_caching_time:
+                expires = max_caching_time
+        else:
+            expires = max_caching_time
 
-            if settings.USE_TZ:
-                expires = make_aware(
-                    expires, timezone=get_timezone(oauth2_settings.AUTHENTICATION_SERVER_EXP_TIME_ZONE)
-                )
+        scope = content.get("scope", "")
 
-            access_token, _created = AccessToken.objects.update_or_create(
-                token=token,
-                defaults={
-                    "user": user,
-                    "application": None,
-                    "scope": scope,
-                    "expires": expires,
-                },
+        if settings.USE_TZ:
+            expires = make_aware(
+                expires, timezone=get_timezone(oauth2_settings.AUTHENTICATION_SERVER_EXP_TIME_ZONE)
             )
 
-            return access_token
+        access_token, _created = AccessToken.objects.update_or_create(
+            token=token,
+            defaults={
+                "user": user,
+                "application": None,
+                "scope": scope,
+                "expires": expires,
+            },
+        )
+        return access_token
 
     def validate_bearer_token(self, token, scopes, request):
         """
@@ -503,14 +559,14 @@ class OAuth2Validator(RequestValidator):
     def _load_access_token(self, token):
         token_checksum = hashlib.sha256(token.encode("utf-8")).hexdigest()
         return (
-            AccessToken.objects.select_related("application", "user")
+            AccessToken.objects.select_related("application")
             .filter(token_checksum=token_checksum)
             .first()
         )
 
     def validate_code(self, client_id, code, client, request, *args, **kwargs):
         try:
-            grant = Grant.objects.get(code=code, application=client)
+            grant = self._load_grant(code, request, client)
             if not grant.is_expired():
                 request.scopes = grant.scope.split(" ")
                 request.user = grant.user
@@ -579,18 +635,21 @@ class OAuth2Validator(RequestValidator):
         return oauth2_settings.PKCE_REQUIRED
 
     def get_code_challenge(self, code, request):
-        grant = Grant.objects.get(code=code, application=request.client)
+        grant = self._load_grant(code, request, request.client)
         return grant.code_challenge or None
 
     def get_code_challenge_method(self, code, request):
-        grant = Grant.objects.get(code=code, application=request.client)
+        grant = self._load_grant(code, request, request.client)
         return grant.code_challenge_method or None
 
     def save_authorization_code(self, client_id, code, request, *args, **kwargs):
         self._create_authorization_code(request, code)
 
     def get_authorization_code_scopes(self, client_id, code, redirect_uri, request):
-        scopes = Grant.objects.filter(code=code).values_list("scope", flat=True).first()
+        try:
+            scopes = self._load_grant(code, request).scope
+        except Grant.DoesNotExist:
+            scopes = None
         if scopes:
             return utils.scope_to_list(scopes)
         return []
@@ -719,7 +778,8 @@ class OAuth2Validator(RequestValidator):
     def _create_access_token(self, expires, request, token, source_refresh_token=None):
         id_token = token.get("id_token", None)
         if id_token:
-            id_token = self._load_id_token(id_token)
+            # saved by finalize_id_token for this request
+            id_token = getattr(request, "id_token", None) or self._load_id_token(id_token)
         return AccessToken.objects.create(
             user_id=request.user.pk,
             scope=token["scope"],
@@ -780,8 +840,7 @@ class OAuth2Validator(RequestValidator):
             token_type.objects.get(token=token).revoke()
         except ObjectDoesNotExist:
             for other_type in [_t for _t in token_types.values() if _t != token_type]:
-                # slightly inefficient on Python2, but the queryset contains only one instance
-                list(map(lambda t: t.revoke(), other_type.objects.filter(token=token)))
+                other_type.objects.filter(token=token).revoke()
 
     def validate_user(self, username, password, client, request, *args, **kwargs):
         """
@@ -827,9 +886,7 @@ class OAuth2Validator(RequestValidator):
             seconds=oauth2_settings.REFRESH_TOKEN_GRACE_PERIOD_SECONDS
         ):
             if oauth2_settings.REFRESH_TOKEN_REUSE_PROTECTION and rt.token_family:
-                rt_token_family = RefreshToken.objects.filter(token_family=rt.token_family)
-                for related_rt in rt_token_family.all():
-                    related_rt.revoke()
+                RefreshToken.objects.revoke_family(rt.token_family)
             return False
 
         request.user = rt.user
@@ -911,6 +968,8 @@ class OAuth2Validator(RequestValidator):
                 # "auth_time": int(dateformat.format(request.user.last_login, "U")),
                 "auth_time": int(dateformat.format(timezone.now(), "U")),
                 "jti": str(uuid.uuid4()),
+                # lets the token be validated without its IDToken row
+                "scope": request.scope or " ".join(request.scopes),
             }
         )
 
@@ -931,15 +990,16 @@ class OAuth2Validator(RequestValidator):
             "typ": "JWT",
             "alg": request.client.algorithm,
         }
+        signing_key = request.client.signing_key
         # RS256 consumers expect a kid in the header for verifying the token
         if request.client.algorithm == AbstractApplication.RS256_ALGORITHM:
-            header["kid"] = request.client.jwk_key.thumbprint()
+            header["kid"] = signing_key.kid
 
         jwt_token = jwt.JWT(
             header=json.dumps(header, default=str),
             claims=json.dumps(id_token, default=str),
         )
-        jwt_token.make_signed_token(request.client.jwk_key)
+        jwt_token.make_signed_token(signing_key.key)
         # Use the IDToken's database instead of making the assumption it is in 'default'.
         with transaction.atomic(using=router.db_for_write(IDToken)):
             id_token = self._save_id_token(id_token["jti"], request, expiration_time)
@@ -958,7 +1018,7 @@ class OAuth2Validator(RequestValidator):
         if not token:
             return False
 
-        id_token = self._load_id_token(token)
+        id_token = self._load_id_token(token, stateless=oauth_settings.ID_TOKEN_STATELESS)
         if not id_token:
             return False
 
@@ -972,28 +1032,67 @@ class OAuth2Validator(RequestValidator):
         request.access_token = id_token
         return True
 
-    def _load_id_token(self, token):
-        key = self._get_key_for_token(token)
-        if not key:
+    def _load_id_token(self, token, stateless=False):
+        """
+        IDToken of a signed ``token``. When ``stateless``, a trusted token
+        gives an unsaved instance that must not be stored or referenced.
+        """
+        application = self._get_client_for_token(token)
+        if not application:
             return None
         try:
-            jwt_token = jwt.JWT(key=key, jwt=token)
+            jwt_token = jwt.JWT(key=application.jwk_key, jwt=token)
             claims = json.loads(jwt_token.claims)
+            if stateless and (
+                    id_token := self._get_id_token_from_claims(claims, application)):
+                return id_token
             return IDToken.objects.get(jti=claims["jti"])
         except (JWException, JWTExpired, IDToken.DoesNotExist):
             return None
 
-    def _get_key_for_token(self, token):
+    def _get_id_token_from_claims(self, claims, application):
+        """
+        Unsaved IDToken rebuilt from the claims of a verified token, or
+        None when the token has to be looked up: its jti is in the
+        revocation set, it was issued before the set started or it lacks
+        the claims.
+        """
+        try:
+            jti = uuid.UUID(claims["jti"])
+            user_id = int(claims["sub"])
+            issued_at = int(claims["iat"])
+            expires = datetime.fromtimestamp(int(claims["exp"]), tz=get_timezone("UTC"))
+            scope = claims["scope"]
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not id_token_revocations.is_trusted(jti, issued_at):
+            return None
+        return IDToken(
+            jti=jti,
+            user_id=user_id,
+            application=application,
+            expires=expires,
+            scope=scope,
+        )
+
+    def _get_client_for_token(self, token):
         """
         Peek at the unvalidated token to discover who it was issued for
-        and then use that to load that application and its key.
+        and then use that to load that application.
         """
         unverified_token = jws.JWS()
         unverified_token.deserialize(token)
         claims = json.loads(unverified_token.objects["payload"].decode("utf-8"))
         if "aud" not in claims:
             return None
-        application = self._get_client_by_audience(claims["aud"])
+        return self._get_client_by_audience(claims["aud"])
+
+    def _get_key_for_token(self, token):
+        """
+        Peek at the unvalidated token to discover who it was issued for
+        and then use that to load that application and its key.
+        """
+        application = self._get_client_for_token(token)
         if application:
             return application.jwk_key
 
@@ -1005,7 +1104,12 @@ class OAuth2Validator(RequestValidator):
         """
         if isinstance(audience, str):
             audience = [audience]
-        return Application.objects.filter(client_id__in=audience).first()
+        for client_id in audience:
+            try:
+                return application_store.get(client_id)
+            except Application.DoesNotExist:
+                continue
+        return None
 
     def validate_user_match(self, id_token_hint, scopes, claims, request):
         # TODO: Fix to validate when necessary according
@@ -1031,7 +1135,10 @@ class OAuth2Validator(RequestValidator):
         Method is used by:
             - Authorization Token Grant Dispatcher
         """
-        nonce = Grant.objects.filter(code=code).values_list("nonce", flat=True).first()
+        try:
+            nonce = self._load_grant(code, request).nonce
+        except Grant.DoesNotExist:
+            nonce = None
         if nonce:
             return nonce
 
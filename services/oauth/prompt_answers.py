@@ -0,0 +1,184 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+
+from django.core.cache import caches
+from django.db import close_old_connections
+from django.utils import timezone
+
+from evercore.cache import is_redis_cache, is_shared_cache
+
+from oauth.models import PromptRequest
+from oauth.settings import oauth_settings
+
+if TYPE_CHECKING:
+    from typing import Any
+    from django.core.cache.backends.base import BaseCache
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("PromptAnswerChannel", "prompt_answer_channel")
+
+
+class PromptAnswerChannel:
+    """
+    Fan out of ``PromptRequest`` answers to parked clients.
+
+    An answer is stored in the ``PROMPT_ANSWER_CACHE`` cache until the
+    prompt expires. On a Redis cache it is also published on a single
+    pub/sub channel, each process holds one subscription and wakes up its
+    waiters. Without pub/sub, answers published in the same process wake
+    up their waiters right away and answers posted by other processes are
+    picked up by a backstop read every ``PROMPT_WAIT_POLL_INTERVAL``
+    seconds. A cache that is not shared between processes (local memory)
+    never sees answers posted elsewhere, the backstop reads the prompt
+    from the database instead.
+    """
+
+    def __init__(self):
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._waiters = {}  # type: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Future]]]
+        self._listener = None  # type: threading.Thread | None
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[oauth_settings.PROMPT_ANSWER_CACHE]
+
+    def make_key(self, subid: str) -> str:
+        return "%s:%s" % (oauth_settings.PROMPT_ANSWER_CACHE_KEY_PREFIX, subid)
+
+    @property
+    def channel(self) -> str:
+        return self.cache.make_key(oauth_settings.PROMPT_ANSWER_CACHE_KEY_PREFIX)
+
+    @staticmethod
+    def make_payload(instance: PromptRequest) -> dict[str, Any]:
+        return {
+            "answer": instance.answer,
+            "answer_time": instance.answer_time and instance.answer_time.isoformat(),
+        }
+
+    @staticmethod
+    def read_answer(subid: str) -> dict[str, Any] | None:
+        instance = PromptRequest.objects.filter(
+            subid=subid, answer__isnull=False,
+        ).only("answer", "answer_time").first()  # type: PromptRequest
+        if instance is None:
+            return None
+        return PromptAnswerChannel.make_payload(instance)
+
+    def publish(self, instance: PromptRequest):
+        payload = self.make_payload(instance)
+        timeout = 60
+        if instance.expires is not None:
+            timeout = max(timeout, (instance.expires - timezone.now()).total_seconds())
+        cache = self.cache
+        cache.set(self.make_key(instance.subid), payload, timeout)
+        if is_redis_cache(oauth_settings.PROMPT_ANSWER_CACHE):
+            # noinspection PyProtectedMember
+            cache._cache.get_client(write=True).publish(
+                self.channel, json.dumps({"subid": instance.subid, "payload": payload}))
+        else:
+            self._notify(instance.subid, payload)
+
+    def _notify(self, subid: str, payload: dict):
+        with self._lock:
+            waiters = list(self._waiters.get(subid, ()))
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_set_result, future, payload)
+
+    def _listen(self, cache: BaseCache):
+        while True:
+            try:
+                # noinspection PyProtectedMember
+                pubsub = cache._cache.get_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    data = json.loads(message["data"])
+                    self._notify(data["subid"], data["payload"])
+            except Exception:  # noqa
+                logger.warning("prompt answer subscription failed", exc_info=True)
+                time.sleep(1)
+
+    def _ensure_listener(self, cache: BaseCache):
+        if self._listener is None:
+            with self._lock:
+                if self._listener is None:
+                    self._listener = threading.Thread(
+                        target=self._listen, args=(cache,),
+                        name="prompt-answers", daemon=True)
+                    self._listener.start()
+
+    async def wait(self, subid: str, timeout: float) -> dict[str, Any] | None:
+        """The answer of the prompt, ``None`` when none came in ``timeout`` seconds."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (loop, future)
+        cache = self.cache
+        if is_redis := is_redis_cache(oauth_settings.PROMPT_ANSWER_CACHE):
+            self._ensure_listener(cache)
+            poll_interval = timeout
+        else:
+            poll_interval = oauth_settings.PROMPT_WAIT_POLL_INTERVAL
+        with self._lock:
+            self._waiters.setdefault(subid, set()).add(waiter)
+        # BaseCache.aget runs every read on the one thread sensitive thread
+        if is_shared_cache(oauth_settings.PROMPT_ANSWER_CACHE):
+            read = sync_to_async(_fresh_connections(cache.get), thread_sensitive=False)
+            key = self.make_key(subid)
+        else:
+            read = sync_to_async(_fresh_connections(self.read_answer), thread_sensitive=False)
+            key = subid
+        try:
+            deadline = loop.time() + timeout
+            while True:
+                # also catches an answer published before the waiter was added
+                if (payload := await read(key)) is not None:
+                    return payload
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                try:
+                    return await asyncio.wait_for(
+                        asyncio.shield(future), min(remaining, poll_interval))
+                except asyncio.TimeoutError:
+                    if is_redis:
+                        return None
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(subid)
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[subid]
+
+
+def _fresh_connections(func):
+    # reads run in executor threads that never see request_finished
+    def wrapper(*args):
+        close_old_connections()
+        try:
+            return func(*args)
+        finally:
+            close_old_connections()
+    return wrapper
+
+
+def _set_result(future: asyncio.Future, payload: dict):
+    if not future.done():
+        future.set_result(payload)
+
+
+prompt_answer_channel = PromptAnswerChannel()
@@ -4,12 +4,19 @@ from typing import TYPE_CHECKING
 import logging
 
 from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from oauth.clients import application_store
 from oauth.integration import tasks
+from oauth.keys import signing_key_store
 from oauth.models import (
+    Application,
+    IDToken,
     PromptRequest,
 )
+from oauth.prompt_answers import prompt_answer_channel
+from oauth.revocations import id_token_revocations
 from oauth.signals import post_answer
 
 if TYPE_CHECKING:
@@ -19,13 +26,35 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 __all__ = (
     "on_prompt_request_post_answer",
+    "on_application_post_save",
+    "on_application_post_delete",
+    "on_id_token_post_delete",
 )
 
 
 @receiver(post_answer, sender=PromptRequest)
 def on_prompt_request_post_answer(instance: PromptRequest, **kwargs):
     def call_task():
+        prompt_answer_channel.publish(instance)
         tasks.call_signal_prompt_request_post_answer(instance)
 
     # noinspection PyProtectedMember
     transaction.on_commit(call_task, using=instance._state.db)
+
+
+@receiver(post_save, sender=Application)
+def on_application_post_save(instance: Application, **kwargs):
+    application_store.invalidate(instance)
+
+
+@receiver(post_delete, sender=Application)
+def on_application_post_delete(instance: Application, **kwargs):
+    signing_key_store.invalidate_client(instance.client_id)
+    application_store.invalidate(instance)
+
+
+@receiver(post_delete, sender=IDToken)
+def on_id_token_post_delete(instance: IDToken, **kwargs):
+    # not deferred to the commit, a rolled back delete only costs
+    # a database lookup of a token that still exists
+    id_token_revocations.revoke(instance.jti, instance.expires)
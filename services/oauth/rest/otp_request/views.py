@@ -3,8 +3,6 @@ from typing import TYPE_CHECKING
 
 from datetime import timedelta
 
-from firebase_admin import messaging
-
 from django.utils import timezone
 
 from rest_framework import status
@@ -16,6 +14,8 @@ from oauth2_provider.contrib.rest_framework.authentication import (
     OAuth2Authentication,
 )
 
+from firebase.push import PushNotification, send_push
+
 from oauth.models import OtpRequest
 
 from .serializers import VerifySerializer
@@ -56,11 +56,10 @@ class GenerateView(GenericAPIView):
         if fbt := request.headers.get("x-idv-fbt"):
             application = token.application
             body = f"Application {application.name.title()} requests an OTP"
-            messaging.send(messaging.Message(
-                notification=messaging.Notification(
-                    title="OTP Request", body=body
-                ),
+            send_push(PushNotification(
                 token=fbt,
+                title="OTP Request",
+                body=body,
                 data={
                     "idv_request_id": instance.subid,
                     "idv_notification_type": "otp-request"
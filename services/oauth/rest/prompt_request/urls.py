@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import GenerateView, RetrieveView
+from .views import GenerateView, RetrieveView, WaitView
 
 
 app_name = "prompt"
@@ -8,4 +8,5 @@ app_name = "prompt"
 urlpatterns = [
     path("request/", GenerateView.as_view(), name="request",),
     path("detail/<slug:subid>/", RetrieveView.as_view(), name="detail"),
+    path("detail/<slug:subid>/wait/", WaitView.as_view(), name="wait"),
 ]
@@ -3,28 +3,38 @@ from typing import TYPE_CHECKING
 
 from datetime import timedelta
 
-from firebase_admin import messaging
+from asgiref.sync import sync_to_async
 
+from django.http import JsonResponse
 from django.utils import timezone
+from django.views import View
 
 from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated, NotFound
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
 from rest_framework.response import Response
 
 from oauth2_provider.contrib.rest_framework.authentication import (
     OAuth2Authentication,
 )
 
+from firebase.push import PushNotification, send_push
+
 from oauth.models import PromptRequest
+from oauth.prompt_answers import prompt_answer_channel
+from oauth.settings import oauth_settings
 
 if TYPE_CHECKING:
+    from django.http import HttpRequest
     from oauth.models import IDToken
 
 
 __all__ = (
     "GenerateView",
     "RetrieveView",
+    "WaitView",
 )
 
 
@@ -44,11 +54,10 @@ class GenerateView(GenericAPIView):
         if fbt := request.headers.get("x-idv-fbt"):
             application = token.application
             body = f"Application {application.name.title()} requests an OTP"
-            messaging.send(messaging.Message(
-                notification=messaging.Notification(
-                    title="Prompt Request", body=body
-                ),
+            send_push(PushNotification(
                 token=fbt,
+                title="Prompt Request",
+                body=body,
                 data={
                     "idv_request_id": instance.subid,
                     "idv_notification_type": "prompt-request"
@@ -79,3 +88,48 @@ class RetrieveView(GenerateView):
             "answer": instance.answer,
             "answer_time": instance.answer_time
         })
+
+
+class WaitView(View):
+    """
+    Long-poll of the answer of a prompt request.
+
+    The client is authenticated and the prompt read once, then the
+    connection is held until the answer is published or
+    ``PROMPT_WAIT_TIMEOUT`` seconds (at most until the prompt expires)
+    passed. Serve it from the ASGI application, a held client then costs
+    no thread.
+    """
+    authentication_classes = (OAuth2Authentication,)
+
+    def get_object(self, request: HttpRequest, subid: str) -> PromptRequest:
+        request = Request(request, authenticators=[
+            auth() for auth in self.authentication_classes])
+        token = request.auth  # type: IDToken
+        if token is None:
+            raise NotAuthenticated()
+        instance = PromptRequest.objects.filter(
+            application_id=token.application_id,
+            user_id=token.user_id,
+            subid=subid).first()  # type: PromptRequest
+        if instance is None:
+            raise NotFound()
+        return instance
+
+    async def get(self, request: HttpRequest, subid: str) -> JsonResponse:
+        try:
+            instance = await sync_to_async(self.get_object)(request, subid)
+        except APIException as e:
+            return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+        data = {
+            "answer": instance.answer,
+            "answer_time": instance.answer_time,
+        }
+        if instance.answer is None and instance.is_alive():
+            timeout = min(
+                oauth_settings.PROMPT_WAIT_TIMEOUT,
+                (instance.expires - timezone.now()).total_seconds())
+            if payload := await prompt_answer_channel.wait(instance.subid, timeout):
+                data = payload
+        return JsonResponse(data)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import logging
+import time
+
+from django.core.cache import caches
+from django.utils import timezone
+
+from oauth.settings import oauth_settings
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+    from django.core.cache.backends.base import BaseCache
+
+
+logger = logging.getLogger(__name__)
+__all__ = ("IDTokenRevocations", "id_token_revocations")
+
+
+# seconds between issuer clocks, tokens issued that close to a rebuild of
+# the set are checked in the database
+CLOCK_LEEWAY = 60
+
+
+class IDTokenRevocations:
+    """
+    Shared set of the JTIs of deleted ``IDToken`` rows.
+
+    Every delete adds its JTI to the ``ID_TOKEN_REVOCATION_CACHE`` cache
+    until the token expires, so the set only holds revoked tokens that are
+    still unexpired. A ``since`` marker records when the set started; when
+    the cache lost it (flush, restart) the set starts over and tokens issued
+    before the new marker are checked in the database until they expire.
+    The cache must not evict entries before their timeout.
+    """
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[oauth_settings.ID_TOKEN_REVOCATION_CACHE]
+
+    def make_key(self, jti: UUID | str) -> str:
+        return "%s:%s" % (oauth_settings.ID_TOKEN_REVOCATION_CACHE_KEY_PREFIX, jti)
+
+    @property
+    def since_key(self) -> str:
+        return "%s:since" % oauth_settings.ID_TOKEN_REVOCATION_CACHE_KEY_PREFIX
+
+    def revoke(self, jti: UUID | str, expires: datetime | None):
+        timeout = 60
+        if expires is not None:
+            timeout = (expires - timezone.now()).total_seconds()
+            if timeout <= 0:
+                return
+        self.cache.set(self.make_key(jti), 1, timeout)
+
+    def _start(self, cache: BaseCache) -> int:
+        since = int(time.time()) + CLOCK_LEEWAY
+        if not cache.add(self.since_key, since, None):
+            since = cache.get(self.since_key, since)
+        logger.info("id token revocation set starts at %d", since)
+        return since
+
+    def is_trusted(self, jti: UUID | str, issued_at: int) -> bool:
+        """
+        Whether a token with a valid signature can be used without a
+        database lookup, one cache read.
+        """
+        cache = self.cache
+        key = self.make_key(jti)
+        found = cache.get_many([self.since_key, key])
+        if key in found:
+            return False
+        if (since := found.get(self.since_key)) is None:
+            since = self._start(cache)
+        return issued_at > since
+
+
+id_token_revocations = IDTokenRevocations()
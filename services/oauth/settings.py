@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from evercore.settings import AppSetting
+
+if TYPE_CHECKING:
+    pass
+
+
+__all__ = ("oauth_settings",)
+
+
+DEFAULTS = {
+    # max HS256 client keys kept in process
+    "CLIENT_KEY_CACHE_SIZE": 256,
+    # seconds between mtime checks of the OIDC RSA key file, 0 checks
+    # on every use
+    "RSA_KEY_CHECK_INTERVAL": 10,
+    # applications by client id kept in process
+    "APPLICATION_CACHE_SIZE": 256,
+    "APPLICATION_CACHE_SECONDS": 5,
+
+    # resource server token introspection
+    "INTROSPECTION_CACHE": "default",
+    "INTROSPECTION_CACHE_KEY_PREFIX": "oauth:introspect",
+    # inactive tokens, capped by RESOURCE_SERVER_TOKEN_CACHING_SECONDS
+    "INTROSPECTION_NEGATIVE_CACHE_SECONDS": 30,
+    # seconds, connect and read timeout of the introspection request
+    "INTROSPECTION_TIMEOUT": 5,
+    "INTROSPECTION_POOL_SIZE": 10,
+
+    # prompt answer long-poll
+    "PROMPT_ANSWER_CACHE": "default",
+    "PROMPT_ANSWER_CACHE_KEY_PREFIX": "oauth:prompt-answer",
+    # seconds a client is held, capped by the prompt expiry
+    "PROMPT_WAIT_TIMEOUT": 30,
+    # seconds, backstop read of answers posted by other processes on
+    # caches without pub/sub
+    "PROMPT_WAIT_POLL_INTERVAL": 10.0,
+
+    # trust signed id tokens unless their jti is in the revocation set
+    "ID_TOKEN_STATELESS": False,
+    "ID_TOKEN_REVOCATION_CACHE": "default",
+    "ID_TOKEN_REVOCATION_CACHE_KEY_PREFIX": "oauth:idtoken-revoked",
+}
+
+
+oauth_settings = AppSetting(
+    "IDVALID_OAUTH_SETTINGS",
+    DEFAULTS,
+    mandatory=(
+        "CLIENT_KEY_CACHE_SIZE",
+        "APPLICATION_CACHE_SIZE",
+        "APPLICATION_CACHE_SECONDS",
+        "INTROSPECTION_CACHE",
+        "INTROSPECTION_CACHE_KEY_PREFIX",
+        "INTROSPECTION_NEGATIVE_CACHE_SECONDS",
+        "INTROSPECTION_TIMEOUT",
+        "INTROSPECTION_POOL_SIZE",
+        "PROMPT_ANSWER_CACHE",
+        "PROMPT_ANSWER_CACHE_KEY_PREFIX",
+        "PROMPT_WAIT_TIMEOUT",
+        "PROMPT_WAIT_POLL_INTERVAL",
+        "ID_TOKEN_REVOCATION_CACHE",
+        "ID_TOKEN_REVOCATION_CACHE_KEY_PREFIX",
+    ),
+)
@@ -1,3 +1,293 @@
-from django.test import TestCase
+from __future__ import annotations
 
-# Create your tests here.
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from asgiref.sync import async_to_sync
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from jwcrypto import jwk
+from oauthlib.common import Request
+
+from oauth.clients import application_store
+from oauth.keys import SigningKeyStore
+from oauth.models import AccessToken, Application, Grant, IDToken, PromptRequest
+from oauth.oauth_validators import OAuth2Validator
+from oauth.prompt_answers import prompt_answer_channel
+from oauth.revocations import id_token_revocations
+
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+class _IntrospectionHandler(BaseHTTPRequestHandler):
+    server: _IntrospectionServer
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        token = self.rfile.read(length).decode().partition("token=")[2]
+        with self.server.lock:
+            self.server.calls.append(token)
+        # keep concurrent lookups in flight together
+        time.sleep(0.2)
+        if token == "active-token":
+            content = {"active": True, "scope": "read", "exp": int(time.time()) + 3600}
+        else:
+            content = {"active": False}
+        body = json.dumps(content).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _IntrospectionServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _IntrospectionHandler)
+        self.lock = threading.Lock()
+        self.calls = []  # type: list[str]
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class IntrospectionTests(TransactionTestCase):
+    def setUp(self):
+        self.server = _IntrospectionServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        cache.clear()
+        override = override_settings(OAUTH2_PROVIDER={
+            **settings.OAUTH2_PROVIDER,
+            "RESOURCE_SERVER_INTROSPECTION_URL": "http://127.0.0.1:%d/introspect/" % self.server.server_port,
+            "RESOURCE_SERVER_AUTH_TOKEN": "secret",
+        })
+        override.enable()
+        self.addCleanup(override.disable)
+
+    @staticmethod
+    def validate(token: str) -> Request:
+        request = Request("/")
+        request.valid = OAuth2Validator().validate_bearer_token(token, ["read"], request)
+        return request
+
+    def test_concurrent_lookups_share_one_call(self):
+        barrier = threading.Barrier(20)
+        requests = []
+
+        def run():
+            barrier.wait()
+            try:
+                requests.append(self.validate("active-token"))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(requests), 20)
+        self.assertTrue(all(request.valid for request in requests))
+        self.assertEqual(self.server.calls, ["active-token"])
+        # waiting callers get their own instance
+        self.assertEqual(len({id(request.access_token) for request in requests}), 20)
+
+        # served by the local access token from now on
+        self.assertTrue(self.validate("active-token").valid)
+        self.assertEqual(len(self.server.calls), 1)
+
+    def test_inactive_token_is_cached(self):
+        self.assertFalse(self.validate("revoked-token").valid)
+        self.assertFalse(self.validate("revoked-token").valid)
+        self.assertEqual(self.server.calls, ["revoked-token"])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, IDVALID_OAUTH_SETTINGS={"PROMPT_WAIT_POLL_INTERVAL": 0.1})
+class PromptAnswerTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        application = Application.objects.create(
+            name="test", user_id=1,
+            client_type=Application.CLIENT_CONFIDENTIAL,
+            authorization_grant_type=Application.GRANT_AUTHORIZATION_CODE)
+        self.prompt = PromptRequest.objects.create(
+            application=application, user_id=1,
+            expires=timezone.now() + timedelta(minutes=1))
+
+    def test_answer_of_another_process_is_read_from_database(self):
+        # saved without publishing, as a process with its own cache would
+        def answer():
+            time.sleep(0.3)
+            PromptRequest.objects.filter(pk=self.prompt.pk).update(
+                answer=PromptRequest.ANSWER_ACCEPTED, answer_time=timezone.now())
+            connection.close()
+
+        thread = threading.Thread(target=answer)
+        thread.start()
+        started = time.monotonic()
+        payload = async_to_sync(prompt_answer_channel.wait)(self.prompt.subid, 5)
+        thread.join()
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(payload["answer"], PromptRequest.ANSWER_ACCEPTED)
+
+    @override_settings(IDVALID_OAUTH_SETTINGS={"PROMPT_WAIT_POLL_INTERVAL": 10})
+    def test_answer_of_this_process_wakes_waiter(self):
+        def answer():
+            time.sleep(0.3)
+            self.prompt.set_answer(PromptRequest.ANSWER_REJECTED, save=False)
+            prompt_answer_channel.publish(self.prompt)
+
+        thread = threading.Thread(target=answer)
+        thread.start()
+        started = time.monotonic()
+        payload = async_to_sync(prompt_answer_channel.wait)(self.prompt.subid, 5)
+        thread.join()
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(payload["answer"], PromptRequest.ANSWER_REJECTED)
+
+    def test_unanswered_prompt_times_out(self):
+        self.assertIsNone(async_to_sync(prompt_answer_channel.wait)(self.prompt.subid, 0.3))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TokenTestCase(TestCase):
+    redirect_uri = "http://localhost/callback/"
+    client_secret = "secret"
+
+    def setUp(self):
+        cache.clear()
+        application_store.clear()
+        self.application = Application.objects.create(
+            name="test", user_id=1,
+            client_id="client",
+            client_secret=self.client_secret,
+            client_type=Application.CLIENT_CONFIDENTIAL,
+            authorization_grant_type=Application.GRANT_AUTHORIZATION_CODE,
+            redirect_uris=self.redirect_uri,
+            algorithm=Application.HS256_ALGORITHM)
+        # the application is cached after the first exchange of a client
+        application_store.get(self.application.client_id)
+
+    def create_grant(self, **kwargs) -> Grant:
+        return Grant.objects.create(
+            application=self.application, user_id=1,
+            code="code", redirect_uri=self.redirect_uri, scope="openid",
+            expires=timezone.now() + timedelta(minutes=1), **kwargs)
+
+    def exchange(self, **data) -> dict:
+        credentials = base64.b64encode(
+            ("%s:%s" % (self.application.client_id, self.client_secret)).encode())
+        response = self.client.post(
+            reverse("oauth:token"), data,
+            HTTP_AUTHORIZATION="Basic %s" % credentials.decode())
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def exchange_code(self, **data) -> dict:
+        return self.exchange(
+            grant_type="authorization_code", code="code",
+            redirect_uri=self.redirect_uri, **data)
+
+
+@override_settings(
+    IDVALID_OAUTH_SETTINGS={"ID_TOKEN_STATELESS": True},
+    OAUTH2_PROVIDER={**settings.OAUTH2_PROVIDER, "PKCE_REQUIRED": False})
+class StatelessIDTokenTests(TokenTestCase):
+    def setUp(self):
+        super().setUp()
+        # revocation set started before the tokens are issued
+        cache.set(id_token_revocations.since_key, int(time.time()) - 60, None)
+
+    def test_access_token_references_saved_id_token(self):
+        self.create_grant()
+        content = self.exchange_code()
+        access_token = AccessToken.objects.get(token=content["access_token"])
+        self.assertIsNotNone(access_token.id_token_id)
+        self.assertEqual(access_token.id_token, IDToken.objects.get())
+
+    def test_id_token_is_validated_without_lookup(self):
+        self.create_grant()
+        id_token = self.exchange_code()["id_token"]
+        request = Request("/")
+        with self.assertNumQueries(0):
+            self.assertTrue(OAuth2Validator().validate_id_token(id_token, ["openid"], request))
+        self.assertIsNone(request.access_token.pk)
+
+        # revoked tokens are looked up
+        IDToken.objects.get().delete()
+        self.assertFalse(OAuth2Validator().validate_id_token(id_token, ["openid"], Request("/")))
+
+
+@override_settings(OAUTH2_PROVIDER={**settings.OAUTH2_PROVIDER, "PKCE_REQUIRED": False})
+class TokenExchangeTests(TokenTestCase):
+    """Queries of a token exchange by a cached client, savepoints included."""
+    code_verifier = "verifier-" + "x" * 40
+
+    def test_authorization_code(self):
+        self.create_grant()
+        with self.assertNumQueries(10):
+            self.exchange_code()
+
+    def test_authorization_code_pkce(self):
+        challenge = base64.urlsafe_b64encode(
+            hashlib.sha256(self.code_verifier.encode()).digest()).decode().rstrip("=")
+        self.create_grant(code_challenge=challenge, code_challenge_method="S256")
+        with self.assertNumQueries(10):
+            self.exchange_code(code_verifier=self.code_verifier)
+
+    def test_refresh_token(self):
+        self.create_grant()
+        refresh_token = self.exchange_code()["refresh_token"]
+        with self.assertNumQueries(19):
+            self.exchange(grant_type="refresh_token", refresh_token=refresh_token)
+
+
+class SigningKeyStoreTests(TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".pem")
+        os.close(fd)
+        self.addCleanup(os.unlink, self.path)
+        self.write_key()
+        override = override_settings(OAUTH2_PROVIDER={
+            **settings.OAUTH2_PROVIDER, "OIDC_RSA_PRIVATE_KEY": self.path})
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def write_key(self):
+        pem = jwk.JWK.generate(kty="RSA", size=2048).export_to_pem(private_key=True, password=None)
+        with open(self.path, "wb") as fp:
+            fp.write(pem)
+        # a distinct mtime whatever the file system resolution
+        os.utime(self.path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+
+    def test_file_is_checked_once_per_interval(self):
+        store = SigningKeyStore()
+        key = store.get_rsa_key()
+        self.write_key()
+        self.assertIs(store.get_rsa_key(), key)
+
+        with override_settings(IDVALID_OAUTH_SETTINGS={"RSA_KEY_CHECK_INTERVAL": 0}):
+            self.assertNotEqual(store.get_rsa_key().kid, key.kid)
@@ -0,0 +1,40 @@
+import time
+
+from django.contrib.auth.hashers import make_password, check_password
+from django.core.management.base import BaseCommand
+
+from otp.generators import pin_number
+from otp.settings import otp_settings
+
+
+class Command(BaseCommand):
+    help = 'Benchmark otp pin create + verify throughput per hasher (single core)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help="Create + verify rounds per hasher")
+        parser.add_argument('--hasher', action='append', dest='hashers',
+                            help="Hasher algorithm name, can be repeated. "
+                                 "Defaults to `default` and the configured PIN_HASHER")
+
+    def handle(self, *args, iterations, hashers, **options):
+        if not hashers:
+            hashers = ['default', otp_settings.PIN_HASHER]
+
+        results = {}
+        for hasher in hashers:
+            pins = [pin_number() for _ in range(iterations)]
+            start = time.perf_counter()
+            for pin in pins:
+                encoded = make_password(pin, hasher=hasher)
+                if not check_password(pin, encoded, preferred=hasher):
+                    raise AssertionError("verify failed for hasher %s" % hasher)
+            elapsed = time.perf_counter() - start
+            results[hasher] = iterations / elapsed
+            self.stdout.write("%-24s %10.1f ops/s  (%d rounds in %.3fs)" % (
+                hasher, results[hasher], iterations, elapsed))
+
+        if len(results) > 1:
+            baseline = results[hashers[0]]
+            for hasher in hashers[1:]:
+                self.stdout.write("%s vs %s: %.1fx" % (
+                    hasher, hashers[0], results[hasher] / baseline))
@@ -15,6 +15,7 @@ from idvalid_core.models import get_subid_model
 
 from otp.generators import otp_number
 from otp.integration.rpc import sign_code
+from otp.settings import otp_settings
 
 from . import constants
 
@@ -111,7 +112,8 @@ class Code(get_subid_model()):
         return self.code is not None
 
     def set_code(self, raw_code: str):
-        self.code = make_password(raw_code)
+        self.code = make_password(
+            raw_code, hasher=otp_settings.CODE_HASHER)
         self._code = raw_code
 
     def prepare_code(self, *, save: bool = True) -> str:
@@ -133,7 +135,9 @@ class Code(get_subid_model()):
             self._code = None
             self.save(update_fields=["code"])
 
-        return check_password(raw_code, self.code, upgrade)
+        return check_password(
+            raw_code, self.code, upgrade,
+            preferred=otp_settings.CODE_HASHER)
 
     def allow_suppression(self):
         return not (self.suppressed or self.confirmed)
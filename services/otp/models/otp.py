@@ -193,7 +193,8 @@ class Otp(get_subid_model()):
         )
 
     def set_pin(self, raw_pin: str):
-        self.pin = make_password(raw_pin)
+        self.pin = make_password(
+            raw_pin, hasher=otp_settings.PIN_HASHER)
         self._pin = raw_pin
 
     def prepare_pin(self, *, save: bool = True) -> str:
@@ -212,7 +213,9 @@ class Otp(get_subid_model()):
             self._pin = None
             self.save(update_fields=["pin"])
 
-        return check_password(raw_pin, self.pin, upgrade)
+        return check_password(
+            raw_pin, self.pin, upgrade,
+            preferred=otp_settings.PIN_HASHER)
 
     def send(self):
         if self.is_ready():
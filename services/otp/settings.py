@@ -16,6 +16,10 @@ DEFAULTS = {
     "DEFAULT_PIN_DURATION": 60 * 60,  # 1 hour (3600 seconds)
     "DEFAULT_OTP_TOKEN_BYTES_LENGTH": 48,  # 64 in base64
 
+    # `PASSWORD_HASHERS` algorithm name, or "default"
+    "PIN_HASHER": "ephemeral_hmac_sha256",
+    "CODE_HASHER": "ephemeral_hmac_sha256",
+
     "TWILIO_API_KEY": "",
     "TWILIO_API_SECRET": "",
     "TWILIO_ACCOUNT_SID": "",
@@ -28,6 +32,8 @@ MANDATORY = (
     "DEFAULT_PIN_LENGTH",
     "DEFAULT_PIN_DURATION",
     "DEFAULT_OTP_TOKEN_BYTES_LENGTH",
+    "PIN_HASHER",
+    "CODE_HASHER",
 )
 
 
@@ -45,6 +45,10 @@ settings.CELERY_TASK_QUEUES = [
         ]
     )
 ]
+# batched consume tasks, see `BatchTask`: a whole batch is prefetched
+# and its messages are acknowledged once it ran
+settings.CELERY_WORKER_PREFETCH_MULTIPLIER = constants.CONSUME_BATCH_SIZE
+settings.CELERY_TASK_ACKS_LATE = True
 settings.CELERY_IMPORTS = []
 
 app = Celery('rbac-service')
@@ -9,9 +9,12 @@ from django.utils.translation import gettext_lazy as _
 
 from idvalid_core.models import get_subid_model
 
+from idvalid_integration.tasks.utils import collapse
+
 from tenant_sdk.constants import TENANT_NAME_MAX_LENGTH
 
 if TYPE_CHECKING:
+    from typing import Iterable
     from idvalid_integration.protos.models import tenant_pb2
 
 
@@ -45,6 +48,23 @@ class TenantManager(_TenantManagerBase, BaseManager):
         instance.save()
         return instance
 
+    def upsert_from_messages(
+            self, messages: Iterable[tenant_pb2.Tenant]) -> None:
+        """Bulk version of ``create_or_update_from_message()``."""
+        messages = collapse(messages, key=lambda message: message.id)
+        self.bulk_create(
+            [
+                self.model(
+                    pk=message.id,
+                    subid=message.subid,
+                    name=message.name,
+                    is_active=message.is_active)
+                for message in messages
+            ],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["subid", "name", "is_active"])
+
 
 class Tenant(get_subid_model()):
     name = models.CharField(
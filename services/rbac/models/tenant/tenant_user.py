@@ -7,7 +7,10 @@ from django.db import models
 from django.db.models.manager import BaseManager
 from django.utils.translation import gettext_lazy as _
 
+from idvalid_integration.tasks.utils import collapse
+
 if TYPE_CHECKING:
+    from typing import Iterable
     from idvalid_integration.protos.models import tenant_pb2
     from rbac.models import Tenant, User
 
@@ -53,6 +56,37 @@ class TenantUserManager(_TenantUserManagerBase, BaseManager):
             user_id=message.user_id,
         ).delete()
 
+    def upsert_from_messages(
+            self, messages: Iterable[tenant_pb2.TenantUser]) -> None:
+        """Bulk version of ``create_or_update_from_message()``."""
+        messages = collapse(
+            messages, key=lambda message: (message.tenant_id, message.user_id))
+        self.bulk_create(
+            [
+                self.model(
+                    tenant_id=message.tenant_id,
+                    user_id=message.user_id,
+                    is_owner=message.is_owner,
+                    is_registered=message.is_registered,
+                    is_active=message.is_active)
+                for message in messages
+            ],
+            update_conflicts=True,
+            unique_fields=["tenant", "user"],
+            update_fields=["is_owner", "is_registered", "is_active"])
+
+    def delete_from_messages(
+            self, messages: Iterable[tenant_pb2.TenantUser]) -> int:
+        """Bulk version of ``delete_from_message()``."""
+        condition = models.Q()
+        for message in messages:
+            condition |= models.Q(
+                tenant_id=message.tenant_id,
+                user_id=message.user_id)
+        if not condition:
+            return 0
+        return self.filter(condition).delete()
+
 
 class TenantUser(models.Model):
     tenant_id: int
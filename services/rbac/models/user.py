@@ -9,10 +9,12 @@ from django.utils.translation import gettext_lazy as _
 
 from idvalid_core.models import get_subid_model
 
+from idvalid_integration.tasks.utils import collapse
+
 from authn_sdk.constants import PROFILE_NAME_MAX_LENGTH
 
 if TYPE_CHECKING:
-    from typing import Self, Optional
+    from typing import Iterable, Self, Optional
     from idvalid_integration.protos.models import authn_pb2
 
 
@@ -97,6 +99,23 @@ class UserManager(_UserManagerBase, BaseManager):
         instance.save()
         return instance
 
+    def upsert_from_messages(
+            self, messages: Iterable[authn_pb2.Account]) -> None:
+        """Bulk version of ``create_or_update_from_message()``."""
+        messages = collapse(messages, key=lambda message: message.user.id)
+        self.bulk_create(
+            [
+                self.model(
+                    pk=message.user.id,
+                    subid=message.user.subid,
+                    is_active=message.user.is_active,
+                    name=message.profile.name)
+                for message in messages
+            ],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["subid", "is_active", "name"])
+
     def update_active_flag_from_message(
             self, message: authn_pb2.UserActiveFlag) -> int:
         return self.filter(
@@ -125,6 +144,34 @@ class UserManager(_UserManagerBase, BaseManager):
             name=message.name
         )
 
+    def update_active_flag_from_messages(
+            self, messages: Iterable[authn_pb2.UserActiveFlag]) -> int:
+        """Bulk version of ``update_active_flag_from_message()``."""
+        messages = collapse(messages, key=lambda message: message.user_id)
+        updated = 0
+        for is_active in (True, False):
+            if user_ids := [
+                    message.user_id for message in messages
+                    if message.is_active is is_active]:
+                updated += self.filter(
+                    pk__in=user_ids
+                ).update(
+                    is_active=is_active
+                )
+        return updated
+
+    def update_profile_from_messages(
+            self, messages: Iterable[authn_pb2.UserProfile]) -> int:
+        """Bulk version of ``update_profile_from_message()``."""
+        messages = collapse(messages, key=lambda message: message.user_id)
+        # bulk_update skips users that do not exist, same as update()
+        return self.bulk_update(
+            [
+                self.model(pk=message.user_id, name=message.name)
+                for message in messages
+            ],
+            ["name"])
+
     def get_and_update_profile_from_message(
             self, message: authn_pb2.UserProfile) -> User:
         """
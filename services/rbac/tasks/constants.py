@@ -25,6 +25,10 @@ ROUTING_CONSUME_TENANT_USER_DELETE = (
     f"{constants.ROUTING_TENANT_USER_PUBLISH_PREFIX}.delete")
 TASK_CONSUME_TENANT_USER_DELETE = constants.TASK_CONSUME_TENANT_USER_DELETE
 
+# micro-batches of the consume queue
+CONSUME_BATCH_SIZE = 100
+CONSUME_BATCH_INTERVAL = 0.5  # seconds
+
 
 EXCHANGE = constants.EXCHANGE_RBAC
 
@@ -15,6 +15,10 @@ ROUTING_CONSUME_AUTH_PROFILE_UPDATE = (
     f"{constants.ROUTING_AUTH_PROFILE_PUBLISH_PREFIX}.update")
 TASK_CONSUME_AUTH_PROFILE_UPDATE = constants.TASK_CONSUME_AUTH_PROFILE_UPDATE
 
+# micro-batches of the consume queue
+CONSUME_BATCH_SIZE = 100
+CONSUME_BATCH_INTERVAL = 0.5  # seconds
+
 
 EXCHANGE = constants.EXCHANGE_TENANT
 
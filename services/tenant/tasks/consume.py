@@ -6,12 +6,13 @@ import logging
 from celery import current_app as celery_app
 
 from idvalid_integration.protos.models import authn_pb2
+from idvalid_integration.tasks.batches import BatchTask, decode_messages
 
 from tenant.models import User
 from tenant.tasks import constants
 
 if TYPE_CHECKING:
-    pass
+    from idvalid_integration.tasks.batches import BatchRequest
 
 
 logger = logging.getLogger(__name__)
@@ -23,27 +24,39 @@ __all__ = (
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_AUTH_ACCOUNT_CREATE,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_auth_account_create_task(message: bytes):
-    message = authn_pb2.Account.FromString(message)
-    User.objects.create_or_update_from_message(message)
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_auth_account_create_task(requests: list[BatchRequest]):
+    User.objects.upsert_from_messages(
+        decode_messages(requests, authn_pb2.Account))
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_AUTH_USER_ACTIVE_FLAG,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_auth_user_active_flag_task(message: bytes):
-    message = authn_pb2.UserActiveFlag.FromString(message)
-    User.objects.update_active_flag_from_message(message)
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_auth_user_active_flag_task(requests: list[BatchRequest]):
+    User.objects.update_active_flag_from_messages(
+        decode_messages(requests, authn_pb2.UserActiveFlag))
 
 
 @celery_app.task(
+    base=BatchTask,
     name=constants.TASK_CONSUME_AUTH_PROFILE_UPDATE,
     queue=constants.QUEUE_CONSUME,
-    shared=False)
-def consume_auth_profile_update_task(message: bytes):
-    message = authn_pb2.UserProfile.FromString(message)
-    User.objects.update_profile_from_message(message)
+    shared=False,
+    batch_group=constants.QUEUE_CONSUME,
+    flush_every=constants.CONSUME_BATCH_SIZE,
+    flush_interval=constants.CONSUME_BATCH_INTERVAL)
+def consume_auth_profile_update_task(requests: list[BatchRequest]):
+    User.objects.update_profile_from_messages(
+        decode_messages(requests, authn_pb2.UserProfile))